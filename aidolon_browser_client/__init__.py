@@ -1,13 +1,72 @@
 """ A client library for accessing Aidolon Browser """
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .client import AuthenticatedClient, Client
-from .browser import BrowserSession, create_session
-from .sessions import list_all_sessions, close_all_sessions
+
+if TYPE_CHECKING:
+    from .browser import BrowserSession, create_session, AsyncBrowserSession, create_async_session
+    from .sessions import list_all_sessions, close_all_sessions
+    from .shared import (
+        get_shared_client,
+        get_shared_async_client,
+        set_shared_client,
+        close_shared_clients,
+        aclose_shared_clients,
+    )
+    from ._dates import set_lazy_timestamps
+    from .log import enable_verbose_logging, disable_verbose_logging
+
+# Names imported from their module on first access, so ``import aidolon_browser_client`` stays cheap
+_LAZY = {
+    "BrowserSession": ".browser",
+    "create_session": ".browser",
+    "AsyncBrowserSession": ".browser",
+    "create_async_session": ".browser",
+    "list_all_sessions": ".sessions",
+    "close_all_sessions": ".sessions",
+    "get_shared_client": ".shared",
+    "get_shared_async_client": ".shared",
+    "set_shared_client": ".shared",
+    "close_shared_clients": ".shared",
+    "aclose_shared_clients": ".shared",
+    "set_lazy_timestamps": "._dates",
+    "enable_verbose_logging": ".log",
+    "disable_verbose_logging": ".log",
+}
+
+_SUBPACKAGES = ("api", "browser", "mock", "models", "sessions")
 
 __all__ = (
     "AuthenticatedClient",
     "Client",
     "BrowserSession",
     "create_session",
+    "AsyncBrowserSession",
+    "create_async_session",
     "list_all_sessions",
     "close_all_sessions",
-)
\ No newline at end of file
+    "get_shared_client",
+    "get_shared_async_client",
+    "set_shared_client",
+    "close_shared_clients",
+    "aclose_shared_clients",
+    "set_lazy_timestamps",
+    "enable_verbose_logging",
+    "disable_verbose_logging",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBPACKAGES:
+        return import_module(f".{name}", __name__)
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
@@ -0,0 +1,51 @@
+""" Chunked decoding of large base64 payloads embedded in JSON responses """
+
+import binascii
+import os
+from typing import BinaryIO, Union
+
+# Must be a multiple of 4 so every chunk holds whole base64 quanta
+DEFAULT_CHUNK_CHARS = 64 * 1024
+
+
+def decode(value: str) -> bytes:
+    """Decode a base64 string to bytes"""
+    return binascii.a2b_base64(value)
+
+
+def decode_view(value: str) -> memoryview:
+    """Decode a base64 string to a read-only memoryview, which can be sliced without copying"""
+    return memoryview(decode(value))
+
+
+def decode_to(value: str, destination: Union[str, "os.PathLike[str]", BinaryIO], chunk_chars: int = DEFAULT_CHUNK_CHARS) -> int:
+    """Decode a base64 string straight into a file, one chunk at a time.
+
+    Only one chunk of encoded and decoded data is held in memory besides ``value`` itself.
+
+    Args:
+        value: The base64 encoded payload.
+        destination: File path, or a binary file-like object that is written to and left open.
+        chunk_chars: Number of base64 characters decoded per write, rounded down to a multiple of 4.
+
+    Returns:
+        Number of bytes written.
+    """
+    if "\n" in value or "\r" in value or " " in value:
+        # Line breaks would shift chunk boundaries off the 4 character quanta
+        value = "".join(value.split())
+    chunk_chars = max(4, chunk_chars - chunk_chars % 4)
+
+    if hasattr(destination, "write"):
+        return _write_chunks(value, destination, chunk_chars)
+    with open(destination, "wb") as file:
+        return _write_chunks(value, file, chunk_chars)
+
+
+def _write_chunks(value: str, file: BinaryIO, chunk_chars: int) -> int:
+    written = 0
+    for start in range(0, len(value), chunk_chars):
+        chunk = binascii.a2b_base64(value[start:start + chunk_chars])
+        file.write(chunk)
+        written += len(chunk)
+    return written
@@ -0,0 +1,111 @@
+""" Timestamp parsing shared by the models
+
+``isoparse`` tries ``datetime.fromisoformat`` first and only imports dateutil for strings it rejects.
+With ``set_lazy_timestamps(True)`` the models keep timestamps as strings when decoding and parse each
+one the first time its attribute is read.
+"""
+
+import datetime
+import sys
+from typing import Any, Callable, Optional, Union
+
+_dateutil_isoparse: Optional[Callable[[str], datetime.datetime]] = None
+
+# Before 3.11, fromisoformat only reads the format isoformat() writes and has no "Z" suffix
+_NATIVE_Z = sys.version_info >= (3, 11)
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+_lazy = False
+
+
+def isoparse(value: str) -> datetime.datetime:
+    """Parse an ISO-8601 timestamp, giving the same instant as ``dateutil.parser.isoparse``
+
+    Offsets are returned as ``datetime.timezone`` instances, also when dateutil is used.
+    """
+    try:
+        if not _NATIVE_Z and value[-1:] == "Z":
+            return datetime.datetime.fromisoformat(value[:-1]).replace(tzinfo=datetime.timezone.utc)
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    global _dateutil_isoparse
+    if _dateutil_isoparse is None:
+        from dateutil.parser import isoparse as _dateutil_isoparse
+    parsed = _dateutil_isoparse(value)
+    offset = parsed.utcoffset()
+    if offset is None:
+        return parsed
+    return parsed.replace(tzinfo=datetime.timezone.utc if not offset else datetime.timezone(offset))
+
+
+def epoch_us(value: str) -> int:
+    """Microseconds since the Unix epoch for an ISO-8601 timestamp, reading timestamps without an offset as UTC"""
+    parsed = isoparse(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return (parsed - _EPOCH) // _MICROSECOND
+
+
+def set_lazy_timestamps(enabled: bool) -> None:
+    """Choose whether models decoded from now on parse their timestamps on first access instead of in from_dict
+
+    Lazy parsing saves the parsing time for timestamps that are never read, e.g. when listing many sessions
+    to look at their ids. Invalid timestamps then raise ``ValueError`` when their attribute is read rather
+    than when the response is decoded.
+    """
+    global _lazy
+    _lazy = enabled
+
+
+class _Unparsed(str):
+    """A timestamp string stored in a model attribute until the attribute is first read"""
+
+    __slots__ = ()
+
+
+def timestamp(value: str) -> Union[datetime.datetime, str]:
+    """Parse ``value`` for a model, or defer it when lazy timestamps are enabled"""
+    if _lazy and isinstance(value, str):
+        return _Unparsed(value)
+    return isoparse(value)
+
+
+class _LazyTimestamp:
+    """Wraps a slotted model attribute so a deferred timestamp is parsed and stored on first read"""
+
+    def __init__(self, slot: Any, lenient: bool):
+        self._slot = slot
+        self._lenient = lenient
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        value = self._slot.__get__(instance, owner)
+        if type(value) is _Unparsed:
+            try:
+                value = isoparse(value)
+            except ValueError:
+                if not self._lenient:
+                    raise
+                value = str(value)
+            self._slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self._slot.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self._slot.__delete__(instance)
+
+
+def lazy_timestamp_fields(cls: type, *names: str, lenient: tuple[str, ...] = ()) -> None:
+    """Let the timestamp attributes ``names`` of a slotted model class hold deferred values from ``timestamp()``
+
+    Attributes in ``lenient`` keep the raw string when it cannot be parsed, like the generated code does for
+    ``Union[datetime, str]`` fields; the others raise ``ValueError``.
+    """
+    for name in names:
+        setattr(cls, name, _LazyTimestamp(cls.__dict__[name], name in lenient))
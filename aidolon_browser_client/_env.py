@@ -0,0 +1,21 @@
+""" Environment variables, with the ``.env`` file loaded on first use instead of at import time """
+
+import os
+from typing import Optional
+
+_loaded = False
+
+
+def load() -> None:
+    """Load the ``.env`` file into ``os.environ`` once, without overriding variables that are already set"""
+    global _loaded
+    if not _loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _loaded = True
+
+
+def getenv(name: str, default: Optional[str] = None) -> Optional[str]:
+    load()
+    return os.getenv(name, default)
@@ -1 +1,23 @@
-""" Contains methods for accessing the API """
+""" Contains methods for accessing the API
+
+The endpoint groups are imported on first access, e.g. ``api.session_management``.
+"""
+
+from importlib import import_module
+from types import ModuleType
+
+__all__ = (
+    "browser_actions",
+    "content_extraction",
+    "session_management",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1 +1,25 @@
-""" Contains endpoint functions for accessing the API """
+""" Contains endpoint functions for accessing the API
+
+Endpoint modules are imported on first access, e.g. ``browser_actions.click_element``.
+"""
+
+from importlib import import_module
+from types import ModuleType
+
+__all__ = (
+    "click_element",
+    "drag_and_drop",
+    "navigate_browser",
+    "press_key",
+    "type_text",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,8 +4,9 @@ from typing import Any, Optional, Union, cast
 import httpx
 
 from ...client import AuthenticatedClient, Client
-from ...types import Response, UNSET
+from ...types import Response, UNSET, raw_content
 from ... import errors
+from ...codec import JSONCodec
 
 from ...models.error import Error
 from ...models.press_key_body import PressKeyBody
@@ -19,6 +20,7 @@ def _get_kwargs(
     session_id: UUID,
     *,
     body: PressKeyBody,
+    json_codec: JSONCodec,
 
 ) -> dict[str, Any]:
     headers: dict[str, Any] = {}
@@ -36,7 +38,7 @@ def _get_kwargs(
     _body = body.to_dict()
 
 
-    _kwargs["json"] = _body
+    _kwargs["content"] = json_codec.encode(_body)
     headers["Content-Type"] = "application/json"
 
     _kwargs["headers"] = headers
@@ -45,31 +47,31 @@ def _get_kwargs(
 
 def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Union[Error, PressKeyResponse200]]:
     if response.status_code == 200:
-        response_200 = PressKeyResponse200.from_dict(response.json())
+        response_200 = PressKeyResponse200.from_dict(client.json_codec.decode(response.content))
 
 
 
         return response_200
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(client.json_codec.decode(response.content))
 
 
 
         return response_400
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.decode(response.content))
 
 
 
         return response_401
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(client.json_codec.decode(response.content))
 
 
 
         return response_404
     if response.status_code == 500:
-        response_500 = Error.from_dict(response.json())
+        response_500 = Error.from_dict(client.json_codec.decode(response.content))
 
 
 
@@ -81,11 +83,12 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
 
 
 def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Union[Error, PressKeyResponse200]]:
+    parsed = _parse_response(client=client, response=response)
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=raw_content(client, response, parsed),
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=parsed,
     )
 
 
@@ -116,6 +119,7 @@ def sync_detailed(
     kwargs = _get_kwargs(
         session_id=session_id,
 body=body,
+json_codec=client.json_codec,
 
     )
 
@@ -183,6 +187,7 @@ async def asyncio_detailed(
     kwargs = _get_kwargs(
         session_id=session_id,
 body=body,
+json_codec=client.json_codec,
 
     )
 
@@ -1 +1,24 @@
-""" Contains endpoint functions for accessing the API """
+""" Contains endpoint functions for accessing the API
+
+Endpoint modules are imported on first access, e.g. ``content_extraction.generate_pdf``.
+"""
+
+from importlib import import_module
+from types import ModuleType
+
+__all__ = (
+    "generate_pdf",
+    "scrape_information",
+    "scrape_page",
+    "take_screenshot",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
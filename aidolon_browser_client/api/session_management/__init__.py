@@ -1 +1,27 @@
-""" Contains endpoint functions for accessing the API """
+""" Contains endpoint functions for accessing the API
+
+Endpoint modules are imported on first access, e.g. ``session_management.close_all_browser_sessions``.
+"""
+
+from importlib import import_module
+from types import ModuleType
+
+__all__ = (
+    "close_all_browser_sessions",
+    "close_browser_session",
+    "create_browser_session",
+    "get_browser_context",
+    "get_session_status",
+    "list_browser_sessions",
+    "update_session_timeout",
+)
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
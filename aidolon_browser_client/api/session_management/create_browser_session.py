@@ -4,8 +4,9 @@ from typing import Any, Optional, Union, cast
 import httpx
 
 from ...client import AuthenticatedClient, Client
-from ...types import Response, UNSET
+from ...types import Response, UNSET, raw_content
 from ... import errors
+from ...codec import JSONCodec
 
 from ...models.create_browser_session_body import CreateBrowserSessionBody
 from ...models.create_browser_session_response_200 import CreateBrowserSessionResponse200
@@ -18,6 +19,7 @@ from typing import cast
 def _get_kwargs(
     *,
     body: CreateBrowserSessionBody,
+    json_codec: JSONCodec,
 
 ) -> dict[str, Any]:
     headers: dict[str, Any] = {}
@@ -35,7 +37,7 @@ def _get_kwargs(
     _body = body.to_dict()
 
 
-    _kwargs["json"] = _body
+    _kwargs["content"] = json_codec.encode(_body)
     headers["Content-Type"] = "application/json"
 
     _kwargs["headers"] = headers
@@ -44,25 +46,25 @@ def _get_kwargs(
 
 def _parse_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Optional[Union[CreateBrowserSessionResponse200, CreateBrowserSessionResponse402, Error]]:
     if response.status_code == 200:
-        response_200 = CreateBrowserSessionResponse200.from_dict(response.json())
+        response_200 = CreateBrowserSessionResponse200.from_dict(client.json_codec.decode(response.content))
 
 
 
         return response_200
     if response.status_code == 401:
-        response_401 = Error.from_dict(response.json())
+        response_401 = Error.from_dict(client.json_codec.decode(response.content))
 
 
 
         return response_401
     if response.status_code == 402:
-        response_402 = CreateBrowserSessionResponse402.from_dict(response.json())
+        response_402 = CreateBrowserSessionResponse402.from_dict(client.json_codec.decode(response.content))
 
 
 
         return response_402
     if response.status_code == 500:
-        response_500 = Error.from_dict(response.json())
+        response_500 = Error.from_dict(client.json_codec.decode(response.content))
 
 
 
@@ -74,11 +76,12 @@ def _parse_response(*, client: Union[AuthenticatedClient, Client], response: htt
 
 
 def _build_response(*, client: Union[AuthenticatedClient, Client], response: httpx.Response) -> Response[Union[CreateBrowserSessionResponse200, CreateBrowserSessionResponse402, Error]]:
+    parsed = _parse_response(client=client, response=response)
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=raw_content(client, response, parsed),
         headers=response.headers,
-        parsed=_parse_response(client=client, response=response),
+        parsed=parsed,
     )
 
 
@@ -107,6 +110,7 @@ def sync_detailed(
 
     kwargs = _get_kwargs(
         body=body,
+json_codec=client.json_codec,
 
     )
 
@@ -170,6 +174,7 @@ async def asyncio_detailed(
 
     kwargs = _get_kwargs(
         body=body,
+json_codec=client.json_codec,
 
     )
 
@@ -1,3 +1,20 @@
 from .browser_session import BrowserSession, create_session
+from .async_browser_session import AsyncBrowserSession, create_async_session
+from .pipeline import ActionBatch, BatchResult, StepResult
+from .session_pool import SessionPool, AsyncSessionPool
+from .fan_out import ItemResult, run_many, map_sessions
 
-__all__ = ["BrowserSession", "create_session"]
\ No newline at end of file
+__all__ = [
+    "BrowserSession",
+    "create_session",
+    "AsyncBrowserSession",
+    "create_async_session",
+    "ActionBatch",
+    "BatchResult",
+    "StepResult",
+    "SessionPool",
+    "AsyncSessionPool",
+    "ItemResult",
+    "run_many",
+    "map_sessions",
+]
@@ -0,0 +1,109 @@
+import os
+from typing import BinaryIO, Optional, Union
+
+import httpx
+
+from aidolon_browser_client.client import AuthenticatedClient, Client
+
+Destination = Union[str, "os.PathLike[str]", BinaryIO]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def _artifact_url(response, field: str) -> str:
+    """Return ``response.data.<field>`` from a take_screenshot/generate_pdf result, raising if it is missing"""
+    url = getattr(getattr(response, "data", None), field, None)
+    if not isinstance(url, str) or not url:
+        raise Exception(f"Response does not contain a {field}: {response!r}")
+    return url
+
+
+def _origin(url: httpx.URL) -> tuple:
+    # httpx leaves the port of a URL with its scheme's default port as None
+    return url.scheme, url.host, url.port
+
+
+def _build_request(client: Union[AuthenticatedClient, Client], httpx_client, url: str) -> httpx.Request:
+    """Build a GET for an artifact URL, without the API key unless the artifact has the API's scheme, host and port"""
+    request = httpx_client.build_request("GET", url)
+    auth_header_name: Optional[str] = getattr(client, "auth_header_name", None)
+    if auth_header_name and _origin(request.url) != _origin(httpx_client.base_url):
+        request.headers.pop(auth_header_name, None)
+    return request
+
+
+def _open(destination: Destination):
+    """Return (file object, path to remove on failure) for a path or an already open binary file"""
+    if hasattr(destination, "write"):
+        return destination, None
+    return open(destination, "wb"), destination
+
+
+def download(client: Union[AuthenticatedClient, Client], url: str, destination: Destination,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Stream ``url`` to a file through the client's connection pool, one chunk at a time.
+
+    Args:
+        client: Client whose pooled ``httpx.Client`` is used for the download.
+        url: Absolute URL, or path relative to the client's base URL.
+        destination: File path, or a binary file-like object that is written to and left open.
+        chunk_size: Size in bytes of the chunks read from the network.
+
+    Raises:
+        httpx.HTTPStatusError: If the artifact could not be fetched. A partially written file at a
+            destination path is removed.
+
+    Returns:
+        Number of bytes written.
+    """
+    httpx_client = client.get_httpx_client()
+    file, path = _open(destination)
+    written = 0
+    try:
+        response = httpx_client.send(_build_request(client, httpx_client, url), stream=True)
+        try:
+            response.raise_for_status()
+            for chunk in response.iter_bytes(chunk_size):
+                file.write(chunk)
+                written += len(chunk)
+        finally:
+            response.close()
+    except BaseException:
+        if path is not None:
+            file.close()
+            os.remove(path)
+        raise
+    if path is not None:
+        file.close()
+    return written
+
+
+async def download_async(client: Union[AuthenticatedClient, Client], url: str, destination: Destination,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Async counterpart of ``download`` using the client's ``httpx.AsyncClient``.
+
+    File writes are synchronous; each one is a single chunk so the event loop is only held briefly.
+
+    Returns:
+        Number of bytes written.
+    """
+    httpx_client = client.get_async_httpx_client()
+    file, path = _open(destination)
+    written = 0
+    try:
+        response = await httpx_client.send(_build_request(client, httpx_client, url), stream=True)
+        try:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                file.write(chunk)
+                written += len(chunk)
+        finally:
+            await response.aclose()
+    except BaseException:
+        if path is not None:
+            file.close()
+            os.remove(path)
+        raise
+    if path is not None:
+        file.close()
+    return written
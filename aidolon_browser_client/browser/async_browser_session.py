@@ -0,0 +1,439 @@
+import time
+from typing import Optional, List, Dict, Any
+
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.log import log_action, log_skipped
+from aidolon_browser_client.shared import get_shared_async_client
+from aidolon_browser_client.tracing import action_span, end_session_span, record_response, start_session_span
+from aidolon_browser_client.api.session_management import (
+    create_browser_session,
+    close_browser_session,
+    get_session_status,
+    get_browser_context
+)
+from aidolon_browser_client.api.browser_actions import (
+    click_element,
+    type_text,
+    navigate_browser,
+    press_key,
+    drag_and_drop
+)
+from aidolon_browser_client.api.content_extraction import (
+    take_screenshot,
+    scrape_information,
+    scrape_page,
+    generate_pdf
+)
+from aidolon_browser_client.models import (
+    TypeTextBody,
+    NavigateBrowserBody,
+    DragAndDropBody,
+    TakeScreenshotBody,
+    GeneratePdfBody,
+)
+from .artifacts import download_async, _artifact_url
+from .browser_session import (
+    _session_body,
+    _apply_created_session,
+    _click_body,
+    _press_body,
+    _scrape_information_body,
+    _scrape_page_body,
+)
+
+
+class AsyncBrowserSession:
+
+    """
+    An asyncio-native browser session for interacting with the Aidolon API.
+
+    Every action awaits the ``asyncio`` variant of its endpoint, so many sessions can be
+    driven from a single event loop without a thread per in-flight request. Sessions that
+    are given the same ``client``, or no client on the same event loop, share its underlying
+    ``httpx.AsyncClient``.
+
+    Attributes:
+        client (Optional[AuthenticatedClient]): The API client used for requests, None until ``start()``
+            when no client was given.
+        session_id (Optional[str]): The unique identifier for the session.
+        live_viewer_url (Optional[str]): URL for the live session viewer.
+        dimensions (Optional[tuple]): Dimensions of the session display.
+        user_agent (Optional[str]): The browser user agent used.
+        timeout (int): Timeout for the session in seconds.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://api.aidolon.com", context: Optional[Dict[str, Any]] = None, timeout: int = 300, client: Optional[AuthenticatedClient] = None):
+        """Prepare a browser session. The remote session is created by ``start()``.
+
+        Args:
+            api_key: API key for Aidolon. If None, will try to get from environment variable.
+            base_url: Base URL for Aidolon API.
+            context: Optional browser context dictionary (cookies, localStorage, sessionStorage, userAgent).
+            timeout: Session timeout in seconds. Default is 300 seconds (5 minutes).
+            client: Optional client to send requests with. If None, ``start()`` uses the shared client of
+                the running event loop for ``base_url`` and ``api_key``, so sessions reuse one connection pool.
+        """
+        self.client = client
+        self._api_key = api_key
+        self._base_url = base_url
+        self._context = context
+        self._session_timeout = timeout
+        self.session_id = None
+        self.live_viewer_url = None
+        self.dimensions = None
+        self.user_agent = None
+        self.timeout = None
+        self._span = None
+
+    async def start(self) -> "AsyncBrowserSession":
+        """Create the remote browser session.
+
+        Returns:
+            This session, to allow ``session = await AsyncBrowserSession().start()``.
+        """
+        if self.client is None:
+            self.client = get_shared_async_client(self._base_url, self._api_key)
+        self._span = start_session_span(self.client)
+        started = time.perf_counter()
+        try:
+            with action_span(self._span, "create", None) as span:
+                response = await create_browser_session.asyncio(
+                    client=self.client,
+                    body=_session_body(self._context, self._session_timeout)
+                )
+                record_response(span, response)
+            _apply_created_session(self, response)
+        except BaseException:
+            end_session_span(self._span)
+            self._span = None
+            raise
+        log_action("create", self.session_id, started, response)
+        return self
+
+    def _require_session(self) -> None:
+        if not self.session_id:
+            raise Exception("No active browser session.")
+
+    async def click(self, selector: str, wait: str = "auto"):
+        """Click on an element in the browser.
+
+        Args:
+            selector: CSS selector, XPath, or natural language description.
+            wait: Wait strategy ("auto", "navigation", "load", "domcontentloaded", "networkidle").
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "click", self.session_id) as span:
+            response = await click_element.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=_click_body(selector, wait)
+            )
+            record_response(span, response)
+
+        log_action("click", self.session_id, started, response)
+        return response
+
+    async def navigate(self, url: str):
+        """Navigate to a specific URL.
+
+        Args:
+            url: URL to navigate to.
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "navigate", self.session_id) as span:
+            response = await navigate_browser.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=NavigateBrowserBody(url=url)
+            )
+            record_response(span, response)
+
+        log_action("navigate", self.session_id, started, response, url=url)
+        return response
+
+    async def type(self, selector: str, text: str):
+        """Type text into an element.
+
+        Args:
+            selector: CSS selector, XPath, or natural language description.
+            text: Text to type.
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "type", self.session_id) as span:
+            response = await type_text.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=TypeTextBody(selector=selector, text=text)
+            )
+            record_response(span, response)
+
+        log_action("type", self.session_id, started, response)
+        return response
+
+    async def press(self, selector: str, key: str, wait: str = "auto"):
+        """Press a key on an element.
+
+        Args:
+            selector: CSS selector, XPath, or natural language description.
+            key: Key to press (e.g., "Enter", "Tab").
+            wait: Wait strategy ("auto", "navigation", "network", "none").
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "press", self.session_id) as span:
+            response = await press_key.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=_press_body(selector, key, wait)
+            )
+            record_response(span, response)
+
+        log_action("press", self.session_id, started, response, key=key)
+        return response
+
+    async def drag_and_drop(self, source_selector: str, target_selector: str):
+        """Drag and drop an element to a target location.
+
+        Args:
+            source_selector: CSS selector, XPath, or natural language description of the element to drag.
+            target_selector: CSS selector, XPath, or natural language description of the drop target.
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "drag_and_drop", self.session_id) as span:
+            response = await drag_and_drop.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=DragAndDropBody(source_selector=source_selector, target_selector=target_selector)
+            )
+            record_response(span, response)
+
+        log_action("drag_and_drop", self.session_id, started, response)
+        return response
+
+    async def take_screenshot(self, full_page: bool = True):
+        """Take a screenshot of the current page.
+
+        Args:
+            full_page: Whether to capture the full page or just the viewport.
+
+        Returns:
+            Response containing url of captured image.
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "take_screenshot", self.session_id) as span:
+            response = await take_screenshot.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=TakeScreenshotBody(full_page=full_page)
+            )
+            record_response(span, response)
+
+        log_action("take_screenshot", self.session_id, started, response)
+        return response
+
+    async def scrape_information(self, description: str, level_of_detail: str = "full"):
+        """Scrape specific information from the page based on a description.
+
+        Args:
+            description: Description of what information to extract.
+            level_of_detail: Level of detail to include ("basic", "standard", "full").
+
+        Returns:
+            Response containing structured data from the page.
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "scrape_information", self.session_id) as span:
+            response = await scrape_information.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=_scrape_information_body(description, level_of_detail)
+            )
+            record_response(span, response)
+
+        log_action("scrape_information", self.session_id, started, response)
+        return response
+
+    async def scrape_page(self, format: List[str] = None, delay: float = 0,
+                          screenshot: bool = False, pdf: bool = False):
+        """Scrape the entire page content in various formats.
+
+        Args:
+            format: List of formats to return (e.g., ["html", "text", "json", "markdown"]).
+            delay: Delay in seconds before scraping.
+            screenshot: Whether to include a screenshot.
+            pdf: Whether to include a PDF version.
+
+        Returns:
+            Response containing the page content in the requested formats.
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "scrape_page", self.session_id) as span:
+            response = await scrape_page.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=_scrape_page_body(format, delay, screenshot, pdf)
+            )
+            record_response(span, response)
+
+        log_action("scrape_page", self.session_id, started, response)
+        return response
+
+    async def generate_pdf(self, delay: float = 0):
+        """Generate a PDF of the current page.
+
+        Args:
+            delay: Delay in seconds before generating the PDF.
+
+        Returns:
+            Response containing url of PDF.
+        """
+        self._require_session()
+
+        started = time.perf_counter()
+        with action_span(self._span, "generate_pdf", self.session_id) as span:
+            response = await generate_pdf.asyncio(
+                client=self.client,
+                session_id=self.session_id,
+                body=GeneratePdfBody(delay=delay)
+            )
+            record_response(span, response)
+
+        log_action("generate_pdf", self.session_id, started, response)
+        return response
+
+    async def save_screenshot(self, destination, full_page: bool = True):
+        """Take a screenshot and stream the image to a file without holding it in memory.
+
+        Args:
+            destination: File path, or a binary file-like object to write the image to.
+            full_page: Whether to capture the full page or just the viewport.
+
+        Returns:
+            Response of the screenshot request, containing the url of the captured image.
+        """
+        response = await self.take_screenshot(full_page=full_page)
+        with action_span(self._span, "download", self.session_id):
+            await download_async(self.client, _artifact_url(response, "screenshot_url"), destination)
+        return response
+
+    async def save_pdf(self, destination, delay: float = 0):
+        """Generate a PDF of the current page and stream it to a file without holding it in memory.
+
+        Args:
+            destination: File path, or a binary file-like object to write the PDF to.
+            delay: Delay in seconds before generating the PDF.
+
+        Returns:
+            Response of the PDF request, containing the url of the PDF.
+        """
+        response = await self.generate_pdf(delay=delay)
+        with action_span(self._span, "download", self.session_id):
+            await download_async(self.client, _artifact_url(response, "pdf_url"), destination)
+        return response
+
+    def pipeline(self):
+        """Start an ActionBatch that sends a sequence of actions back to back.
+
+        Returns:
+            An empty ActionBatch bound to this session; record actions on it and call ``await batch.run_async()``.
+        """
+        from .pipeline import ActionBatch
+
+        return ActionBatch(self)
+
+    async def get_details(self):
+        """Retrieve the latest session details from the remote API."""
+        self._require_session()
+
+        with action_span(self._span, "get_details", self.session_id) as span:
+            response = await get_session_status.asyncio(
+                client=self.client,
+                session_id=self.session_id
+            )
+            record_response(span, response)
+        return response
+
+    async def get_status(self) -> str:
+        """Get the current status of the browser session.
+
+        Returns:
+            Status string.
+        """
+        details = await self.get_details()
+
+        return details.status if hasattr(details, 'status') else 'unknown'
+
+    async def get_context(self):
+        """Retrieve the browser context data from the remote API."""
+        self._require_session()
+
+        with action_span(self._span, "get_context", self.session_id) as span:
+            response = await get_browser_context.asyncio(
+                client=self.client,
+                session_id=self.session_id
+            )
+            record_response(span, response)
+
+        return response.context if hasattr(response, 'context') else response
+
+    async def close_session(self):
+        """Close the remote browser session."""
+        if not self.session_id:
+            log_skipped("close", None)
+            return
+
+        started = time.perf_counter()
+        with action_span(self._span, "close", self.session_id) as span:
+            response = await close_browser_session.asyncio(
+                client=self.client,
+                session_id=self.session_id
+            )
+            record_response(span, response)
+
+        log_action("close", self.session_id, started, response)
+        end_session_span(self._span, self.session_id)
+        self._span = None
+        self.session_id = None
+        return response
+
+    async def __aenter__(self):
+        """Start the session if needed and return it for use inside the async with block."""
+        if not self.session_id:
+            await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Close the session."""
+        await self.close_session()
+
+
+async def create_async_session(api_key: Optional[str] = None, base_url: str = "https://api.aidolon.com", context: Optional[Dict[str, Any]] = None, timeout: int = 300, client: Optional[AuthenticatedClient] = None):
+    """Create and start a new asyncio browser session.
+
+    Args:
+        api_key: API key for Aidolon. If None, will try to get from environment variable.
+        base_url: Base URL for Aidolon API.
+        context: Optional browser context dictionary (cookies, localStorage, sessionStorage, userAgent).
+        timeout: Session timeout in seconds. Default is 300 seconds (5 minutes).
+        client: Optional client to share between sessions.
+
+    Returns:
+        AsyncBrowserSession object with an active remote session.
+    """
+    session = AsyncBrowserSession(api_key=api_key, base_url=base_url, context=context, timeout=timeout, client=client)
+    return await session.start()
@@ -1,7 +1,11 @@
+import time
 from uuid import UUID
 from typing import Optional, Union, List, Dict, Any
 
 from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.log import log_action, log_skipped
+from aidolon_browser_client.tracing import action_span, end_session_span, record_response, start_session_span
+from aidolon_browser_client.shared import get_shared_client
 from aidolon_browser_client.api.session_management import (
     create_browser_session,
     close_browser_session,
@@ -39,6 +43,81 @@ from aidolon_browser_client.models import (
     BrowserContext
 )
 from aidolon_browser_client.models.error import Error
+from .artifacts import download, _artifact_url
+
+
+def _session_body(context: Optional[Dict[str, Any]], timeout: int) -> CreateBrowserSessionBody:
+    """Build the request body for creating a session, with context if provided."""
+    if context is not None:
+        return CreateBrowserSessionBody(
+            visible=True,
+            timeout=timeout,
+            context=BrowserContext.from_dict(context)
+        )
+    return CreateBrowserSessionBody(
+        visible=True,
+        timeout=timeout
+    )
+
+
+def _apply_created_session(session, response) -> None:
+    """Copy the details of a create_browser_session response onto a session object."""
+    if not hasattr(response, 'session_id'):
+        raise Exception("Failed to create browser session.")
+
+    session.session_id = response.session_id
+    session.live_viewer_url = response.embed_url if hasattr(response, 'embed_url') else None
+
+    if hasattr(response, 'live_session'):
+        live_session = response.live_session
+        session.dimensions = live_session.dimensions if hasattr(live_session, 'dimensions') else None
+        session.user_agent = live_session.user_agent if hasattr(live_session, 'user_agent') else None
+        session.timeout = live_session.timeout if hasattr(live_session, 'timeout') else None
+
+
+def _click_body(selector: str, wait: str) -> ClickElementBody:
+    wait_enum = getattr(ClickElementBodyWait, wait.upper(), ClickElementBodyWait.AUTO)
+    return ClickElementBody(
+        selector=selector,
+        wait=wait_enum
+    )
+
+
+def _press_body(selector: str, key: str, wait: str) -> PressKeyBody:
+    wait_enum = getattr(PressKeyBodyWait, wait.upper(), PressKeyBodyWait.AUTO)
+    return PressKeyBody(
+        selector=selector,
+        key=key,
+        wait=wait_enum
+    )
+
+
+def _scrape_information_body(description: str, level_of_detail: str) -> ScrapeInformationBody:
+    detail_enum = getattr(ScrapeInformationBodyLevelOfDetail, level_of_detail.upper(),
+                          ScrapeInformationBodyLevelOfDetail.FULL)
+    return ScrapeInformationBody(
+        description=description,
+        level_of_detail=detail_enum
+    )
+
+
+def _scrape_page_body(format: Optional[List[str]], delay: float, screenshot: bool, pdf: bool) -> ScrapePageBody:
+    if format is None:
+        format = ["html", "text"]
+
+    format_enums = []
+    for fmt in format:
+        format_enum = getattr(ScrapePageBodyFormatItem, fmt.upper(), None)
+        if format_enum:
+            format_enums.append(format_enum)
+
+    return ScrapePageBody(
+        format_=format_enums,
+        delay=delay,
+        screenshot=screenshot,
+        pdf=pdf
+    )
+
 
 class BrowserSession:
 
@@ -54,7 +133,7 @@ class BrowserSession:
         timeout (int): Timeout for the session in seconds.
     """
     
-    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://api.aidolon.com", context: Optional[Dict[str, Any]] = None, timeout: int = 300):
+    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://api.aidolon.com", context: Optional[Dict[str, Any]] = None, timeout: int = 300, client: Optional[AuthenticatedClient] = None):
         """Initialize a browser session with Aidolon.
         
         Args:
@@ -62,46 +141,31 @@ class BrowserSession:
             base_url: Base URL for Aidolon API.
             context: Optional browser context dictionary (cookies, localStorage, sessionStorage, userAgent).
             timeout: Session timeout in seconds. Default is 300 seconds (5 minutes).
+            client: Optional client to send requests with. If None, the process-wide shared client for
+                ``base_url`` and ``api_key`` is used, so sessions reuse one connection pool.
         """
-        self.client = AuthenticatedClient(base_url=base_url, token=api_key) if api_key else AuthenticatedClient(base_url=base_url)
+        self.client = client if client is not None else get_shared_client(base_url, api_key)
         self.session_id = None
         self.live_viewer_url = None
         self.dimensions = None
         self.user_agent = None
         self.timeout = None
-        
-        # Create a browser session with context if provided
-        if context is not None:
-            browser_context = BrowserContext.from_dict(context)
-            session_body = CreateBrowserSessionBody(
-                visible=True,
-                timeout=timeout,
-                context=browser_context
-            )
-        else:
-            session_body = CreateBrowserSessionBody(
-                visible=True,
-                timeout=timeout
-            )
-        
-        response = create_browser_session.sync(
-            client=self.client,
-            body=session_body
-        )
-        
-        if hasattr(response, 'session_id'):
-            self.session_id = response.session_id
-            self.live_viewer_url = response.embed_url if hasattr(response, 'embed_url') else None
-            
-            if hasattr(response, 'live_session'):
-                live_session = response.live_session
-                self.dimensions = live_session.dimensions if hasattr(live_session, 'dimensions') else None
-                self.user_agent = live_session.user_agent if hasattr(live_session, 'user_agent') else None
-                self.timeout = live_session.timeout if hasattr(live_session, 'timeout') else None
-            
-            print("Browser session started.")
-        else:
-            raise Exception("Failed to create browser session.")
+        self._span = start_session_span(self.client)
+        
+        started = time.perf_counter()
+        try:
+            with action_span(self._span, "create", None) as span:
+                response = create_browser_session.sync(
+                    client=self.client,
+                    body=_session_body(context, timeout)
+                )
+                record_response(span, response)
+            _apply_created_session(self, response)
+        except BaseException:
+            end_session_span(self._span)
+            self._span = None
+            raise
+        log_action("create", self.session_id, started, response)
     
     def click(self, selector: str, wait: str = "auto"):
         """Click on an element in the browser.
@@ -113,20 +177,16 @@ class BrowserSession:
         if not self.session_id:
             raise Exception("No active browser session.")
             
-        wait_enum = getattr(ClickElementBodyWait, wait.upper(), ClickElementBodyWait.AUTO)
-        
-        click_body = ClickElementBody(
-            selector=selector,
-            wait=wait_enum
-        )
-        
-        response = click_element.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=click_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "click", self.session_id) as span:
+            response = click_element.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=_click_body(selector, wait)
+            )
+            record_response(span, response)
         
-        print("Browser clicked.")
+        log_action("click", self.session_id, started, response)
         return response
     
     def navigate(self, url: str):
@@ -140,13 +200,16 @@ class BrowserSession:
             
         navigate_body = NavigateBrowserBody(url=url)
         
-        response = navigate_browser.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=navigate_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "navigate", self.session_id) as span:
+            response = navigate_browser.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=navigate_body
+            )
+            record_response(span, response)
         
-        print(f"Navigated to {url}")
+        log_action("navigate", self.session_id, started, response, url=url)
         return response
     
     def type(self, selector: str, text: str):
@@ -164,13 +227,16 @@ class BrowserSession:
             text=text
         )
         
-        response = type_text.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=type_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "type", self.session_id) as span:
+            response = type_text.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=type_body
+            )
+            record_response(span, response)
         
-        print(f"Typed text: {text}")
+        log_action("type", self.session_id, started, response)
         return response
     
     def press(self, selector: str, key: str, wait: str = "auto"):
@@ -184,21 +250,16 @@ class BrowserSession:
         if not self.session_id:
             raise Exception("No active browser session.")
             
-        wait_enum = getattr(PressKeyBodyWait, wait.upper(), PressKeyBodyWait.AUTO)
-        
-        press_body = PressKeyBody(
-            selector=selector,
-            key=key,
-            wait=wait_enum
-        )
-        
-        response = press_key.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=press_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "press", self.session_id) as span:
+            response = press_key.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=_press_body(selector, key, wait)
+            )
+            record_response(span, response)
         
-        print(f"Pressed key: {key}")
+        log_action("press", self.session_id, started, response, key=key)
         return response
     
     def drag_and_drop(self, source_selector: str, target_selector: str):
@@ -216,13 +277,16 @@ class BrowserSession:
             target_selector=target_selector
         )
         
-        response = drag_and_drop.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=drag_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "drag_and_drop", self.session_id) as span:
+            response = drag_and_drop.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=drag_body
+            )
+            record_response(span, response)
         
-        print(f"Dragged from {source_selector} to {target_selector}")
+        log_action("drag_and_drop", self.session_id, started, response)
         return response
     
     def take_screenshot(self, full_page: bool = True):
@@ -241,13 +305,16 @@ class BrowserSession:
             full_page=full_page
         )
         
-        response = take_screenshot.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=screenshot_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "take_screenshot", self.session_id) as span:
+            response = take_screenshot.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=screenshot_body
+            )
+            record_response(span, response)
         
-        print("Screenshot taken.")
+        log_action("take_screenshot", self.session_id, started, response)
         return response
     
     def scrape_information(self, description: str, level_of_detail: str = "full"):
@@ -263,22 +330,17 @@ class BrowserSession:
         """
         if not self.session_id:
             raise Exception("No active browser session.")
-        
-        detail_enum = getattr(ScrapeInformationBodyLevelOfDetail, level_of_detail.upper(), 
-                             ScrapeInformationBodyLevelOfDetail.FULL)
             
-        scrape_body = ScrapeInformationBody(
-            description=description,
-            level_of_detail=detail_enum
-        )
-        
-        response = scrape_information.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=scrape_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "scrape_information", self.session_id) as span:
+            response = scrape_information.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=_scrape_information_body(description, level_of_detail)
+            )
+            record_response(span, response)
         
-        print(f"Information scraped: {description}")
+        log_action("scrape_information", self.session_id, started, response)
         return response
     
     def scrape_page(self, format: List[str] = None, delay: float = 0,
@@ -297,29 +359,16 @@ class BrowserSession:
         if not self.session_id:
             raise Exception("No active browser session.")
             
-        if format is None:
-            format = ["html", "text"]
-            
-        format_enums = []
-        for fmt in format:
-            format_enum = getattr(ScrapePageBodyFormatItem, fmt.upper(), None)
-            if format_enum:
-                format_enums.append(format_enum)
-            
-        scrape_body = ScrapePageBody(
-            format_=format_enums,
-            delay=delay,
-            screenshot=screenshot,
-            pdf=pdf
-        )
-        
-        response = scrape_page.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=scrape_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "scrape_page", self.session_id) as span:
+            response = scrape_page.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=_scrape_page_body(format, delay, screenshot, pdf)
+            )
+            record_response(span, response)
         
-        print("Page scraped.")
+        log_action("scrape_page", self.session_id, started, response)
         return response
     
     def generate_pdf(self, delay: float = 0):
@@ -338,15 +387,58 @@ class BrowserSession:
             delay=delay
         )
         
-        response = generate_pdf.sync(
-            client=self.client,
-            session_id=self.session_id,
-            body=pdf_body
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "generate_pdf", self.session_id) as span:
+            response = generate_pdf.sync(
+                client=self.client,
+                session_id=self.session_id,
+                body=pdf_body
+            )
+            record_response(span, response)
         
-        print("PDF generated.")
+        log_action("generate_pdf", self.session_id, started, response)
         return response
     
+    def save_screenshot(self, destination, full_page: bool = True):
+        """Take a screenshot and stream the image to a file without holding it in memory.
+        
+        Args:
+            destination: File path, or a binary file-like object to write the image to.
+            full_page: Whether to capture the full page or just the viewport.
+            
+        Returns:
+            Response of the screenshot request, containing the url of the captured image.
+        """
+        response = self.take_screenshot(full_page=full_page)
+        with action_span(self._span, "download", self.session_id):
+            download(self.client, _artifact_url(response, "screenshot_url"), destination)
+        return response
+    
+    def save_pdf(self, destination, delay: float = 0):
+        """Generate a PDF of the current page and stream it to a file without holding it in memory.
+        
+        Args:
+            destination: File path, or a binary file-like object to write the PDF to.
+            delay: Delay in seconds before generating the PDF.
+            
+        Returns:
+            Response of the PDF request, containing the url of the PDF.
+        """
+        response = self.generate_pdf(delay=delay)
+        with action_span(self._span, "download", self.session_id):
+            download(self.client, _artifact_url(response, "pdf_url"), destination)
+        return response
+    
+    def pipeline(self):
+        """Start an ActionBatch that sends a sequence of actions back to back.
+
+        Returns:
+            An empty ActionBatch bound to this session; record actions on it and call ``run()``.
+        """
+        from .pipeline import ActionBatch
+
+        return ActionBatch(self)
+    
     def get_details(self) -> Dict[str, Any]:
         """Retrieve the latest session details from the remote API.
         
@@ -356,10 +448,12 @@ class BrowserSession:
         if not self.session_id:
             raise Exception("No active browser session.")
         
-        response = get_session_status.sync(
-            client=self.client,
-            session_id=self.session_id
-        )
+        with action_span(self._span, "get_details", self.session_id) as span:
+            response = get_session_status.sync(
+                client=self.client,
+                session_id=self.session_id
+            )
+            record_response(span, response)
         
         return response
     
@@ -382,26 +476,33 @@ class BrowserSession:
         if not self.session_id:
             raise Exception("No active browser session.")
         
-        response = get_browser_context.sync(
-            client=self.client,
-            session_id=self.session_id
-        )
+        with action_span(self._span, "get_context", self.session_id) as span:
+            response = get_browser_context.sync(
+                client=self.client,
+                session_id=self.session_id
+            )
+            record_response(span, response)
         
         return response.context if hasattr(response, 'context') else response
     
     def close_session(self):
         """Close the browser session and release resources."""
         if not self.session_id:
-            print("No active browser session to close.")
+            log_skipped("close", None)
             return
             
-        response = close_browser_session.sync(
-            client=self.client,
-            session_id=self.session_id
-        )
+        started = time.perf_counter()
+        with action_span(self._span, "close", self.session_id) as span:
+            response = close_browser_session.sync(
+                client=self.client,
+                session_id=self.session_id
+            )
+            record_response(span, response)
         
+        log_action("close", self.session_id, started, response)
+        end_session_span(self._span, self.session_id)
+        self._span = None
         self.session_id = None
-        print("Browser session closed.")
         return response
     
     def __enter__(self):
@@ -413,7 +514,7 @@ class BrowserSession:
         self.close_session()
 
 
-def create_session(api_key: Optional[str] = None, base_url: str = "https://api.aidolon.com", context: Optional[Dict[str, Any]] = None, timeout: int = 300):
+def create_session(api_key: Optional[str] = None, base_url: str = "https://api.aidolon.com", context: Optional[Dict[str, Any]] = None, timeout: int = 300, client: Optional[AuthenticatedClient] = None):
     """Create a new browser session.
     
     Args:
@@ -421,8 +522,9 @@ def create_session(api_key: Optional[str] = None, base_url: str = "https://api.a
         base_url: Base URL for Aidolon API.
         context: Optional browser context dictionary (cookies, localStorage, sessionStorage, userAgent).
         timeout: Session timeout in seconds. Default is 300 seconds (5 minutes).
+        client: Optional client to send requests with. If None, the shared client is used.
     
     Returns:
         BrowserSession object.
     """
-    return BrowserSession(api_key=api_key, base_url=base_url, context=context, timeout=timeout)
+    return BrowserSession(api_key=api_key, base_url=base_url, context=context, timeout=timeout, client=client)
@@ -0,0 +1,158 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from attrs import define
+
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.shared import _run_blocking, get_shared_async_client
+from .async_browser_session import AsyncBrowserSession
+
+
+@define
+class ItemResult:
+    """ The outcome of running the fan-out function for one item
+
+        Attributes:
+            index (int): Position of the item in the input
+            item (Any): The input item
+            result (Any): What the function returned, None if it raised
+            error (Optional[BaseException]): The exception raised for this item, if any
+            latency (float): Wall time spent on the item in seconds, including session creation when needed
+    """
+
+    index: int
+    item: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def run_many(
+    items: Iterable[Any],
+    fn: Callable[[AsyncBrowserSession, Any], Awaitable[Any]],
+    *,
+    concurrency: int = 10,
+    client: Optional[AuthenticatedClient] = None,
+    api_key: Optional[str] = None,
+    base_url: str = "https://api.aidolon.com",
+    context: Optional[Dict[str, Any]] = None,
+    timeout: int = 300,
+) -> AsyncIterator[ItemResult]:
+    """Run ``await fn(session, item)`` for every item across at most ``concurrency`` browser sessions.
+
+    Each worker creates one session on its first item and keeps using it for the following items,
+    so a run over 200 URLs with ``concurrency=10`` creates about 10 sessions. When ``fn`` raises, the
+    failure is reported for that item and the worker replaces its session before the next one, so
+    a broken page cannot affect later items. Results are yielded as soon as they complete, not in
+    input order.
+
+    Example:
+
+        async def scrape(session, url):
+            await session.navigate(url)
+            return await session.scrape_page(format=["text"])
+
+        async for result in run_many(urls, scrape, concurrency=10):
+            print(result.item, result.latency, result.error or result.result)
+
+    Args:
+        items: The inputs to process, e.g. URLs.
+        fn: Coroutine function called with a started AsyncBrowserSession and an item.
+        concurrency: Maximum number of sessions, and therefore of items in progress.
+        client: Optional client shared by all sessions. If None, the shared client of the running event loop for
+            ``base_url`` and ``api_key`` is used, so runs reuse warm connections.
+        api_key: API key for Aidolon when no client is given. If None, will try to get from environment variable.
+        base_url: Base URL for Aidolon API when no client is given.
+        context: Optional browser context dictionary every session is created with.
+        timeout: Session timeout in seconds.
+
+    Yields:
+        ItemResult for every item, with its result or error and its latency.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if client is None:
+        client = get_shared_async_client(base_url, api_key)
+
+    pending: asyncio.Queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        pending.put_nowait((index, item))
+    total = pending.qsize()
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def worker() -> None:
+        session: Optional[AsyncBrowserSession] = None
+        try:
+            while True:
+                try:
+                    index, item = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                outcome = ItemResult(index=index, item=item)
+                started = time.perf_counter()
+                try:
+                    if session is None:
+                        session = await AsyncBrowserSession(client=client, context=context, timeout=timeout).start()
+                    outcome.result = await fn(session, item)
+                except Exception as exc:
+                    outcome.error = exc
+                    session = await _discard(session)
+                outcome.latency = time.perf_counter() - started
+                results.put_nowait(outcome)
+        finally:
+            await _discard(session)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, total))]
+    try:
+        for _ in range(total):
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def _discard(session: Optional[AsyncBrowserSession]) -> None:
+    """Close a worker's session, ignoring errors since the session may already be broken"""
+    if session is not None and session.session_id:
+        try:
+            await session.close_session()
+        except Exception:
+            pass
+    return None
+
+
+def map_sessions(
+    items: Iterable[Any],
+    fn: Callable[[AsyncBrowserSession, Any], Awaitable[Any]],
+    *,
+    concurrency: int = 10,
+    client: Optional[AuthenticatedClient] = None,
+    api_key: Optional[str] = None,
+    base_url: str = "https://api.aidolon.com",
+    context: Optional[Dict[str, Any]] = None,
+    timeout: int = 300,
+) -> List[ItemResult]:
+    """Blocking counterpart of ``run_many`` that waits for every item.
+
+    Runs its own event loop, so it cannot be called from inside a running one; use ``run_many`` there.
+    A given ``client`` lends its settings to a copy with a connection pool of its own for the run.
+
+    Returns:
+        ItemResult for every item, in input order.
+    """
+    async def collect(run_client: Optional[AuthenticatedClient]) -> List[ItemResult]:
+        collected = [
+            result async for result in run_many(
+                items, fn, concurrency=concurrency, client=run_client, api_key=api_key,
+                base_url=base_url, context=context, timeout=timeout,
+            )
+        ]
+        return sorted(collected, key=lambda result: result.index)
+
+    return _run_blocking(collect, client)
@@ -0,0 +1,240 @@
+import time
+from typing import Any, List, Optional
+
+from attrs import define, field
+
+from aidolon_browser_client.api.browser_actions import (
+    click_element,
+    type_text,
+    navigate_browser,
+    press_key,
+    drag_and_drop
+)
+from aidolon_browser_client.api.content_extraction import (
+    take_screenshot,
+    scrape_information,
+    scrape_page,
+    generate_pdf
+)
+from aidolon_browser_client.models import (
+    ClickElementBody,
+    TypeTextBody,
+    NavigateBrowserBody,
+    PressKeyBody,
+    DragAndDropBody,
+    TakeScreenshotBody,
+    ScrapeInformationBody,
+    ScrapePageBody,
+    GeneratePdfBody,
+)
+from aidolon_browser_client.models.error import Error
+from aidolon_browser_client.tracing import action_span, record_response
+from aidolon_browser_client.types import Response
+from .browser_session import (
+    _click_body,
+    _press_body,
+    _scrape_information_body,
+    _scrape_page_body,
+)
+
+# Endpoint module that accepts each request body
+_ENDPOINTS = {
+    ClickElementBody: click_element,
+    TypeTextBody: type_text,
+    NavigateBrowserBody: navigate_browser,
+    PressKeyBody: press_key,
+    DragAndDropBody: drag_and_drop,
+    TakeScreenshotBody: take_screenshot,
+    ScrapeInformationBody: scrape_information,
+    ScrapePageBody: scrape_page,
+    GeneratePdfBody: generate_pdf,
+}
+
+
+@define
+class StepResult:
+    """ The outcome of one action in a batch
+
+        Attributes:
+            action (str): Name of the endpoint module that was called, e.g. ``"navigate_browser"``
+            body (Any): The request body that was sent
+            response (Optional[Response]): The detailed response, None if the request raised
+            elapsed (float): Wall time of the request in seconds
+            error (Optional[BaseException]): The exception raised by the request, if any
+    """
+
+    action: str
+    body: Any
+    response: Optional[Response] = None
+    elapsed: float = 0.0
+    error: Optional[BaseException] = None
+
+    @property
+    def parsed(self) -> Any:
+        return self.response.parsed if self.response is not None else None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request completed and the API reported success"""
+        if self.error is not None or self.parsed is None or isinstance(self.parsed, Error):
+            return False
+        return getattr(self.parsed, "success", True) is not False
+
+
+@define
+class BatchResult:
+    """ The outcome of running an ActionBatch
+
+        Attributes:
+            steps (list[StepResult]): Results of the steps that ran, in order
+            pending (int): Number of steps that were not run because an earlier step failed
+            elapsed (float): Wall time of the whole batch in seconds
+    """
+
+    steps: list[StepResult] = field(factory=list)
+    pending: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.pending == 0 and all(step.ok for step in self.steps)
+
+    @property
+    def failed_step(self) -> Optional[StepResult]:
+        """The first step that did not succeed, if any"""
+        return next((step for step in self.steps if not step.ok), None)
+
+    @property
+    def responses(self) -> List[Any]:
+        """The parsed response of every step that ran"""
+        return [step.parsed for step in self.steps]
+
+
+class ActionBatch:
+
+    """
+    Records a sequence of browser actions and sends them back to back.
+
+    The requests go out one after another over the session client's kept-alive connection with the
+    request bodies prepared up front, so the only per-step latency is the round trip itself. The API
+    has no batch endpoint; actions on one browser depend on the previous one finishing, so the steps
+    are never sent concurrently.
+
+    Every builder method returns the batch so calls can be chained:
+
+        result = session.pipeline().navigate(url).type("the search input", "donuts").press("the search input", "Enter").run()
+    """
+
+    def __init__(self, session):
+        """Create an empty batch for a BrowserSession or AsyncBrowserSession.
+
+        Args:
+            session: The session whose client and session_id the actions are sent with.
+        """
+        self.session = session
+        self._steps: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def add(self, body: Any) -> "ActionBatch":
+        """Append an action given as its request body model (e.g. ``NavigateBrowserBody``)."""
+        if type(body) not in _ENDPOINTS:
+            raise TypeError(f"Unsupported action body: {type(body).__name__}")
+        self._steps.append(body)
+        return self
+
+    def navigate(self, url: str) -> "ActionBatch":
+        return self.add(NavigateBrowserBody(url=url))
+
+    def click(self, selector: str, wait: str = "auto") -> "ActionBatch":
+        return self.add(_click_body(selector, wait))
+
+    def type(self, selector: str, text: str) -> "ActionBatch":
+        return self.add(TypeTextBody(selector=selector, text=text))
+
+    def press(self, selector: str, key: str, wait: str = "auto") -> "ActionBatch":
+        return self.add(_press_body(selector, key, wait))
+
+    def drag_and_drop(self, source_selector: str, target_selector: str) -> "ActionBatch":
+        return self.add(DragAndDropBody(source_selector=source_selector, target_selector=target_selector))
+
+    def take_screenshot(self, full_page: bool = True) -> "ActionBatch":
+        return self.add(TakeScreenshotBody(full_page=full_page))
+
+    def scrape_information(self, description: str, level_of_detail: str = "full") -> "ActionBatch":
+        return self.add(_scrape_information_body(description, level_of_detail))
+
+    def scrape_page(self, format: List[str] = None, delay: float = 0,
+                    screenshot: bool = False, pdf: bool = False) -> "ActionBatch":
+        return self.add(_scrape_page_body(format, delay, screenshot, pdf))
+
+    def generate_pdf(self, delay: float = 0) -> "ActionBatch":
+        return self.add(GeneratePdfBody(delay=delay))
+
+    def _prepare(self):
+        if not self.session.session_id:
+            raise Exception("No active browser session.")
+        return [(_ENDPOINTS[type(body)], body) for body in self._steps]
+
+    def run(self, stop_on_error: bool = True) -> BatchResult:
+        """Send the recorded actions in order with a BrowserSession.
+
+        Args:
+            stop_on_error: Stop at the first step that raises or does not succeed.
+
+        Returns:
+            BatchResult with a StepResult (parsed response and timing) per step that ran.
+        """
+        steps = self._prepare()
+        result = BatchResult()
+        started = time.perf_counter()
+        with action_span(self.session._span, "pipeline", self.session.session_id) as batch_span:
+            for index, (module, body) in enumerate(steps):
+                step = StepResult(action=module.__name__.rsplit(".", 1)[-1], body=body)
+                step_started = time.perf_counter()
+                try:
+                    with action_span(batch_span, step.action, self.session.session_id) as span:
+                        step.response = module.sync_detailed(self.session.session_id, client=self.session.client,
+                                                             body=body)
+                        record_response(span, step.response.parsed)
+                except Exception as exc:
+                    step.error = exc
+                step.elapsed = time.perf_counter() - step_started
+                result.steps.append(step)
+                if stop_on_error and not step.ok:
+                    result.pending = len(steps) - index - 1
+                    break
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    async def run_async(self, stop_on_error: bool = True) -> BatchResult:
+        """Send the recorded actions in order with an AsyncBrowserSession.
+
+        Args:
+            stop_on_error: Stop at the first step that raises or does not succeed.
+
+        Returns:
+            BatchResult with a StepResult (parsed response and timing) per step that ran.
+        """
+        steps = self._prepare()
+        result = BatchResult()
+        started = time.perf_counter()
+        with action_span(self.session._span, "pipeline", self.session.session_id) as batch_span:
+            for index, (module, body) in enumerate(steps):
+                step = StepResult(action=module.__name__.rsplit(".", 1)[-1], body=body)
+                step_started = time.perf_counter()
+                try:
+                    with action_span(batch_span, step.action, self.session.session_id) as span:
+                        step.response = await module.asyncio_detailed(self.session.session_id,
+                                                                      client=self.session.client, body=body)
+                        record_response(span, step.response.parsed)
+                except Exception as exc:
+                    step.error = exc
+                step.elapsed = time.perf_counter() - step_started
+                result.steps.append(step)
+                if stop_on_error and not step.ok:
+                    result.pending = len(steps) - index - 1
+                    break
+        result.elapsed = time.perf_counter() - started
+        return result
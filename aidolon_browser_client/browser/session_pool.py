@@ -0,0 +1,462 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from http import HTTPStatus
+from typing import Optional, Dict, Any
+
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.session_management import (
+    get_session_status,
+    update_session_timeout
+)
+from aidolon_browser_client.models import UpdateSessionTimeoutBody
+from aidolon_browser_client.log import logger
+from aidolon_browser_client.shared import get_shared_async_client, get_shared_client
+from aidolon_browser_client.tracing import action_span, end_session_span
+from .browser_session import BrowserSession
+from .async_browser_session import AsyncBrowserSession
+
+
+def _is_active(response) -> bool:
+    """Whether a get_session_status response describes a session that can still be used"""
+    return response.status_code == HTTPStatus.OK and getattr(response.parsed, "status", None) == "active"
+
+
+def _is_dead(response) -> bool:
+    """Whether a get_session_status response shows the session is gone, rather than a transient error"""
+    if response.status_code == HTTPStatus.NOT_FOUND:
+        return True
+    return response.status_code == HTTPStatus.OK and not _is_active(response)
+
+
+def _forget(session) -> None:
+    """End the span of a dead session and clear its id so it is not closed again"""
+    end_session_span(session._span, session.session_id)
+    session._span = None
+    session.session_id = None
+
+
+class SessionPool:
+
+    """
+    A fixed-size pool of warm browser sessions for use from threads.
+
+    ``start()`` creates ``size`` sessions up front so ``acquire()`` never waits on
+    ``create_browser_session``. While sessions sit idle a background thread extends their
+    timeout with ``update_session_timeout`` and replaces any that ``get_session_status``
+    reports as closed. Sessions handed out by the pool must be given back with ``release()``
+    (or used through ``session()``) rather than closed.
+
+    Example:
+
+        with SessionPool(size=4) as pool:
+            with pool.session() as browser:
+                browser.navigate("https://example.com")
+    """
+
+    def __init__(self, size: int = 4, *, api_key: Optional[str] = None, base_url: str = "https://api.aidolon.com",
+                 context: Optional[Dict[str, Any]] = None, timeout: int = 300, refresh_interval: float = 60.0,
+                 client: Optional[AuthenticatedClient] = None):
+        """Configure the pool. No session is created before ``start()``.
+
+        Args:
+            size: Number of sessions kept by the pool.
+            api_key: API key for Aidolon. If None, will try to get from environment variable.
+            base_url: Base URL for Aidolon API.
+            context: Optional browser context dictionary every session is created with.
+            timeout: Session timeout in seconds, re-applied to idle sessions on every refresh.
+            refresh_interval: Seconds between refreshes of idle sessions. Should be well below ``timeout``.
+            client: Optional client to send requests with. If None, the shared client is used.
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.client = client if client is not None else get_shared_client(base_url, api_key)
+        self.context = context
+        self.timeout = timeout
+        self.refresh_interval = refresh_interval
+        self._idle = deque()
+        self._in_use = set()
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+        self._pending = 0
+
+    def _create(self) -> BrowserSession:
+        return BrowserSession(client=self.client, context=self.context, timeout=self.timeout)
+
+    def start(self) -> "SessionPool":
+        """Create the pool's sessions concurrently and start refreshing them in the background."""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._create) for _ in range(self.size)]
+        sessions, errors = [], []
+        for future in futures:
+            try:
+                sessions.append(future.result())
+            except Exception as exc:
+                errors.append(exc)
+        if errors:
+            # Do not leave the sessions that were created running on the API
+            for session in sessions:
+                try:
+                    session.close_session()
+                except Exception:
+                    pass
+            raise errors[0]
+        with self._condition:
+            self._idle.extend(sessions)
+            self._condition.notify_all()
+        self._stopped.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop, name="aidolon-session-pool", daemon=True)
+        self._refresher.start()
+        return self
+
+    def acquire(self, timeout: Optional[float] = None) -> BrowserSession:
+        """Take an idle session from the pool, waiting up to ``timeout`` seconds for one to be released.
+
+        Raises:
+            TimeoutError: If no session became available in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not self._idle:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No browser session available in the pool.")
+                self._condition.wait(remaining)
+            session = self._idle.popleft()
+            self._in_use.add(session)
+            return session
+
+    def release(self, session: BrowserSession, discard: bool = False) -> None:
+        """Give a session back to the pool.
+
+        Args:
+            session: A session previously returned by ``acquire()``.
+            discard: Close the session and put a freshly created one in its place, e.g. after an error
+                left the browser in an unknown state.
+        """
+        with self._condition:
+            self._in_use.discard(session)
+        if discard or not session.session_id:
+            # Create the replacement off the caller's thread to keep release() fast
+            threading.Thread(target=self._replace, args=(session,), daemon=True).start()
+            return
+        with self._condition:
+            self._idle.append(session)
+            self._condition.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None):
+        """Acquire a session for the duration of a with block, discarding it if the block raises."""
+        session = self.acquire(timeout)
+        try:
+            yield session
+        except BaseException:
+            self.release(session, discard=True)
+            raise
+        self.release(session)
+
+    def _replace(self, session: Optional[BrowserSession]) -> None:
+        """Close ``session`` (if any) and add a newly created session to the idle sessions."""
+        with self._condition:
+            self._pending += 1
+        try:
+            if session is not None and session.session_id:
+                try:
+                    session.close_session()
+                except Exception:
+                    pass
+            if self._stopped.is_set():
+                return
+            try:
+                replacement = self._create()
+            except Exception:
+                # The next refresh tops the pool up again
+                logger.warning("Could not create a session for the pool", exc_info=True)
+                return
+            with self._condition:
+                if not self._stopped.is_set():
+                    self._idle.append(replacement)
+                    self._condition.notify()
+                    return
+            replacement.close_session()
+        finally:
+            with self._condition:
+                self._pending -= 1
+
+    def refresh(self) -> None:
+        """Extend the timeout of every idle session and replace the ones that are no longer active."""
+        with self._condition:
+            idle = list(self._idle)
+        for session in idle:
+            # Check out one session at a time so acquire() can still take the others
+            with self._condition:
+                if session not in self._idle:
+                    continue
+                self._idle.remove(session)
+            try:
+                with action_span(session._span, "refresh", session.session_id):
+                    response = get_session_status.sync_detailed(client=self.client, session_id=session.session_id)
+                    alive = not _is_dead(response)
+                    if _is_active(response):
+                        update_session_timeout.sync(
+                            client=self.client,
+                            session_id=session.session_id,
+                            body=UpdateSessionTimeoutBody(timeout=self.timeout)
+                        )
+            except Exception:
+                # Keep the session on transient errors, the next refresh checks it again
+                alive = True
+            if alive:
+                with self._condition:
+                    self._idle.append(session)
+                    self._condition.notify()
+            else:
+                _forget(session)
+                self._replace(session)
+
+        # Top up sessions lost to failed replacements
+        with self._condition:
+            missing = self.size - len(self._idle) - len(self._in_use) - self._pending
+        for _ in range(missing):
+            self._replace(None)
+
+    def _refresh_loop(self) -> None:
+        while not self._stopped.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.warning("Refreshing the session pool failed", exc_info=True)
+
+    def close(self) -> None:
+        """Stop refreshing and close every session owned by the pool, including ones still in use."""
+        self._stopped.set()
+        if self._refresher is not None:
+            self._refresher.join()
+            self._refresher = None
+        with self._condition:
+            sessions = list(self._idle) + list(self._in_use)
+            self._idle.clear()
+            self._in_use.clear()
+        for session in sessions:
+            session.close_session()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncSessionPool:
+
+    """
+    A fixed-size pool of warm AsyncBrowserSessions for use from one event loop.
+
+    Behaves like SessionPool, with ``acquire()``, ``release()`` and ``close()`` as coroutines
+    and the idle refresh running as an asyncio task.
+
+    Example:
+
+        async with AsyncSessionPool(size=4, client=client) as pool:
+            async with pool.session() as browser:
+                await browser.navigate("https://example.com")
+    """
+
+    def __init__(self, size: int = 4, *, api_key: Optional[str] = None, base_url: str = "https://api.aidolon.com",
+                 context: Optional[Dict[str, Any]] = None, timeout: int = 300, refresh_interval: float = 60.0,
+                 client: Optional[AuthenticatedClient] = None):
+        """Configure the pool. No session is created before ``start()``.
+
+        Args:
+            size: Number of sessions kept by the pool.
+            api_key: API key for Aidolon. If None, will try to get from environment variable.
+            base_url: Base URL for Aidolon API.
+            context: Optional browser context dictionary every session is created with.
+            timeout: Session timeout in seconds, re-applied to idle sessions on every refresh.
+            refresh_interval: Seconds between refreshes of idle sessions. Should be well below ``timeout``.
+            client: Optional client to share between the sessions. If None, ``start()`` uses the shared client of
+                the running event loop for ``base_url`` and ``api_key``.
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.client = client
+        self._uses_shared_client = client is None
+        self._api_key = api_key
+        self._base_url = base_url
+        self.context = context
+        self.timeout = timeout
+        self.refresh_interval = refresh_interval
+        self._idle = deque()
+        self._in_use = set()
+        self._condition: Optional[asyncio.Condition] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self._replacing = set()
+        self._pending = 0
+        self._stopped = False
+
+    async def _create(self) -> AsyncBrowserSession:
+        return await AsyncBrowserSession(client=self.client, context=self.context, timeout=self.timeout).start()
+
+    async def start(self) -> "AsyncSessionPool":
+        """Create the pool's sessions concurrently and start refreshing them in the background."""
+        if self._uses_shared_client:
+            self.client = get_shared_async_client(self._base_url, self._api_key)
+        self._condition = asyncio.Condition()
+        self._stopped = False
+        results = await asyncio.gather(*(self._create() for _ in range(self.size)), return_exceptions=True)
+        sessions = [result for result in results if not isinstance(result, BaseException)]
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            # Do not leave the sessions that were created running on the API
+            await asyncio.gather(*(session.close_session() for session in sessions), return_exceptions=True)
+            raise errors[0]
+        async with self._condition:
+            self._idle.extend(sessions)
+            self._condition.notify_all()
+        self._refresher = asyncio.ensure_future(self._refresh_loop())
+        return self
+
+    async def acquire(self, timeout: Optional[float] = None) -> AsyncBrowserSession:
+        """Take an idle session from the pool, waiting up to ``timeout`` seconds for one to be released.
+
+        Raises:
+            TimeoutError: If no session became available in time.
+        """
+        async def wait_for_idle():
+            async with self._condition:
+                await self._condition.wait_for(lambda: bool(self._idle))
+                session = self._idle.popleft()
+                self._in_use.add(session)
+                return session
+
+        try:
+            return await asyncio.wait_for(wait_for_idle(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError("No browser session available in the pool.") from None
+
+    async def release(self, session: AsyncBrowserSession, discard: bool = False) -> None:
+        """Give a session back to the pool.
+
+        Args:
+            session: A session previously returned by ``acquire()``.
+            discard: Close the session and put a freshly created one in its place.
+        """
+        self._in_use.discard(session)
+        if discard or not session.session_id:
+            # Create the replacement in the background to keep release() fast
+            task = asyncio.ensure_future(self._replace(session))
+            self._replacing.add(task)
+            task.add_done_callback(self._replacing.discard)
+            return
+        async with self._condition:
+            self._idle.append(session)
+            self._condition.notify()
+
+    @asynccontextmanager
+    async def session(self, timeout: Optional[float] = None):
+        """Acquire a session for the duration of an async with block, discarding it if the block raises."""
+        session = await self.acquire(timeout)
+        try:
+            yield session
+        except BaseException:
+            await self.release(session, discard=True)
+            raise
+        await self.release(session)
+
+    async def _replace(self, session: Optional[AsyncBrowserSession]) -> None:
+        """Close ``session`` (if any) and add a newly created session to the idle sessions."""
+        self._pending += 1
+        try:
+            if session is not None and session.session_id:
+                try:
+                    await session.close_session()
+                except Exception:
+                    pass
+            if self._stopped:
+                return
+            try:
+                replacement = await self._create()
+            except Exception:
+                # The next refresh tops the pool up again
+                logger.warning("Could not create a session for the pool", exc_info=True)
+                return
+            async with self._condition:
+                self._idle.append(replacement)
+                self._condition.notify()
+        finally:
+            self._pending -= 1
+
+    async def refresh(self) -> None:
+        """Extend the timeout of every idle session and replace the ones that are no longer active."""
+        async with self._condition:
+            idle = list(self._idle)
+
+        async def check(session: AsyncBrowserSession) -> None:
+            async with self._condition:
+                if session not in self._idle:
+                    return
+                self._idle.remove(session)
+            try:
+                with action_span(session._span, "refresh", session.session_id):
+                    response = await get_session_status.asyncio_detailed(client=self.client, session_id=session.session_id)
+                    alive = not _is_dead(response)
+                    if _is_active(response):
+                        await update_session_timeout.asyncio(
+                            client=self.client,
+                            session_id=session.session_id,
+                            body=UpdateSessionTimeoutBody(timeout=self.timeout)
+                        )
+            except Exception:
+                # Keep the session on transient errors, the next refresh checks it again
+                alive = True
+            if alive:
+                async with self._condition:
+                    self._idle.append(session)
+                    self._condition.notify()
+            else:
+                _forget(session)
+                await self._replace(session)
+
+        for result in await asyncio.gather(*(check(session) for session in idle), return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning("Refreshing a pooled session failed", exc_info=result)
+
+        # Top up sessions lost to failed replacements
+        missing = self.size - len(self._idle) - len(self._in_use) - self._pending
+        await asyncio.gather(*(self._replace(None) for _ in range(missing)), return_exceptions=True)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:
+                logger.warning("Refreshing the session pool failed", exc_info=True)
+
+    async def close(self) -> None:
+        """Stop refreshing and close every session owned by the pool, including ones still in use."""
+        self._stopped = True
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+        await asyncio.gather(*self._replacing, return_exceptions=True)
+        sessions = list(self._idle) + list(self._in_use)
+        self._idle.clear()
+        self._in_use.clear()
+        await asyncio.gather(*(session.close_session() for session in sessions), return_exceptions=True)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
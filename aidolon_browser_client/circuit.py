@@ -0,0 +1,296 @@
+""" Per-endpoint circuit breaking, failing fast while the API keeps failing, as httpx transports """
+
+import threading
+import time
+from enum import Enum
+from typing import Callable, Optional
+
+import httpx
+from attrs import define
+
+from .endpoints import Endpoint, resolve_endpoint
+from .errors import CircuitOpenError
+from .metrics import Metrics
+
+FAILURE_STATUSES: frozenset[int] = frozenset({500, 502, 503, 504})
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __str__(self) -> str:
+        return str(self.value)
+
+
+@define
+class CircuitStateChange:
+    """ A circuit of the breaker changed state, as reported to ``metrics.Metrics`` circuit callbacks
+
+        Attributes:
+            endpoint (str): Endpoint module name of the circuit, e.g. ``"click_element"``
+            group (str): api/ package of the endpoint
+            old_state (CircuitState): State before the change
+            new_state (CircuitState): State after the change
+            failures (int): Consecutive failures counted when the change happened
+    """
+
+    endpoint: str
+    group: str
+    old_state: CircuitState
+    new_state: CircuitState
+    failures: int
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "probes", "successes")
+
+    def __init__(self):
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.successes = 0
+
+
+class CircuitBreaker:
+    """Stops sending requests to an endpoint after consecutive failures, until a probe succeeds again
+
+    Every API endpoint has its own circuit. It opens after ``failure_threshold`` consecutive failures (transport
+    errors, including timeouts, and responses with a status in ``failure_statuses``); requests to it then raise
+    ``errors.CircuitOpenError`` at once instead of waiting for the API. After ``recovery_timeout`` seconds the
+    circuit is half-open and lets up to ``half_open_max_calls`` probe requests through: ``success_threshold``
+    successes close it, a failure opens it again. Requests outside the API are not affected.
+
+    One breaker can be shared by several clients, threads and event loops. State changes are reported to the
+    circuit callbacks of the clients' ``metrics.Metrics``.
+
+    Example:
+
+        breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=10)
+        client = AuthenticatedClient(base_url=..., token=..., circuit_breaker=breaker)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        failure_statuses: frozenset[int] = FAILURE_STATUSES,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.failure_statuses = frozenset(failure_statuses)
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, endpoint: str) -> CircuitState:
+        """Current state of the circuit of an endpoint, by module name"""
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return CircuitState.CLOSED
+            if circuit.state is CircuitState.OPEN and time.monotonic() >= circuit.opened_at + self.recovery_timeout:
+                return CircuitState.HALF_OPEN
+            return circuit.state
+
+    def reset(self) -> None:
+        """Close every circuit"""
+        with self._lock:
+            self._circuits.clear()
+
+    def before(self, endpoint: Endpoint) -> tuple[bool, list[CircuitStateChange]]:
+        """Let a request to ``endpoint`` through or raise ``CircuitOpenError``
+
+        Returns whether the request is a half-open probe, and the state changes made.
+        """
+        changes: list[CircuitStateChange] = []
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint.name, _Circuit())
+            if circuit.state is CircuitState.OPEN:
+                remaining = circuit.opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(endpoint.name, remaining)
+                self._change(endpoint, circuit, CircuitState.HALF_OPEN, changes)
+            if circuit.state is CircuitState.CLOSED:
+                return False, changes
+            if circuit.probes >= self.half_open_max_calls:
+                raise CircuitOpenError(endpoint.name, 0.0)
+            circuit.probes += 1
+        return True, changes
+
+    def record(self, endpoint: Endpoint, probe: bool, failed: Optional[bool]) -> list[CircuitStateChange]:
+        """Count the outcome of a request let through by ``before``, ``failed=None`` when it was abandoned
+
+        Returns the state changes made.
+        """
+        changes: list[CircuitStateChange] = []
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint.name, _Circuit())
+            half_open = circuit.state is CircuitState.HALF_OPEN
+            if probe and half_open:
+                circuit.probes = max(0, circuit.probes - 1)
+            if failed is None:
+                return changes
+            if not failed:
+                if circuit.state is CircuitState.CLOSED:
+                    circuit.failures = 0
+                elif probe and half_open:
+                    circuit.successes += 1
+                    if circuit.successes >= self.success_threshold:
+                        self._change(endpoint, circuit, CircuitState.CLOSED, changes)
+                return changes
+            circuit.failures += 1
+            if (probe and half_open) or (
+                circuit.state is CircuitState.CLOSED and circuit.failures >= self.failure_threshold
+            ):
+                circuit.opened_at = time.monotonic()
+                self._change(endpoint, circuit, CircuitState.OPEN, changes)
+        return changes
+
+    def _change(self, endpoint: Endpoint, circuit: _Circuit, state: CircuitState,
+                changes: list[CircuitStateChange]) -> None:
+        changes.append(CircuitStateChange(endpoint.name, endpoint.group, circuit.state, state, circuit.failures))
+        circuit.state = state
+        circuit.probes = circuit.successes = 0
+        if state is CircuitState.CLOSED:
+            circuit.failures = 0
+
+    def _failed(self, response: httpx.Response) -> bool:
+        return response.status_code in self.failure_statuses
+
+
+def _report(metrics: Optional[Metrics], changes: list[CircuitStateChange]) -> None:
+    if metrics is not None:
+        for change in changes:
+            metrics.emit_circuit_change(change)
+
+
+class _CircuitStream(httpx.SyncByteStream):
+    """Response stream calling ``finish`` once when the body has been read and closed, with whether reading failed"""
+
+    def __init__(self, stream: httpx.SyncByteStream, finish: Callable[[bool], None]):
+        self._stream = stream
+        self._finish: Optional[Callable[[bool], None]] = finish
+        self._read_failed = False
+
+    def __iter__(self):
+        try:
+            yield from self._stream
+        except httpx.TransportError:
+            self._read_failed = True
+            raise
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            finish, self._finish = self._finish, None
+            if finish is not None:
+                finish(self._read_failed)
+
+
+class _AsyncCircuitStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, finish: Callable[[bool], None]):
+        self._stream = stream
+        self._finish: Optional[Callable[[bool], None]] = finish
+        self._read_failed = False
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except httpx.TransportError:
+            self._read_failed = True
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            finish, self._finish = self._finish, None
+            if finish is not None:
+                finish(self._read_failed)
+
+
+class CircuitBreakerTransport(httpx.BaseTransport):
+    """Wraps a transport and fails requests fast according to a CircuitBreaker
+
+    The outcome of a request is counted once its response body has been read, so a timeout while reading the body
+    counts as a failure.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, breaker: CircuitBreaker, metrics: Optional[Metrics] = None):
+        self._transport = transport
+        self.breaker = breaker
+        self.metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = resolve_endpoint(request.method, request.url.path)
+        if endpoint is None:
+            return self._transport.handle_request(request)
+        probe, changes = self.breaker.before(endpoint)
+        _report(self.metrics, changes)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException as exc:
+            _report(self.metrics, self.breaker.record(
+                endpoint, probe, True if isinstance(exc, httpx.TransportError) else None))
+            raise
+        failed = self.breaker._failed(response)
+        if response.is_closed:
+            _report(self.metrics, self.breaker.record(endpoint, probe, failed))
+        else:
+            response.stream = _CircuitStream(response.stream, lambda read_failed: _report(
+                self.metrics, self.breaker.record(endpoint, probe, failed or read_failed)))
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``CircuitBreakerTransport``"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, breaker: CircuitBreaker,
+                 metrics: Optional[Metrics] = None):
+        self._transport = transport
+        self.breaker = breaker
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = resolve_endpoint(request.method, request.url.path)
+        if endpoint is None:
+            return await self._transport.handle_async_request(request)
+        probe, changes = self.breaker.before(endpoint)
+        _report(self.metrics, changes)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as exc:
+            _report(self.metrics, self.breaker.record(
+                endpoint, probe, True if isinstance(exc, httpx.TransportError) else None))
+            raise
+        failed = self.breaker._failed(response)
+        if response.is_closed:
+            _report(self.metrics, self.breaker.record(endpoint, probe, failed))
+        else:
+            response.stream = _AsyncCircuitStream(response.stream, lambda read_failed: _report(
+                self.metrics, self.breaker.record(endpoint, probe, failed or read_failed)))
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = [
+    "FAILURE_STATUSES",
+    "AsyncCircuitBreakerTransport",
+    "CircuitBreaker",
+    "CircuitBreakerTransport",
+    "CircuitState",
+    "CircuitStateChange",
+]
@@ -1,13 +1,105 @@
 import ssl
-import os
+import warnings
 from typing import Any, Union, Optional
 
 from attrs import define, field, evolve
-from dotenv import load_dotenv
 import httpx
 
-load_dotenv()
-
+from . import _env, tracing
+from .circuit import AsyncCircuitBreakerTransport, CircuitBreaker, CircuitBreakerTransport
+from .codec import JSONCodec, get_codec
+from .metrics import AsyncMetricsTransport, Metrics, MetricsTransport
+from .ratelimit import AsyncRateLimitTransport, RateLimiter, RateLimitTransport
+from .retry import AsyncRetryTransport, RetryPolicy, RetryTransport
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+
+
+def _http2_available(requested: bool) -> bool:
+    """Whether HTTP/2 can be used, warning if it was requested but the ``h2`` package is not installed"""
+    if not requested:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        warnings.warn(
+            "HTTP/2 was requested but the 'h2' package is not installed, falling back to HTTP/1.1. "
+            "Install it with `pip install aidolon-browser-client[http2]`.",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+        return False
+    return True
+
+
+# httpx.Client arguments that configure its default transport, so they have to be passed to the
+# transport itself when it is wrapped
+_TRANSPORT_ARGS = ("http1", "proxy", "uds", "local_address", "retries", "socket_options")
+
+
+def _httpx_client_args(client: Union["Client", "AuthenticatedClient"], is_async: bool) -> dict[str, Any]:
+    """Build the constructor arguments for the client's ``httpx.Client``/``httpx.AsyncClient``,
+    wrapping the transport in the tracing layer when tracing is enabled, the rate limiting layer
+    when a RateLimiter is configured, the circuit breaking layer when a CircuitBreaker is configured,
+    the retry layer when a RetryPolicy is configured and the metrics layer when Metrics are configured,
+    and adding the metrics event hooks ahead of any given in ``httpx_args``"""
+    httpx_args = dict(client._httpx_args)
+    http2 = _http2_available(client._http2)
+    args: dict[str, Any] = {
+        "base_url": client._base_url,
+        "cookies": client._cookies,
+        "headers": client._headers,
+        "timeout": client._timeout,
+        "verify": client._verify_ssl,
+        "follow_redirects": client._follow_redirects,
+        "limits": client._limits,
+        "http2": http2,
+    }
+    trace = client._tracing and tracing.available()
+    layers = (client._retry, client._rate_limit, client._circuit_breaker, client._metrics)
+    if trace or any(layer is not None for layer in layers):
+        transport = httpx_args.pop("transport", None)
+        if transport is None:
+            transport_args = {name: httpx_args.pop(name) for name in _TRANSPORT_ARGS if name in httpx_args}
+            transport_class = httpx.AsyncHTTPTransport if is_async else httpx.HTTPTransport
+            transport = transport_class(
+                verify=client._verify_ssl, limits=client._limits, http2=http2, **transport_args
+            )
+        # one client span per attempt, so the tracing layer sits below the retries
+        if trace:
+            transport = tracing.AsyncTracingTransport(transport) if is_async else tracing.TracingTransport(transport)
+        # every attempt, retries included, waits for the limiter
+        if client._rate_limit is not None:
+            if is_async:
+                transport = AsyncRateLimitTransport(transport, client._rate_limit)
+            else:
+                transport = RateLimitTransport(transport, client._rate_limit)
+        # above the limiter, so an open circuit fails fast instead of waiting for a token; below the retries,
+        # so each attempt counts and an open circuit stops them
+        if client._circuit_breaker is not None:
+            if is_async:
+                transport = AsyncCircuitBreakerTransport(transport, client._circuit_breaker, client._metrics)
+            else:
+                transport = CircuitBreakerTransport(transport, client._circuit_breaker, client._metrics)
+        if client._retry is not None:
+            if is_async:
+                transport = AsyncRetryTransport(transport, client._retry)
+            else:
+                transport = RetryTransport(transport, client._retry)
+        # above the retries, so a request is reported once, when its last attempt raised
+        if client._metrics is not None:
+            if is_async:
+                transport = AsyncMetricsTransport(transport, client._metrics)
+            else:
+                transport = MetricsTransport(transport, client._metrics)
+        args["transport"] = transport
+    if client._metrics is not None:
+        hooks = client._metrics.event_hooks(is_async)
+        for name, extra in httpx_args.pop("event_hooks", {}).items():
+            hooks[name] = hooks.get(name, []) + list(extra)
+        args["event_hooks"] = hooks
+    args.update(httpx_args)
+    return args
 
 
 
@@ -32,6 +124,31 @@ class Client:
 
         ``follow_redirects``: Whether or not to follow redirects. Default value is False.
 
+        ``limits``: The ``httpx.Limits`` for the connection pool (maximum connections, keep-alive connections and
+        keep-alive expiry).
+
+        ``http2``: Whether to negotiate HTTP/2 so concurrent requests are multiplexed over a few connections. Needs the
+        ``h2`` package (the ``http2`` extra); without it the client warns and falls back to HTTP/1.1. HTTP/2 is
+        negotiated over TLS, for plain ``http://`` servers also pass ``httpx_args={"http1": False}``.
+
+        ``retry``: A ``retry.RetryPolicy`` to retry transient failures (connection errors, 429 and 5xx responses) with
+        exponential backoff. Only idempotent endpoints are retried unless the policy opts others in. Default is None.
+
+        ``rate_limit``: A ``ratelimit.RateLimiter`` holding requests back to a rate and a number in flight, overall and
+        per endpoint group, and backing off when the API answers with quota errors (402/429). Share one limiter between
+        clients to apply one quota to all of them. Default is None.
+
+        ``circuit_breaker``: A ``circuit.CircuitBreaker`` that stops sending requests to an endpoint after consecutive
+        failures or timeouts, raising ``errors.CircuitOpenError`` at once until a half-open probe succeeds. Its state
+        changes are reported to the circuit callbacks of ``metrics``. Default is None.
+
+        ``metrics``: A ``metrics.Metrics`` registry whose callbacks receive the timing of every request, tagged with its
+        endpoint and session id, e.g. a ``metrics.MetricsRecorder`` or ``metrics.HistogramAdapter``. Default is None.
+
+        ``tracing``: Whether to trace sessions, their actions and every request with OpenTelemetry, sending the W3C
+        ``traceparent`` header so server spans join the trace. Needs ``opentelemetry-api`` (the ``otel`` extra);
+        without it the option has no effect. Default is False.
+
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
 
@@ -39,14 +156,33 @@ class Client:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        keep_raw_content: Whether responses keep the raw body bytes in ``Response.content`` next to the parsed
+            model. Set to False to halve the memory held by large responses such as ``scrape_page`` results; bodies
+            that could not be parsed are always kept. Can also be provided as a keyword argument to the constructor.
+        lazy_content: When ``keep_raw_content`` is False, rebuild ``Response.content`` from the parsed model on first
+            access instead of leaving it empty. The rebuilt JSON is equivalent to, but not byte-for-byte the same
+            as, the body that was received. Can also be provided as a keyword argument to the constructor.
+        json_codec: The ``codec.JSONCodec`` every endpoint encodes request bodies and decodes responses with. Given
+            as an instance, a name (``"orjson"``, ``"msgspec"`` or ``"json"``) or None for the fastest installed
+            one. Can also be provided as a keyword argument to the constructor.
     """
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    keep_raw_content: bool = field(default=True, kw_only=True)
+    lazy_content: bool = field(default=False, kw_only=True)
+    json_codec: JSONCodec = field(default=None, converter=get_codec, kw_only=True)
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
     _timeout: Optional[httpx.Timeout] = field(default=None, kw_only=True, alias="timeout")
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
+    _limits: httpx.Limits = field(default=DEFAULT_LIMITS, kw_only=True, alias="limits")
+    _http2: bool = field(default=False, kw_only=True, alias="http2")
+    _retry: Optional[RetryPolicy] = field(default=None, kw_only=True, alias="retry")
+    _rate_limit: Optional[RateLimiter] = field(default=None, kw_only=True, alias="rate_limit")
+    _circuit_breaker: Optional[CircuitBreaker] = field(default=None, kw_only=True, alias="circuit_breaker")
+    _metrics: Optional[Metrics] = field(default=None, kw_only=True, alias="metrics")
+    _tracing: bool = field(default=False, kw_only=True, alias="tracing")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
@@ -86,15 +222,7 @@ class Client:
     def get_httpx_client(self) -> httpx.Client:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
-            self._client = httpx.Client(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            self._client = httpx.Client(**_httpx_client_args(self, is_async=False))
         return self._client
 
     def __enter__(self) -> "Client":
@@ -117,15 +245,7 @@ class Client:
     def get_async_httpx_client(self) -> httpx.AsyncClient:
         """Get the underlying httpx.AsyncClient, constructing a new one if not previously set"""
         if self._async_client is None:
-            self._async_client = httpx.AsyncClient(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            self._async_client = httpx.AsyncClient(**_httpx_client_args(self, is_async=True))
         return self._async_client
 
     async def __aenter__(self) -> "Client":
@@ -158,6 +278,31 @@ class AuthenticatedClient:
 
         ``follow_redirects``: Whether or not to follow redirects. Default value is False.
 
+        ``limits``: The ``httpx.Limits`` for the connection pool (maximum connections, keep-alive connections and
+        keep-alive expiry).
+
+        ``http2``: Whether to negotiate HTTP/2 so concurrent requests are multiplexed over a few connections. Needs the
+        ``h2`` package (the ``http2`` extra); without it the client warns and falls back to HTTP/1.1. HTTP/2 is
+        negotiated over TLS, for plain ``http://`` servers also pass ``httpx_args={"http1": False}``.
+
+        ``retry``: A ``retry.RetryPolicy`` to retry transient failures (connection errors, 429 and 5xx responses) with
+        exponential backoff. Only idempotent endpoints are retried unless the policy opts others in. Default is None.
+
+        ``rate_limit``: A ``ratelimit.RateLimiter`` holding requests back to a rate and a number in flight, overall and
+        per endpoint group, and backing off when the API answers with quota errors (402/429). Share one limiter between
+        clients to apply one quota to all of them. Default is None.
+
+        ``circuit_breaker``: A ``circuit.CircuitBreaker`` that stops sending requests to an endpoint after consecutive
+        failures or timeouts, raising ``errors.CircuitOpenError`` at once until a half-open probe succeeds. Its state
+        changes are reported to the circuit callbacks of ``metrics``. Default is None.
+
+        ``metrics``: A ``metrics.Metrics`` registry whose callbacks receive the timing of every request, tagged with its
+        endpoint and session id, e.g. a ``metrics.MetricsRecorder`` or ``metrics.HistogramAdapter``. Default is None.
+
+        ``tracing``: Whether to trace sessions, their actions and every request with OpenTelemetry, sending the W3C
+        ``traceparent`` header so server spans join the trace. Needs ``opentelemetry-api`` (the ``otel`` extra);
+        without it the option has no effect. Default is False.
+
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
 
 
@@ -165,18 +310,37 @@ class AuthenticatedClient:
         raise_on_unexpected_status: Whether or not to raise an errors.UnexpectedStatus if the API returns a
             status code that was not documented in the source OpenAPI document. Can also be provided as a keyword
             argument to the constructor.
+        keep_raw_content: Whether responses keep the raw body bytes in ``Response.content`` next to the parsed
+            model. Set to False to halve the memory held by large responses such as ``scrape_page`` results; bodies
+            that could not be parsed are always kept. Can also be provided as a keyword argument to the constructor.
+        lazy_content: When ``keep_raw_content`` is False, rebuild ``Response.content`` from the parsed model on first
+            access instead of leaving it empty. The rebuilt JSON is equivalent to, but not byte-for-byte the same
+            as, the body that was received. Can also be provided as a keyword argument to the constructor.
+        json_codec: The ``codec.JSONCodec`` every endpoint encodes request bodies and decodes responses with. Given
+            as an instance, a name (``"orjson"``, ``"msgspec"`` or ``"json"``) or None for the fastest installed
+            one. Can also be provided as a keyword argument to the constructor.
         token: The token to use for authentication
         prefix: The prefix to use for the Authorization header
         auth_header_name: The name of the Authorization header
     """
 
     raise_on_unexpected_status: bool = field(default=False, kw_only=True)
+    keep_raw_content: bool = field(default=True, kw_only=True)
+    lazy_content: bool = field(default=False, kw_only=True)
+    json_codec: JSONCodec = field(default=None, converter=get_codec, kw_only=True)
     _base_url: str = field(alias="base_url")
     _cookies: dict[str, str] = field(factory=dict, kw_only=True, alias="cookies")
     _headers: dict[str, str] = field(factory=dict, kw_only=True, alias="headers")
     _timeout: Optional[httpx.Timeout] = field(default=None, kw_only=True, alias="timeout")
     _verify_ssl: Union[str, bool, ssl.SSLContext] = field(default=True, kw_only=True, alias="verify_ssl")
     _follow_redirects: bool = field(default=False, kw_only=True, alias="follow_redirects")
+    _limits: httpx.Limits = field(default=DEFAULT_LIMITS, kw_only=True, alias="limits")
+    _http2: bool = field(default=False, kw_only=True, alias="http2")
+    _retry: Optional[RetryPolicy] = field(default=None, kw_only=True, alias="retry")
+    _rate_limit: Optional[RateLimiter] = field(default=None, kw_only=True, alias="rate_limit")
+    _circuit_breaker: Optional[CircuitBreaker] = field(default=None, kw_only=True, alias="circuit_breaker")
+    _metrics: Optional[Metrics] = field(default=None, kw_only=True, alias="metrics")
+    _tracing: bool = field(default=False, kw_only=True, alias="tracing")
     _httpx_args: dict[str, Any] = field(factory=dict, kw_only=True, alias="httpx_args")
     _client: Optional[httpx.Client] = field(default=None, init=False)
     _async_client: Optional[httpx.AsyncClient] = field(default=None, init=False)
@@ -187,7 +351,7 @@ class AuthenticatedClient:
 
     def __attrs_post_init__(self):
         if self.token is None:
-            self.token = os.getenv("API_KEY")
+            self.token = _env.getenv("API_KEY")
             if self.token is None:
                 raise ValueError("API key is missing. Please provide it as an argument or set it in the environment.")
 
@@ -227,15 +391,7 @@ class AuthenticatedClient:
         """Get the underlying httpx.Client, constructing a new one if not previously set"""
         if self._client is None:
             self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
-            self._client = httpx.Client(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            self._client = httpx.Client(**_httpx_client_args(self, is_async=False))
         return self._client
 
     def __enter__(self) -> "AuthenticatedClient":
@@ -259,15 +415,7 @@ class AuthenticatedClient:
         """Get the underlying httpx.AsyncClient, constructing a new one if not previously set"""
         if self._async_client is None:
             self._headers[self.auth_header_name] = f"{self.prefix} {self.token}" if self.prefix else self.token
-            self._async_client = httpx.AsyncClient(
-                base_url=self._base_url,
-                cookies=self._cookies,
-                headers=self._headers,
-                timeout=self._timeout,
-                verify=self._verify_ssl,
-                follow_redirects=self._follow_redirects,
-                **self._httpx_args,
-            )
+            self._async_client = httpx.AsyncClient(**_httpx_client_args(self, is_async=True))
         return self._async_client
 
     async def __aenter__(self) -> "AuthenticatedClient":
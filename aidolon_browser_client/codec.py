@@ -0,0 +1,106 @@
+""" JSON codecs used by the endpoint modules to encode request bodies and decode responses """
+
+import json
+from typing import Any, Optional, Union
+
+
+class JSONCodec:
+    """Encodes request bodies to and decodes response bodies from JSON bytes.
+
+    Subclass it to plug in another JSON library and pass an instance as ``json_codec`` to the client.
+    ``decode`` raises ``ValueError`` for invalid JSON, like ``json.loads``.
+    """
+
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec backed by ``orjson``. Raises ImportError when it is not installed."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def encode(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def decode(self, data: bytes) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec backed by ``msgspec.json``. Raises ImportError when it is not installed."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+
+    def encode(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            raise ValueError(str(exc)) from exc
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+_default: Optional[JSONCodec] = None
+
+
+def default_codec() -> JSONCodec:
+    """The fastest installed codec: orjson, then msgspec, then the standard library ``json``"""
+    global _default
+    if _default is None:
+        for codec_class in CODECS.values():
+            try:
+                _default = codec_class()
+                break
+            except ImportError:
+                continue
+    return _default
+
+
+def get_codec(codec: Union[None, str, JSONCodec] = None) -> JSONCodec:
+    """Resolve a codec given as an instance, a name from ``CODECS`` or None for ``default_codec()``
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the named codec's library is not installed.
+    """
+    if codec is None:
+        return default_codec()
+    if isinstance(codec, JSONCodec):
+        return codec
+    try:
+        codec_class = CODECS[codec]
+    except KeyError:
+        raise ValueError(f"Unknown JSON codec: {codec!r}. Supported values are {', '.join(CODECS)}") from None
+    return codec_class()
+
+
+__all__ = ["CODECS", "JSONCodec", "MsgspecCodec", "OrjsonCodec", "default_codec", "get_codec"]
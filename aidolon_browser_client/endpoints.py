@@ -0,0 +1,73 @@
+""" Maps outgoing requests back to the API endpoint (and api/ package) they were sent by """
+
+import re
+from typing import Optional
+
+from attrs import define
+
+
+@define(frozen=True)
+class Endpoint:
+    """ An API operation as laid out under ``aidolon_browser_client/api``
+
+        Attributes:
+            name (str): Endpoint module name, e.g. ``"click_element"``
+            group (str): api/ package the module lives in, e.g. ``"browser_actions"``
+            method (str): Upper-case HTTP method
+            idempotent (bool): Whether the request can be repeated without side effects
+    """
+
+    name: str
+    group: str
+    method: str
+    idempotent: bool = False
+
+
+_SESSION = r"/browser/session/(?P<session_id>[^/]+)"
+
+_ROUTES: list[tuple[re.Pattern[str], Endpoint]] = [
+    (re.compile(pattern + "$"), endpoint)
+    for pattern, endpoint in [
+        (_SESSION + "/click", Endpoint("click_element", "browser_actions", "POST")),
+        (_SESSION + "/drag_and_drop", Endpoint("drag_and_drop", "browser_actions", "POST")),
+        (_SESSION + "/navigate", Endpoint("navigate_browser", "browser_actions", "POST")),
+        (_SESSION + "/press", Endpoint("press_key", "browser_actions", "POST")),
+        (_SESSION + "/type_text", Endpoint("type_text", "browser_actions", "POST")),
+        (_SESSION + "/pdf", Endpoint("generate_pdf", "content_extraction", "POST")),
+        (_SESSION + "/scrape_information", Endpoint("scrape_information", "content_extraction", "POST")),
+        (_SESSION + "/scrape", Endpoint("scrape_page", "content_extraction", "POST")),
+        (_SESSION + "/screenshot", Endpoint("take_screenshot", "content_extraction", "POST")),
+        (r"/browser/sessions/close-all", Endpoint("close_all_browser_sessions", "session_management", "POST")),
+        (_SESSION, Endpoint("close_browser_session", "session_management", "DELETE")),
+        (r"/browser/session", Endpoint("create_browser_session", "session_management", "POST")),
+        (_SESSION + "/context", Endpoint("get_browser_context", "session_management", "GET", idempotent=True)),
+        (_SESSION, Endpoint("get_session_status", "session_management", "GET", idempotent=True)),
+        (r"/browser/sessions", Endpoint("list_browser_sessions", "session_management", "GET", idempotent=True)),
+        (_SESSION + "/update-timeout", Endpoint("update_session_timeout", "session_management", "POST")),
+    ]
+]
+
+ENDPOINTS: dict[str, Endpoint] = {endpoint.name: endpoint for _, endpoint in _ROUTES}
+
+GROUPS: frozenset[str] = frozenset(endpoint.group for endpoint in ENDPOINTS.values())
+
+
+def resolve_endpoint(method: str, path: str) -> Optional[Endpoint]:
+    """Return the endpoint a request was made to, or None for URLs outside the API (e.g. artifact downloads).
+
+    ``path`` may include the path of the client's base URL, only its end is matched.
+    """
+    method = method.upper()
+    for pattern, endpoint in _ROUTES:
+        if endpoint.method == method and pattern.search(path):
+            return endpoint
+    return None
+
+
+def session_id_from_path(path: str) -> Optional[str]:
+    """Return the session id embedded in a per-session endpoint path, if any"""
+    match = re.search(_SESSION + r"(?:/[^/]+)?$", path)
+    return match.group("session_id") if match else None
+
+
+__all__ = ["ENDPOINTS", "GROUPS", "Endpoint", "resolve_endpoint", "session_id_from_path"]
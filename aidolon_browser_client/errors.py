@@ -11,4 +11,18 @@ class UnexpectedStatus(Exception):
             f"Unexpected status code: {status_code}\n\nResponse content:\n{content.decode(errors='ignore')}"
         )
 
-__all__ = ["UnexpectedStatus"]
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit breaker of its endpoint is open"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+        if retry_after > 0:
+            message = f"Circuit for {endpoint} is open, not sending requests for another {retry_after:.1f}s"
+        else:
+            message = f"Circuit for {endpoint} is half-open and already waiting for its probe requests"
+        super().__init__(message)
+
+__all__ = ["CircuitOpenError", "UnexpectedStatus"]
@@ -0,0 +1,84 @@
+""" Logging for browser sessions: structured events on a logger that is silent unless configured
+
+Every session action emits one ``INFO`` record on the ``aidolon_browser_client`` logger, carrying
+``session_id``, ``action``, ``duration`` (seconds) and ``status`` (``"ok"``, ``"error"`` or ``"skipped"``)
+as record attributes for structured handlers. The logger only has a ``NullHandler``, so nothing is written
+unless the application configures logging or calls ``enable_verbose_logging()``.
+"""
+
+import logging
+import sys
+import time
+from typing import Any, Optional, TextIO
+
+logger = logging.getLogger("aidolon_browser_client")
+logger.addHandler(logging.NullHandler())
+
+_verbose_handler: Optional[logging.Handler] = None
+_saved_state: tuple[int, bool] = (logging.NOTSET, True)  # logger level and propagate before enable_verbose_logging()
+
+
+def log_action(action: str, session_id: Any, started: float, response: Any = None, **fields: Any) -> None:
+    """Log a finished session action that started at ``time.perf_counter()`` value ``started``
+
+    Does nothing beyond a level check when INFO is not enabled for the logger. ``fields`` are extra
+    details of the action (e.g. ``url``), added to the message and to the record.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    duration = time.perf_counter() - started
+    status = "ok" if response is not None and not _is_error(response) else "error"
+    _emit(action, session_id, status, duration, fields)
+
+
+def log_skipped(action: str, session_id: Any, **fields: Any) -> None:
+    """Log a session action that was not sent, e.g. closing a session that is already closed"""
+    if logger.isEnabledFor(logging.INFO):
+        _emit(action, session_id, "skipped", 0.0, fields)
+
+
+def _emit(action: str, session_id: Any, status: str, duration: float, fields: dict) -> None:
+    details = "".join(f" {name}={value}" for name, value in fields.items())
+    logger.info(
+        "session %s %s %s in %.3fs%s", session_id, action, status, duration, details,
+        extra={"session_id": session_id, "action": action, "duration": duration, "status": status, **fields},
+    )
+
+
+def _is_error(response: Any) -> bool:
+    from .models.error import Error
+
+    return isinstance(response, Error)
+
+
+def enable_verbose_logging(level: int = logging.INFO, stream: Optional[TextIO] = None) -> logging.Handler:
+    """Print the session events to ``stream`` (stderr by default), replacing the library's former ``print()`` output
+
+    Calling it again replaces the previous verbose handler. ``disable_verbose_logging()`` undoes it.
+
+    Returns:
+        The handler added to the ``aidolon_browser_client`` logger
+    """
+    global _verbose_handler, _saved_state
+    disable_verbose_logging()
+    _saved_state = (logger.level, logger.propagate)
+    handler = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+    logger.addHandler(handler)
+    if logger.level == logging.NOTSET or logger.level > level:
+        logger.setLevel(level)
+    _verbose_handler = handler
+    return handler
+
+
+def disable_verbose_logging() -> None:
+    """Remove the handler added by ``enable_verbose_logging()`` and restore the logger's level and propagation"""
+    global _verbose_handler
+    if _verbose_handler is not None:
+        logger.removeHandler(_verbose_handler)
+        _verbose_handler = None
+        logger.setLevel(_saved_state[0])
+        logger.propagate = _saved_state[1]
+
+
+__all__ = ["logger", "log_action", "log_skipped", "enable_verbose_logging", "disable_verbose_logging"]
@@ -0,0 +1,365 @@
+""" Per-request timings reported through httpx event hooks, with recorders and histogram adapters """
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional, Sequence
+
+import httpx
+from attrs import define, field
+
+from .endpoints import resolve_endpoint, session_id_from_path
+
+# Request extension holding the timing state between the request hook and the end of the body
+_EXTENSION = "aidolon_timing"
+
+
+@define
+class RequestTiming:
+    """ How long one request took, from the request hook to the end of the response body
+
+        ``phases`` holds the seconds spent in each httpcore step when the transport reports them through the
+        ``trace`` extension: ``connect_tcp`` (DNS resolution and TCP connect), ``start_tls``, ``send_request_headers``,
+        ``send_request_body``, ``receive_response_headers`` (mostly server processing), ``receive_response_body`` and
+        ``response_closed``.
+        Steps that did not happen, e.g. connecting on a reused connection, are missing. Retries of a request are
+        included in its timing.
+
+        Attributes:
+            method (str): Upper-case HTTP method
+            path (str): URL path of the request
+            endpoint (Optional[str]): Endpoint module name, e.g. ``"click_element"``, None outside the API
+            group (Optional[str]): api/ package of the endpoint, e.g. ``"browser_actions"``
+            session_id (Optional[str]): Session the request acted on, for per-session endpoints
+            status_code (Optional[int]): Final response status, None when the request raised
+            duration (float): Wall time in seconds, including the body download
+            phases (dict[str, float]): Seconds per transport step, see above
+            error (Optional[str]): Class name of the exception the request or its body download raised, e.g.
+                ``"ReadTimeout"`` or ``"CircuitOpenError"``
+    """
+
+    method: str
+    path: str
+    endpoint: Optional[str] = None
+    group: Optional[str] = None
+    session_id: Optional[str] = None
+    status_code: Optional[int] = None
+    duration: float = 0.0
+    phases: dict[str, float] = field(factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def connect(self) -> float:
+        """Seconds spent resolving, connecting and negotiating TLS"""
+        return self.phases.get("connect_tcp", 0.0) + self.phases.get("start_tls", 0.0)
+
+    @property
+    def server(self) -> float:
+        """Seconds from the end of the request body to the response headers"""
+        return self.phases.get("receive_response_headers", 0.0)
+
+    @property
+    def download(self) -> float:
+        """Seconds spent reading the response body"""
+        return self.phases.get("receive_response_body", 0.0)
+
+
+MetricsCallback = Callable[[RequestTiming], None]
+
+# Receives a ``circuit.CircuitStateChange``
+CircuitCallback = Callable[[Any], None]
+
+
+class Metrics:
+    """Registry of callbacks receiving a ``RequestTiming`` for every request of the clients it is passed to
+
+    Pass it as ``metrics`` to ``Client``/``AuthenticatedClient``; callbacks can be added and removed at any
+    time. Callbacks run on the thread or event loop that finished the request, so they should be quick.
+    An exception raised by a callback propagates to the caller of the request.
+
+    ``circuit_callbacks`` receive a ``circuit.CircuitStateChange`` whenever a request of the clients opens,
+    half-opens or closes a circuit of their ``circuit_breaker``.
+    """
+
+    def __init__(self, *callbacks: MetricsCallback, circuit_callbacks: Sequence[CircuitCallback] = ()):
+        self._callbacks: tuple[MetricsCallback, ...] = callbacks
+        self._circuit_callbacks: tuple[CircuitCallback, ...] = tuple(circuit_callbacks)
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: MetricsCallback) -> MetricsCallback:
+        with self._lock:
+            self._callbacks = (*self._callbacks, callback)
+        return callback
+
+    def remove_callback(self, callback: MetricsCallback) -> None:
+        with self._lock:
+            self._callbacks = tuple(registered for registered in self._callbacks if registered is not callback)
+
+    def emit(self, timing: RequestTiming) -> None:
+        for callback in self._callbacks:
+            callback(timing)
+
+    def add_circuit_callback(self, callback: CircuitCallback) -> CircuitCallback:
+        with self._lock:
+            self._circuit_callbacks = (*self._circuit_callbacks, callback)
+        return callback
+
+    def remove_circuit_callback(self, callback: CircuitCallback) -> None:
+        with self._lock:
+            self._circuit_callbacks = tuple(
+                registered for registered in self._circuit_callbacks if registered is not callback)
+
+    def emit_circuit_change(self, change: Any) -> None:
+        for callback in self._circuit_callbacks:
+            callback(change)
+
+    def event_hooks(self, is_async: bool) -> dict[str, list[Callable[..., Any]]]:
+        """httpx ``event_hooks`` reporting the requests of a client to this registry"""
+        if is_async:
+            async def on_request(request: httpx.Request) -> None:
+                self._start(request, is_async=True)
+
+            async def on_response(response: httpx.Response) -> None:
+                if response.is_closed:
+                    self._finish(response)
+                else:
+                    stream = _AsyncTimedStream(response.stream, lambda: self._finish(response, stream.error))
+                    response.stream = stream
+        else:
+            def on_request(request: httpx.Request) -> None:
+                self._start(request, is_async=False)
+
+            def on_response(response: httpx.Response) -> None:
+                if response.is_closed:
+                    # The body was already read, e.g. by a transport returning a complete httpx.Response
+                    self._finish(response)
+                else:
+                    stream = _TimedStream(response.stream, lambda: self._finish(response, stream.error))
+                    response.stream = stream
+        return {"request": [on_request], "response": [on_response]}
+
+    def _start(self, request: httpx.Request, is_async: bool) -> None:
+        path = request.url.path
+        endpoint = resolve_endpoint(request.method, path)
+        timing = RequestTiming(
+            method=request.method,
+            path=path,
+            endpoint=endpoint.name if endpoint else None,
+            group=endpoint.group if endpoint else None,
+            session_id=session_id_from_path(path) if endpoint else None,
+        )
+        request.extensions[_EXTENSION] = (timing, time.perf_counter())
+        if "trace" not in request.extensions:
+            request.extensions["trace"] = _tracer(timing.phases, is_async)
+
+    def _finish(self, response: httpx.Response, error: Optional[BaseException] = None) -> None:
+        state = response.request.extensions.pop(_EXTENSION, None)
+        if state is None:
+            return
+        timing, started = state
+        timing.duration = time.perf_counter() - started
+        timing.status_code = response.status_code
+        if error is not None:
+            timing.error = type(error).__name__
+        self.emit(timing)
+
+    def _fail(self, request: httpx.Request, error: BaseException) -> None:
+        """Report a request that raised instead of returning a response"""
+        state = request.extensions.pop(_EXTENSION, None)
+        if state is None:
+            return
+        timing, started = state
+        timing.duration = time.perf_counter() - started
+        timing.error = type(error).__name__
+        self.emit(timing)
+
+
+class MetricsTransport(httpx.BaseTransport):
+    """Wraps a transport and reports the requests that raise (transport errors, timeouts, ``CircuitOpenError``...)
+    to a Metrics registry, which the event hooks cannot see"""
+
+    def __init__(self, transport: httpx.BaseTransport, metrics: Metrics):
+        self._transport = transport
+        self.metrics = metrics
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            return self._transport.handle_request(request)
+        except Exception as exc:
+            self.metrics._fail(request, exc)
+            raise
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncMetricsTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``MetricsTransport``"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: Metrics):
+        self._transport = transport
+        self.metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        try:
+            return await self._transport.handle_async_request(request)
+        except Exception as exc:
+            self.metrics._fail(request, exc)
+            raise
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _tracer(phases: dict[str, float], is_async: bool) -> Callable[..., Any]:
+    """httpcore ``trace`` callback adding the duration of each step to ``phases``"""
+    started: dict[str, float] = {}
+
+    def trace(event_name: str, info: dict) -> None:
+        step, _, stage = event_name.rpartition(".")
+        step = step.rpartition(".")[2]
+        if stage == "started":
+            started[step] = time.perf_counter()
+        elif step in started:
+            phases[step] = phases.get(step, 0.0) + time.perf_counter() - started.pop(step)
+
+    if not is_async:
+        return trace
+
+    async def async_trace(event_name: str, info: dict) -> None:
+        trace(event_name, info)
+
+    return async_trace
+
+
+class _TimedStream(httpx.SyncByteStream):
+    """Response stream calling ``finish`` once when the body has been read and closed
+
+    ``error`` is the exception reading the body raised, if any.
+    """
+
+    def __init__(self, stream: Any, finish: Callable[[], None]):
+        self._stream = stream
+        self._finish: Optional[Callable[[], None]] = finish
+        self.error: Optional[BaseException] = None
+
+    def __iter__(self):
+        try:
+            yield from self._stream
+        except Exception as exc:
+            self.error = exc
+            raise
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            finish, self._finish = self._finish, None
+            if finish is not None:
+                finish()
+
+
+class _AsyncTimedStream(httpx.AsyncByteStream):
+    def __init__(self, stream: Any, finish: Callable[[], None]):
+        self._stream = stream
+        self._finish: Optional[Callable[[], None]] = finish
+        self.error: Optional[BaseException] = None
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        except Exception as exc:
+            self.error = exc
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            finish, self._finish = self._finish, None
+            if finish is not None:
+                finish()
+
+
+class MetricsRecorder:
+    """Callback keeping the most recent timings in memory, for tests and benchmarks
+
+    Example:
+
+        recorder = MetricsRecorder()
+        client = AuthenticatedClient(base_url=..., token=..., metrics=Metrics(recorder))
+        ...
+        print(recorder.durations("navigate_browser"))
+    """
+
+    def __init__(self, maxlen: Optional[int] = None):
+        self._timings: deque[RequestTiming] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def __call__(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self._timings.append(timing)
+
+    @property
+    def timings(self) -> list[RequestTiming]:
+        with self._lock:
+            return list(self._timings)
+
+    def for_endpoint(self, endpoint: str) -> list[RequestTiming]:
+        return [timing for timing in self.timings if timing.endpoint == endpoint]
+
+    def durations(self, endpoint: Optional[str] = None) -> list[float]:
+        """Durations of every recorded request, or of the requests to one endpoint"""
+        timings = self.timings if endpoint is None else self.for_endpoint(endpoint)
+        return [timing.duration for timing in timings]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._timings.clear()
+
+
+class HistogramAdapter:
+    """Callback observing each duration in a Prometheus-style labelled histogram
+
+    Works with ``prometheus_client.Histogram`` and anything else with ``labels(**labels).observe(value)``.
+    The histogram must be declared with ``label_names``, a subset of ``endpoint``, ``group``, ``method`` and
+    ``status_code``; requests outside the API are labelled ``"other"``. With ``phase_histogram``, also declared
+    with a ``phase`` label, every transport step is observed there as well.
+
+    Example:
+
+        from prometheus_client import Histogram
+
+        latency = Histogram("aidolon_request_seconds", "Aidolon API latency", ["endpoint", "status_code"])
+        client = AuthenticatedClient(base_url=..., token=..., metrics=Metrics(HistogramAdapter(latency)))
+    """
+
+    def __init__(self, histogram: Any, label_names: Sequence[str] = ("endpoint", "status_code"),
+                 phase_histogram: Any = None):
+        self._histogram = histogram
+        self._label_names = tuple(label_names)
+        self._phase_histogram = phase_histogram
+
+    def __call__(self, timing: RequestTiming) -> None:
+        labels = {name: _label(getattr(timing, name)) for name in self._label_names}
+        self._histogram.labels(**labels).observe(timing.duration)
+        if self._phase_histogram is not None:
+            for phase, seconds in timing.phases.items():
+                self._phase_histogram.labels(**labels, phase=phase).observe(seconds)
+
+
+def _label(value: Any) -> str:
+    return "other" if value is None else str(value)
+
+
+__all__ = [
+    "AsyncMetricsTransport",
+    "CircuitCallback",
+    "HistogramAdapter",
+    "Metrics",
+    "MetricsCallback",
+    "MetricsRecorder",
+    "MetricsTransport",
+    "RequestTiming",
+]
@@ -0,0 +1,5 @@
+""" A local mock of the Aidolon API for offline tests, examples and load tests """
+
+from .server import MOCK_TOKEN, MockAPI, MockConfig, serve
+
+__all__ = ["MOCK_TOKEN", "MockAPI", "MockConfig", "serve"]
@@ -0,0 +1,24 @@
+""" Serve the mock API until interrupted: ``python -m aidolon_browser_client.mock --port 3005`` """
+
+import argparse
+import threading
+
+from .server import MockAPI, MockConfig, serve
+
+parser = argparse.ArgumentParser(prog="python -m aidolon_browser_client.mock", description="Serve the mock Aidolon API")
+parser.add_argument("--host", default="127.0.0.1")
+parser.add_argument("--port", type=int, default=3005)
+parser.add_argument("--latency", type=float, default=0.0)
+parser.add_argument("--jitter", type=float, default=0.0)
+parser.add_argument("--error-rate", type=float, default=0.0)
+parser.add_argument("--payload-size", type=int, default=1024)
+args = parser.parse_args()
+
+api = MockAPI(MockConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                         payload_size=args.payload_size))
+with serve(api, args.host, args.port) as base_url:
+    print(f"Mock Aidolon API listening on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
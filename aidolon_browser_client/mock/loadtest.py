@@ -0,0 +1,218 @@
+""" Load test the client against the mock API and report throughput and latency percentiles
+
+    python -m aidolon_browser_client.mock.loadtest --mode async --requests 5000 --concurrency 50 --latency 0.005
+
+Modes:
+    sync: worker threads each building a new client for every request, so no connection is reused
+    pooled: worker threads sharing one client and its connection pool
+    async: tasks on one event loop sharing one async client
+"""
+
+import argparse
+import asyncio
+import math
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Callable, Optional, Sequence
+
+from attrs import define, field
+
+from aidolon_browser_client.api.browser_actions import click_element, navigate_browser
+from aidolon_browser_client.api.content_extraction import scrape_page, take_screenshot
+from aidolon_browser_client.api.session_management import get_session_status, list_browser_sessions
+from aidolon_browser_client.client import AuthenticatedClient
+from aidolon_browser_client.models import (
+    ClickElementBody,
+    NavigateBrowserBody,
+    ScrapePageBody,
+    TakeScreenshotBody,
+)
+
+from .server import MockAPI, MockConfig, serve
+
+MODES = ("sync", "pooled", "async")
+
+# Endpoint name -> (module, function building the call's keyword arguments from the session id)
+ENDPOINTS: dict[str, tuple[Any, Callable[[Any], dict[str, Any]]]] = {
+    "navigate_browser": (navigate_browser, lambda session_id: {
+        "session_id": session_id, "body": NavigateBrowserBody(url="https://example.com")}),
+    "click_element": (click_element, lambda session_id: {
+        "session_id": session_id, "body": ClickElementBody(selector="the first search result")}),
+    "get_session_status": (get_session_status, lambda session_id: {"session_id": session_id}),
+    "list_browser_sessions": (list_browser_sessions, lambda session_id: {}),
+    "scrape_page": (scrape_page, lambda session_id: {"session_id": session_id, "body": ScrapePageBody()}),
+    "take_screenshot": (take_screenshot, lambda session_id: {"session_id": session_id, "body": TakeScreenshotBody()}),
+}
+
+TOKEN = "loadtest"
+
+
+@define
+class LoadTestResult:
+    """ Outcome of a load test run
+
+        Attributes:
+            mode (str): One of ``MODES``
+            endpoint (str): Endpoint that was called
+            latencies (list[float]): Seconds taken by each request, in completion order
+            errors (int): Requests that raised or were not answered with a 200
+            wall_time (float): Seconds from the first request to the last response
+    """
+
+    mode: str
+    endpoint: str
+    latencies: list[float] = field(factory=list)
+    errors: int = 0
+    wall_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Requests per second"""
+        return len(self.latencies) / self.wall_time if self.wall_time else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Nearest-rank percentile of the latencies, in seconds"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+    def summary(self) -> str:
+        return (
+            f"{self.mode:>6} {self.endpoint}: {len(self.latencies)} requests, {self.errors} errors "
+            f"in {self.wall_time:.2f}s, {self.throughput:.0f} req/s, "
+            f"p50 {self.percentile(50) * 1000:.2f}ms p95 {self.percentile(95) * 1000:.2f}ms "
+            f"p99 {self.percentile(99) * 1000:.2f}ms"
+        )
+
+
+def run_load_test(
+    mode: str = "pooled",
+    *,
+    endpoint: str = "navigate_browser",
+    requests: int = 1000,
+    concurrency: int = 10,
+    config: Optional[MockConfig] = None,
+    socket: bool = False,
+) -> LoadTestResult:
+    """Send ``requests`` calls to ``endpoint`` of a fresh mock API and time each of them
+
+    Args:
+        mode: ``"sync"``, ``"pooled"`` or ``"async"``, see the module docstring
+        endpoint: Name of the endpoint to call, a key of ``ENDPOINTS``
+        requests: Number of calls to make
+        concurrency: Number of worker threads or tasks
+        config: Behaviour of the mock API, its defaults when omitted
+        socket: Serve the mock API on a local socket instead of calling it in memory
+
+    Returns:
+        LoadTestResult: Latencies, errors and wall time of the run
+
+    Raises:
+        ValueError: If ``mode`` or ``endpoint`` is unknown
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {', '.join(MODES)}")
+    if endpoint not in ENDPOINTS:
+        raise ValueError(f"Unknown endpoint {endpoint!r}, expected one of {', '.join(ENDPOINTS)}")
+    api = MockAPI(config)
+    with ExitStack() as stack:
+        if socket:
+            base_url = stack.enter_context(serve(api))
+
+            def new_client() -> AuthenticatedClient:
+                return AuthenticatedClient(base_url=base_url, token=TOKEN)
+        else:
+            def new_client() -> AuthenticatedClient:
+                return AuthenticatedClient(base_url="http://mock", token=TOKEN, httpx_args={
+                    "transport": api.async_transport() if mode == "async" else api.transport()})
+
+        module, arguments = ENDPOINTS[endpoint]
+        kwargs = arguments(api.create_session())
+        result = LoadTestResult(mode, endpoint)
+        if mode == "async":
+            asyncio.run(_run_async(module, kwargs, new_client(), requests, concurrency, result))
+        else:
+            _run_threads(module, kwargs, new_client, mode == "pooled", requests, concurrency, result)
+    return result
+
+
+def _run_threads(module: Any, kwargs: dict[str, Any], new_client: Callable[[], AuthenticatedClient],
+                 pooled: bool, requests: int, concurrency: int, result: LoadTestResult) -> None:
+    shared = new_client() if pooled else None
+    lock = threading.Lock()
+
+    def call(_: int) -> None:
+        started = time.perf_counter()
+        try:
+            if shared is not None:
+                response = module.sync_detailed(client=shared, **kwargs)
+            else:
+                with new_client() as client:
+                    response = module.sync_detailed(client=client, **kwargs)
+            ok = response.status_code == 200
+        except Exception:
+            ok = False
+        latency = time.perf_counter() - started
+        with lock:
+            result.latencies.append(latency)
+            result.errors += not ok
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(call, range(requests)))
+    result.wall_time = time.perf_counter() - started
+    if shared is not None:
+        shared.get_httpx_client().close()
+
+
+async def _run_async(module: Any, kwargs: dict[str, Any], client: AuthenticatedClient, requests: int,
+                     concurrency: int, result: LoadTestResult) -> None:
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                response = await module.asyncio_detailed(client=client, **kwargs)
+                ok = response.status_code == 200
+            except Exception:
+                ok = False
+            result.latencies.append(time.perf_counter() - started)
+            result.errors += not ok
+
+    started = time.perf_counter()
+    async with client:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.wall_time = time.perf_counter() - started
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aidolon_browser_client.mock.loadtest", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=(*MODES, "all"), default="all")
+    parser.add_argument("--endpoint", choices=tuple(ENDPOINTS), default="navigate_browser")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds the mock API waits before answering")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random wait of up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with a 500")
+    parser.add_argument("--payload-size", type=int, default=1024, help="bytes of content in extraction responses")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--socket", action="store_true", help="serve the mock API on a local socket")
+    args = parser.parse_args(argv)
+
+    config = MockConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        payload_size=args.payload_size, seed=args.seed)
+    for mode in MODES if args.mode == "all" else (args.mode,):
+        result = run_load_test(mode, endpoint=args.endpoint, requests=args.requests,
+                               concurrency=args.concurrency, config=config, socket=args.socket)
+        print(result.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
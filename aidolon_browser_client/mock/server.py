@@ -0,0 +1,404 @@
+""" An in-process stand-in for the Aidolon API implementing every route under ``api/``
+
+``MockAPI`` keeps sessions in memory and answers like the API. It can be used without a network through
+``transport()``/``async_transport()`` (``httpx.MockTransport``), as an ASGI application (``httpx.ASGITransport``,
+uvicorn, ...) or on a real local socket with ``serve()``. Requests authenticated with ``MOCK_TOKEN`` get the
+API's canned example responses and may use any session id, like the API's own mock mode.
+"""
+
+import asyncio
+import base64
+import datetime
+import json
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
+from urllib.parse import parse_qsl
+
+import httpx
+from attrs import define, field
+
+from aidolon_browser_client.endpoints import resolve_endpoint, session_id_from_path
+
+MOCK_TOKEN = "give-me-mock-data"
+
+AUTH_HEADER = "x-api-key"
+
+# Values the API returns in mock mode, whatever the request asked for
+CANNED = {
+    "click_element": {"selector": "the first search result"},
+    "type_text": {"selector": "the search box", "text": "browser automation api"},
+    "press_key": {"selector": "the search input"},
+    "drag_and_drop": {"source_selector": "the first block", "target_selector": "the third block"},
+    "scrape_information": {"description": "the page title and main content"},
+}
+
+
+@define
+class MockConfig:
+    """ How the mock API behaves
+
+        Attributes:
+            latency (float): Seconds every response is delayed by
+            jitter (float): Extra random delay of up to this many seconds
+            error_rate (float): Fraction of requests, between 0 and 1, answered with a 500 ``Error``
+            payload_size (int): Size in bytes of the page content, screenshots and PDFs in content extraction responses
+            seed (Optional[int]): Seed for the random delays and errors, for reproducible runs
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    payload_size: int = 1024
+    seed: Optional[int] = None
+
+
+@define
+class _Session:
+    session_id: str
+    created_at: str
+    timeout: int
+    status: str = "active"
+    url: str = "about:blank"
+    last_active_at: Optional[str] = None
+    closed_at: Optional[str] = None
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+def _error(status_code: int, error_code: str, message: str) -> tuple[int, dict]:
+    return status_code, {"success": False, "error": message, "error_code": error_code}
+
+
+class MockAPI:
+    """The mock API: routes, sessions and the configured latency, errors and payloads
+
+    Safe to use from several threads and event loops at once.
+    """
+
+    def __init__(self, config: Optional[MockConfig] = None, **options: Any):
+        self.config = config if config is not None else MockConfig(**options)
+        self.requests = 0
+        self._sessions: dict[str, _Session] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(self.config.seed)
+
+    # Request handling
+
+    def handle(self, method: str, path: str, headers: Any, body: bytes,
+               query: Optional[dict[str, str]] = None) -> tuple[int, dict]:
+        """Answer one request: (status code, JSON body). ``headers`` is any case-insensitive mapping."""
+        with self._lock:
+            self.requests += 1
+            fail = self.config.error_rate > 0 and self._random.random() < self.config.error_rate
+        endpoint = resolve_endpoint(method, path)
+        if endpoint is None:
+            return _error(404, "NOT_FOUND", f"No route for {method} {path}")
+        token = headers.get(AUTH_HEADER)
+        if not token:
+            return _error(401, "UNAUTHORIZED", "API key is missing")
+        if fail:
+            return _error(500, "INTERNAL_ERROR", "Injected mock failure")
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return _error(400, "INVALID_REQUEST", "Request body is not valid JSON")
+        mock_mode = token == MOCK_TOKEN
+        session_id = session_id_from_path(path)
+        session = None
+        if session_id is not None:
+            session = self._session(session_id, mock_mode)
+            if session is None:
+                return _error(404, "SESSION_NOT_FOUND", f"Session {session_id} not found")
+            if session.status != "active" and endpoint.name != "get_session_status":
+                # Like the API, a closed session only still reports its status
+                return _error(404, "SESSION_NOT_ACTIVE", f"Session {session_id} is not active")
+            session.last_active_at = _now()
+        return getattr(self, f"_{endpoint.name}")(session, payload, query or {}, mock_mode)
+
+    def delay(self) -> float:
+        """Seconds to wait before answering the next request"""
+        if not self.config.jitter:
+            return self.config.latency
+        with self._lock:
+            return self.config.latency + self._random.uniform(0, self.config.jitter)
+
+    def _session(self, session_id: str, mock_mode: bool) -> Optional[_Session]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None and mock_mode:
+                session = self._sessions[session_id] = _Session(session_id, _now(), 300)
+            return session
+
+    # Direct access for test setup
+
+    def create_session(self, timeout: int = 300) -> str:
+        """Open a session directly, bypassing latency and injected errors, and return its id"""
+        session = _Session(str(uuid.uuid4()), _now(), timeout)
+        with self._lock:
+            self._sessions[session.session_id] = session
+        return session.session_id
+
+    # Routes, named after the endpoint modules
+
+    def _create_browser_session(self, session, payload, query, mock_mode):
+        session = self._sessions[self.create_session(payload.get("timeout", 300))]
+        return 200, {
+            "success": True,
+            "session_id": session.session_id,
+            "embed_url": f"https://mock.aidolons.com/embed/{session.session_id}",
+            "status": session.status,
+            "created_at": session.created_at,
+            "live_session": self._live_session(session),
+        }
+
+    def _list_browser_sessions(self, session, payload, query, mock_mode):
+        status = query.get("status")
+        with self._lock:
+            sessions = [s for s in self._sessions.values() if status is None or s.status == status]
+        return 200, {
+            "success": True,
+            "sessions": [self._session_info(s) for s in sessions],
+            "count": len(sessions),
+            "filtered_by": status or "all",
+        }
+
+    def _get_session_status(self, session, payload, query, mock_mode):
+        return 200, {"success": True, **self._session_info(session)}
+
+    def _close_browser_session(self, session, payload, query, mock_mode):
+        session.status = "closed"
+        session.closed_at = _now()
+        return 200, {"success": True, "session_id": session.session_id, "status": "closed"}
+
+    def _close_all_browser_sessions(self, session, payload, query, mock_mode):
+        closed = 0
+        with self._lock:
+            for s in self._sessions.values():
+                if s.status == "active":
+                    s.status, s.closed_at = "closed", _now()
+                    closed += 1
+        return 200, {"success": True, "closed_count": closed, "message": f"Closed {closed} sessions"}
+
+    def _update_session_timeout(self, session, payload, query, mock_mode):
+        timeout = payload.get("timeout")
+        if not isinstance(timeout, int) or timeout <= 0:
+            return _error(400, "INVALID_TIMEOUT", "timeout must be a positive integer")
+        session.timeout = timeout
+        return 200, {"success": True, "session_id": session.session_id, "timeout": timeout}
+
+    def _get_browser_context(self, session, payload, query, mock_mode):
+        return 200, {"success": True, "context": {
+            "cookies": [{"name": "session", "value": "mock", "domain": "example.com", "path": "/"}],
+            "localStorage": {}, "sessionStorage": {}, "userAgent": "Mozilla/5.0 (Aidolon mock)",
+        }}
+
+    def _navigate_browser(self, session, payload, query, mock_mode):
+        if "url" not in payload:
+            return _error(400, "INVALID_REQUEST", "url is required")
+        session.url = payload["url"]
+        return 200, {"success": True, "action": "navigate", "url": session.url}
+
+    def _click_element(self, session, payload, query, mock_mode):
+        return self._action(payload, mock_mode, "click", "click_element", "selector")
+
+    def _type_text(self, session, payload, query, mock_mode):
+        return self._action(payload, mock_mode, "type_text", "type_text", "selector", "text")
+
+    def _press_key(self, session, payload, query, mock_mode):
+        return self._action(payload, mock_mode, "press", "press_key", "selector", "key")
+
+    def _drag_and_drop(self, session, payload, query, mock_mode):
+        return self._action(payload, mock_mode, "drag_and_drop", "drag_and_drop", "source_selector", "target_selector")
+
+    def _take_screenshot(self, session, payload, query, mock_mode):
+        return 200, {"success": True, "action": "screenshot", "data": {
+            "url": session.url, "screenshot_url": f"https://mock.aidolons.com/artifacts/{uuid.uuid4()}.png",
+        }}
+
+    def _generate_pdf(self, session, payload, query, mock_mode):
+        return 200, {"success": True, "action": "pdf", "data": {
+            "url": session.url, "pdf_url": f"https://mock.aidolons.com/artifacts/{uuid.uuid4()}.pdf",
+        }}
+
+    def _scrape_information(self, session, payload, query, mock_mode):
+        response = self._action(payload, mock_mode, "scrape_information", "scrape_information", "description")
+        if response[0] == 200:
+            response[1]["data"] = {"title": "Example Domain", "content": self._text()}
+        return response
+
+    def _scrape_page(self, session, payload, query, mock_mode):
+        formats = payload.get("format") or ["html", "text"]
+        data: dict[str, Any] = {}
+        if "html" in formats:
+            data["html"] = f"<html><body><p>{self._text()}</p></body></html>"
+        if "text" in formats:
+            data["text"] = self._text()
+        if "markdown" in formats:
+            data["markdown"] = self._text()
+        if "json" in formats:
+            data["json"] = {"title": "Example Domain"}
+        if payload.get("screenshot"):
+            data["screenshot"] = self._blob()
+        if payload.get("pdf"):
+            data["pdf"] = self._blob()
+        return 200, {"success": True, "action": "scrape", "data": data}
+
+    # Helpers
+
+    def _action(self, payload: dict, mock_mode: bool, action: str, endpoint: str, *fields: str) -> tuple[int, dict]:
+        missing = [name for name in fields if name not in payload]
+        if missing:
+            return _error(400, "INVALID_REQUEST", f"{', '.join(missing)} is required")
+        response = {"success": True, "action": action, **{name: payload[name] for name in fields}}
+        if mock_mode:
+            response.update(CANNED.get(endpoint, {}))
+        return 200, response
+
+    def _text(self) -> str:
+        sentence = "Lorem ipsum dolor sit amet. "
+        return (sentence * (self.config.payload_size // len(sentence) + 1))[:self.config.payload_size]
+
+    def _blob(self) -> str:
+        # Truncate the raw bytes, not the encoded text, so the result stays valid base64 of about payload_size chars
+        size = self.config.payload_size * 3 // 4
+        return base64.b64encode((bytes(range(256)) * (size // 256 + 1))[:size]).decode()
+
+    @staticmethod
+    def _live_session(session: _Session) -> Optional[dict]:
+        if session.status != "active":
+            return None
+        return {"url": session.url, "title": "", "is_loading": False, "viewport": {"width": 1280, "height": 720}}
+
+    def _session_info(self, session: _Session) -> dict:
+        info = {
+            "session_id": session.session_id,
+            "status": session.status,
+            "created_at": session.created_at,
+            "updated_at": session.last_active_at or session.created_at,
+            "live_session": self._live_session(session),
+        }
+        if session.last_active_at is not None:
+            info["last_active_at"] = session.last_active_at
+        if session.closed_at is not None:
+            info["closed_at"] = session.closed_at
+        return info
+
+    # Ways to serve the API
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for an ``httpx.Client``, e.g. ``AuthenticatedClient(httpx_args={"transport": api.transport()})``"""
+        def handler(request: httpx.Request) -> httpx.Response:
+            delay = self.delay()
+            if delay:
+                time.sleep(delay)
+            return self._response(request)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for an ``httpx.AsyncClient``, delaying responses without blocking the event loop"""
+        async def handler(request: httpx.Request) -> httpx.Response:
+            delay = self.delay()
+            if delay:
+                await asyncio.sleep(delay)
+            return self._response(request)
+
+        return httpx.MockTransport(handler)
+
+    def _response(self, request: httpx.Request) -> httpx.Response:
+        status_code, body = self.handle(request.method, request.url.path, request.headers, request.read(),
+                                        dict(request.url.params))
+        return httpx.Response(status_code, content=json.dumps(body).encode(),
+                              headers={"content-type": "application/json"})
+
+    async def __call__(self, scope: dict, receive: Any, send: Any) -> None:
+        """ASGI application entry point"""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        headers = httpx.Headers([(name.decode("latin-1"), value.decode("latin-1")) for name, value in scope["headers"]])
+        query = dict(parse_qsl(scope.get("query_string", b"").decode()))
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        status_code, response = self.handle(scope["method"], scope["path"], headers, body, query)
+        content = json.dumps(response).encode()
+        await send({"type": "http.response.start", "status": status_code, "headers": [
+            (b"content-type", b"application/json"), (b"content-length", str(len(content)).encode()),
+        ]})
+        await send({"type": "http.response.body", "body": content})
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    api: MockAPI
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        path, _, query = self.path.partition("?")
+        delay = self.api.delay()
+        if delay:
+            time.sleep(delay)
+        status_code, response = self.api.handle(self.command, path, httpx.Headers(dict(self.headers)), body,
+                                                dict(parse_qsl(query)))
+        content = json.dumps(response).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_DELETE = _serve
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextmanager
+def serve(api: Optional[MockAPI] = None, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+    """Serve ``api`` over HTTP/1.1 on a local socket in a background thread, yielding its base URL
+
+    Example:
+
+        with serve(MockAPI(latency=0.01)) as base_url:
+            client = AuthenticatedClient(base_url=base_url, token=MOCK_TOKEN)
+    """
+    handler = type("Handler", (_Handler,), {"api": api if api is not None else MockAPI()})
+    server = ThreadingHTTPServer((host, port), handler, bind_and_activate=False)
+    server.daemon_threads = True
+    server.request_queue_size = 128  # the default backlog of 5 drops connections under load tests
+    try:
+        server.server_bind()
+        server.server_activate()
+    except BaseException:
+        server.server_close()
+        raise
+    thread = threading.Thread(target=server.serve_forever, name="aidolon-mock-api", daemon=True)
+    thread.start()
+    try:
+        bound_host, bound_port = server.server_address[:2]
+        yield f"http://{bound_host}:{bound_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
@@ -1,56 +1,119 @@
-""" Contains all the data models used in inputs/outputs """
+""" Contains all the data models used in inputs/outputs
+
+Models are imported on first access, so importing the package does not load every model module.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .browser_context import BrowserContext
+    from .browser_context_cookies_item import BrowserContextCookiesItem
+    from .browser_context_local_storage import BrowserContextLocalStorage
+    from .browser_context_session_storage import BrowserContextSessionStorage
+    from .browser_session import BrowserSession
+    from .browser_session_live_session_type_0 import BrowserSessionLiveSessionType0
+    from .browser_session_live_session_type_0_viewport import BrowserSessionLiveSessionType0Viewport
+    from .browser_session_status import BrowserSessionStatus
+    from .click_element_body import ClickElementBody
+    from .click_element_body_wait import ClickElementBodyWait
+    from .click_element_response_200 import ClickElementResponse200
+    from .close_all_browser_sessions_response_200 import CloseAllBrowserSessionsResponse200
+    from .close_browser_session_response_200 import CloseBrowserSessionResponse200
+    from .create_browser_session_body import CreateBrowserSessionBody
+    from .create_browser_session_response_200 import CreateBrowserSessionResponse200
+    from .create_browser_session_response_200_live_session_type_0 import CreateBrowserSessionResponse200LiveSessionType0
+    from .create_browser_session_response_402 import CreateBrowserSessionResponse402
+    from .create_browser_session_response_402_details import CreateBrowserSessionResponse402Details
+    from .drag_and_drop_body import DragAndDropBody
+    from .drag_and_drop_response_200 import DragAndDropResponse200
+    from .error import Error
+    from .generate_pdf_body import GeneratePdfBody
+    from .generate_pdf_response_200 import GeneratePdfResponse200
+    from .generate_pdf_response_200_data import GeneratePdfResponse200Data
+    from .get_browser_context_response_200 import GetBrowserContextResponse200
+    from .get_session_status_response_200 import GetSessionStatusResponse200
+    from .get_session_status_response_200_live_session_type_0 import GetSessionStatusResponse200LiveSessionType0
+    from .get_session_status_response_200_status import GetSessionStatusResponse200Status
+    from .list_browser_sessions_response_200 import ListBrowserSessionsResponse200
+    from .list_browser_sessions_status import ListBrowserSessionsStatus
+    from .navigate_browser_body import NavigateBrowserBody
+    from .navigate_browser_response_200 import NavigateBrowserResponse200
+    from .press_key_body import PressKeyBody
+    from .press_key_body_wait import PressKeyBodyWait
+    from .press_key_response_200 import PressKeyResponse200
+    from .scrape_information_body import ScrapeInformationBody
+    from .scrape_information_body_level_of_detail import ScrapeInformationBodyLevelOfDetail
+    from .scrape_information_response_200 import ScrapeInformationResponse200
+    from .scrape_information_response_200_data import ScrapeInformationResponse200Data
+    from .scrape_page_body import ScrapePageBody
+    from .scrape_page_body_format_item import ScrapePageBodyFormatItem
+    from .scrape_page_response_200 import ScrapePageResponse200
+    from .scrape_page_response_200_data import ScrapePageResponse200Data
+    from .scrape_page_response_200_data_json import ScrapePageResponse200DataJson
+    from .take_screenshot_body import TakeScreenshotBody
+    from .take_screenshot_response_200 import TakeScreenshotResponse200
+    from .take_screenshot_response_200_data import TakeScreenshotResponse200Data
+    from .type_text_body import TypeTextBody
+    from .type_text_response_200 import TypeTextResponse200
+    from .update_session_timeout_body import UpdateSessionTimeoutBody
+    from .update_session_timeout_response_200 import UpdateSessionTimeoutResponse200
+
+# Model name -> module defining it
+_MODULES = {
+    "BrowserContext": "browser_context",
+    "BrowserContextCookiesItem": "browser_context_cookies_item",
+    "BrowserContextLocalStorage": "browser_context_local_storage",
+    "BrowserContextSessionStorage": "browser_context_session_storage",
+    "BrowserSession": "browser_session",
+    "BrowserSessionLiveSessionType0": "browser_session_live_session_type_0",
+    "BrowserSessionLiveSessionType0Viewport": "browser_session_live_session_type_0_viewport",
+    "BrowserSessionStatus": "browser_session_status",
+    "ClickElementBody": "click_element_body",
+    "ClickElementBodyWait": "click_element_body_wait",
+    "ClickElementResponse200": "click_element_response_200",
+    "CloseAllBrowserSessionsResponse200": "close_all_browser_sessions_response_200",
+    "CloseBrowserSessionResponse200": "close_browser_session_response_200",
+    "CreateBrowserSessionBody": "create_browser_session_body",
+    "CreateBrowserSessionResponse200": "create_browser_session_response_200",
+    "CreateBrowserSessionResponse200LiveSessionType0": "create_browser_session_response_200_live_session_type_0",
+    "CreateBrowserSessionResponse402": "create_browser_session_response_402",
+    "CreateBrowserSessionResponse402Details": "create_browser_session_response_402_details",
+    "DragAndDropBody": "drag_and_drop_body",
+    "DragAndDropResponse200": "drag_and_drop_response_200",
+    "Error": "error",
+    "GeneratePdfBody": "generate_pdf_body",
+    "GeneratePdfResponse200": "generate_pdf_response_200",
+    "GeneratePdfResponse200Data": "generate_pdf_response_200_data",
+    "GetBrowserContextResponse200": "get_browser_context_response_200",
+    "GetSessionStatusResponse200": "get_session_status_response_200",
+    "GetSessionStatusResponse200LiveSessionType0": "get_session_status_response_200_live_session_type_0",
+    "GetSessionStatusResponse200Status": "get_session_status_response_200_status",
+    "ListBrowserSessionsResponse200": "list_browser_sessions_response_200",
+    "ListBrowserSessionsStatus": "list_browser_sessions_status",
+    "NavigateBrowserBody": "navigate_browser_body",
+    "NavigateBrowserResponse200": "navigate_browser_response_200",
+    "PressKeyBody": "press_key_body",
+    "PressKeyBodyWait": "press_key_body_wait",
+    "PressKeyResponse200": "press_key_response_200",
+    "ScrapeInformationBody": "scrape_information_body",
+    "ScrapeInformationBodyLevelOfDetail": "scrape_information_body_level_of_detail",
+    "ScrapeInformationResponse200": "scrape_information_response_200",
+    "ScrapeInformationResponse200Data": "scrape_information_response_200_data",
+    "ScrapePageBody": "scrape_page_body",
+    "ScrapePageBodyFormatItem": "scrape_page_body_format_item",
+    "ScrapePageResponse200": "scrape_page_response_200",
+    "ScrapePageResponse200Data": "scrape_page_response_200_data",
+    "ScrapePageResponse200DataJson": "scrape_page_response_200_data_json",
+    "TakeScreenshotBody": "take_screenshot_body",
+    "TakeScreenshotResponse200": "take_screenshot_response_200",
+    "TakeScreenshotResponse200Data": "take_screenshot_response_200_data",
+    "TypeTextBody": "type_text_body",
+    "TypeTextResponse200": "type_text_response_200",
+    "UpdateSessionTimeoutBody": "update_session_timeout_body",
+    "UpdateSessionTimeoutResponse200": "update_session_timeout_response_200",
+}
 
-from .browser_context import BrowserContext
-from .browser_context_cookies_item import BrowserContextCookiesItem
-from .browser_context_local_storage import BrowserContextLocalStorage
-from .browser_context_session_storage import BrowserContextSessionStorage
-from .browser_session import BrowserSession
-from .browser_session_live_session_type_0 import BrowserSessionLiveSessionType0
-from .browser_session_live_session_type_0_viewport import BrowserSessionLiveSessionType0Viewport
-from .browser_session_status import BrowserSessionStatus
-from .click_element_body import ClickElementBody
-from .click_element_body_wait import ClickElementBodyWait
-from .click_element_response_200 import ClickElementResponse200
-from .close_all_browser_sessions_response_200 import CloseAllBrowserSessionsResponse200
-from .close_browser_session_response_200 import CloseBrowserSessionResponse200
-from .create_browser_session_body import CreateBrowserSessionBody
-from .create_browser_session_response_200 import CreateBrowserSessionResponse200
-from .create_browser_session_response_200_live_session_type_0 import CreateBrowserSessionResponse200LiveSessionType0
-from .create_browser_session_response_402 import CreateBrowserSessionResponse402
-from .create_browser_session_response_402_details import CreateBrowserSessionResponse402Details
-from .drag_and_drop_body import DragAndDropBody
-from .drag_and_drop_response_200 import DragAndDropResponse200
-from .error import Error
-from .generate_pdf_body import GeneratePdfBody
-from .generate_pdf_response_200 import GeneratePdfResponse200
-from .generate_pdf_response_200_data import GeneratePdfResponse200Data
-from .get_browser_context_response_200 import GetBrowserContextResponse200
-from .get_session_status_response_200 import GetSessionStatusResponse200
-from .get_session_status_response_200_live_session_type_0 import GetSessionStatusResponse200LiveSessionType0
-from .get_session_status_response_200_status import GetSessionStatusResponse200Status
-from .list_browser_sessions_response_200 import ListBrowserSessionsResponse200
-from .list_browser_sessions_status import ListBrowserSessionsStatus
-from .navigate_browser_body import NavigateBrowserBody
-from .navigate_browser_response_200 import NavigateBrowserResponse200
-from .press_key_body import PressKeyBody
-from .press_key_body_wait import PressKeyBodyWait
-from .press_key_response_200 import PressKeyResponse200
-from .scrape_information_body import ScrapeInformationBody
-from .scrape_information_body_level_of_detail import ScrapeInformationBodyLevelOfDetail
-from .scrape_information_response_200 import ScrapeInformationResponse200
-from .scrape_information_response_200_data import ScrapeInformationResponse200Data
-from .scrape_page_body import ScrapePageBody
-from .scrape_page_body_format_item import ScrapePageBodyFormatItem
-from .scrape_page_response_200 import ScrapePageResponse200
-from .scrape_page_response_200_data import ScrapePageResponse200Data
-from .scrape_page_response_200_data_json import ScrapePageResponse200DataJson
-from .take_screenshot_body import TakeScreenshotBody
-from .take_screenshot_response_200 import TakeScreenshotResponse200
-from .take_screenshot_response_200_data import TakeScreenshotResponse200Data
-from .type_text_body import TypeTextBody
-from .type_text_response_200 import TypeTextResponse200
-from .update_session_timeout_body import UpdateSessionTimeoutBody
-from .update_session_timeout_response_200 import UpdateSessionTimeoutResponse200
 
 __all__ = (
     "BrowserContext",
@@ -105,3 +168,16 @@ __all__ = (
     "UpdateSessionTimeoutBody",
     "UpdateSessionTimeoutResponse200",
 )
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
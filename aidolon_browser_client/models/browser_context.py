@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import cast
@@ -37,7 +37,7 @@ class BrowserContext:
     local_storage: Union[Unset, 'BrowserContextLocalStorage'] = UNSET
     session_storage: Union[Unset, 'BrowserContextSessionStorage'] = UNSET
     user_agent: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -127,7 +127,7 @@ class BrowserContext:
         )
 
 
-        browser_context.additional_properties = d
+        browser_context.additional_properties = d or EMPTY_PROPERTIES
         return browser_context
 
     @property
@@ -138,6 +138,8 @@ class BrowserContext:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
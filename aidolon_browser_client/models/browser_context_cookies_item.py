@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import Union
@@ -38,7 +38,7 @@ class BrowserContextCookiesItem:
     expires: Union[Unset, float] = UNSET
     http_only: Union[Unset, bool] = UNSET
     secure: Union[Unset, bool] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -108,7 +108,7 @@ class BrowserContextCookiesItem:
         )
 
 
-        browser_context_cookies_item.additional_properties = d
+        browser_context_cookies_item.additional_properties = d or EMPTY_PROPERTIES
         return browser_context_cookies_item
 
     @property
@@ -119,6 +119,8 @@ class BrowserContextCookiesItem:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
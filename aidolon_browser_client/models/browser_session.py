@@ -4,19 +4,19 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..models.browser_session_status import BrowserSessionStatus
 from ..types import UNSET, Unset
-from dateutil.parser import isoparse
+from .._dates import lazy_timestamp_fields, timestamp
 from typing import cast
 from typing import cast, Union
 from typing import Union
 from uuid import UUID
 import datetime
 
-if TYPE_CHECKING:
-  from ..models.browser_session_live_session_type_0 import BrowserSessionLiveSessionType0
+from ..models.browser_session_live_session_type_0 import BrowserSessionLiveSessionType0
+from ..types import additional_properties
 
 
 
@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="BrowserSession")
 
+_FIELDS = frozenset(("session_id", "status", "created_at", "embed_url", "updated_at", "last_active_at", "closed_at", "live_session"))
+
 
 
 @_attrs_define
@@ -48,11 +50,10 @@ class BrowserSession:
     last_active_at: Union[Unset, datetime.datetime] = UNSET
     closed_at: Union[None, Unset, datetime.datetime] = UNSET
     live_session: Union['BrowserSessionLiveSessionType0', None, Unset] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.browser_session_live_session_type_0 import BrowserSessionLiveSessionType0
         session_id = str(self.session_id)
 
         status = self.status.value
@@ -110,90 +111,35 @@ class BrowserSession:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.browser_session_live_session_type_0 import BrowserSessionLiveSessionType0
-        d = dict(src_dict)
-        session_id = UUID(d.pop("session_id"))
-
-
-
-
-        status = BrowserSessionStatus(d.pop("status"))
-
-
-
-
-        created_at = isoparse(d.pop("created_at"))
-
-
-
-
-        embed_url = d.pop("embed_url", UNSET)
-
-        _updated_at = d.pop("updated_at", UNSET)
-        updated_at: Union[Unset, datetime.datetime]
-        if isinstance(_updated_at,  Unset):
-            updated_at = UNSET
-        else:
-            updated_at = isoparse(_updated_at)
-
-
-
-
-        _last_active_at = d.pop("last_active_at", UNSET)
-        last_active_at: Union[Unset, datetime.datetime]
-        if isinstance(_last_active_at,  Unset):
-            last_active_at = UNSET
-        else:
-            last_active_at = isoparse(_last_active_at)
-
+        get = src_dict.get
 
+        updated_at = get("updated_at", UNSET)
+        if updated_at is not UNSET:
+            updated_at = timestamp(updated_at)
 
+        last_active_at = get("last_active_at", UNSET)
+        if last_active_at is not UNSET:
+            last_active_at = timestamp(last_active_at)
 
-        def _parse_closed_at(data: object) -> Union[None, Unset, datetime.datetime]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
+        closed_at = get("closed_at", UNSET)
+        if isinstance(closed_at, str):
             try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                closed_at_type_0 = isoparse(data)
-
-
-
-                return closed_at_type_0
+                closed_at = timestamp(closed_at)
             except: # noqa: E722
                 pass
-            return cast(Union[None, Unset, datetime.datetime], data)
 
-        closed_at = _parse_closed_at(d.pop("closed_at", UNSET))
-
-
-        def _parse_live_session(data: object) -> Union['BrowserSessionLiveSessionType0', None, Unset]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
+        live_session = get("live_session", UNSET)
+        if isinstance(live_session, dict):
             try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                live_session_type_0 = BrowserSessionLiveSessionType0.from_dict(data)
-
-
-
-                return live_session_type_0
+                live_session = BrowserSessionLiveSessionType0.from_dict(live_session)
             except: # noqa: E722
                 pass
-            return cast(Union['BrowserSessionLiveSessionType0', None, Unset], data)
-
-        live_session = _parse_live_session(d.pop("live_session", UNSET))
-
 
         browser_session = cls(
-            session_id=session_id,
-            status=status,
-            created_at=created_at,
-            embed_url=embed_url,
+            session_id=UUID(src_dict["session_id"]),
+            status=BrowserSessionStatus(src_dict["status"]),
+            created_at=timestamp(src_dict["created_at"]),
+            embed_url=get("embed_url", UNSET),
             updated_at=updated_at,
             last_active_at=last_active_at,
             closed_at=closed_at,
@@ -201,7 +147,7 @@ class BrowserSession:
         )
 
 
-        browser_session.additional_properties = d
+        browser_session.additional_properties = additional_properties(src_dict, _FIELDS)
         return browser_session
 
     @property
@@ -212,6 +158,8 @@ class BrowserSession:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -219,3 +167,6 @@ class BrowserSession:
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
+
+
+lazy_timestamp_fields(BrowserSession, "created_at", "updated_at", "last_active_at", "closed_at", lenient=("closed_at",))
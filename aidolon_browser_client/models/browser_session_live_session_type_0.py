@@ -4,14 +4,14 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import cast
 from typing import Union
 
-if TYPE_CHECKING:
-  from ..models.browser_session_live_session_type_0_viewport import BrowserSessionLiveSessionType0Viewport
+from ..models.browser_session_live_session_type_0_viewport import BrowserSessionLiveSessionType0Viewport
+from ..types import additional_properties
 
 
 
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="BrowserSessionLiveSessionType0")
 
+_FIELDS = frozenset(("url", "title", "is_loading", "viewport"))
+
 
 
 @_attrs_define
@@ -36,11 +38,10 @@ class BrowserSessionLiveSessionType0:
     title: Union[Unset, str] = UNSET
     is_loading: Union[Unset, bool] = UNSET
     viewport: Union[Unset, 'BrowserSessionLiveSessionType0Viewport'] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.browser_session_live_session_type_0_viewport import BrowserSessionLiveSessionType0Viewport
         url = self.url
 
         title = self.title
@@ -71,33 +72,21 @@ class BrowserSessionLiveSessionType0:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.browser_session_live_session_type_0_viewport import BrowserSessionLiveSessionType0Viewport
-        d = dict(src_dict)
-        url = d.pop("url", UNSET)
-
-        title = d.pop("title", UNSET)
-
-        is_loading = d.pop("is_loading", UNSET)
-
-        _viewport = d.pop("viewport", UNSET)
-        viewport: Union[Unset, BrowserSessionLiveSessionType0Viewport]
-        if isinstance(_viewport,  Unset):
-            viewport = UNSET
-        else:
-            viewport = BrowserSessionLiveSessionType0Viewport.from_dict(_viewport)
-
-
+        get = src_dict.get
 
+        viewport = get("viewport", UNSET)
+        if viewport is not UNSET:
+            viewport = BrowserSessionLiveSessionType0Viewport.from_dict(viewport)
 
         browser_session_live_session_type_0 = cls(
-            url=url,
-            title=title,
-            is_loading=is_loading,
+            url=get("url", UNSET),
+            title=get("title", UNSET),
+            is_loading=get("is_loading", UNSET),
             viewport=viewport,
         )
 
 
-        browser_session_live_session_type_0.additional_properties = d
+        browser_session_live_session_type_0.additional_properties = additional_properties(src_dict, _FIELDS)
         return browser_session_live_session_type_0
 
     @property
@@ -108,6 +97,8 @@ class BrowserSessionLiveSessionType0:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
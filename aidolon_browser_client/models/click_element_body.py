@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..models.click_element_body_wait import ClickElementBodyWait
 from ..types import UNSET, Unset
@@ -34,7 +34,7 @@ class ClickElementBody:
 
     selector: str
     wait: Union[Unset, ClickElementBodyWait] = ClickElementBodyWait.AUTO
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -79,7 +79,7 @@ class ClickElementBody:
         )
 
 
-        click_element_body.additional_properties = d
+        click_element_body.additional_properties = d or EMPTY_PROPERTIES
         return click_element_body
 
     @property
@@ -90,6 +90,8 @@ class ClickElementBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
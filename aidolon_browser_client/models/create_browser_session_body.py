@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import cast
@@ -33,7 +33,7 @@ class CreateBrowserSessionBody:
     timeout: Union[Unset, int] = 300
     visible: Union[Unset, bool] = True
     context: Union[Unset, 'BrowserContext'] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -87,7 +87,7 @@ class CreateBrowserSessionBody:
         )
 
 
-        create_browser_session_body.additional_properties = d
+        create_browser_session_body.additional_properties = d or EMPTY_PROPERTIES
         return create_browser_session_body
 
     @property
@@ -98,6 +98,8 @@ class CreateBrowserSessionBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
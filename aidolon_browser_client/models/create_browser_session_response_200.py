@@ -4,18 +4,18 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
-from dateutil.parser import isoparse
+from .._dates import lazy_timestamp_fields, timestamp
 from typing import cast
 from typing import cast, Union
 from typing import Union
 from uuid import UUID
 import datetime
 
-if TYPE_CHECKING:
-  from ..models.create_browser_session_response_200_live_session_type_0 import CreateBrowserSessionResponse200LiveSessionType0
+from ..types import additional_properties
+from ..models.create_browser_session_response_200_live_session_type_0 import CreateBrowserSessionResponse200LiveSessionType0
 
 
 
@@ -23,6 +23,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="CreateBrowserSessionResponse200")
 
+_FIELDS = frozenset(("success", "session_id", "embed_url", "status", "created_at", "live_session"))
+
 
 
 @_attrs_define
@@ -44,11 +46,10 @@ class CreateBrowserSessionResponse200:
     status: Union[Unset, str] = UNSET
     created_at: Union[Unset, datetime.datetime] = UNSET
     live_session: Union['CreateBrowserSessionResponse200LiveSessionType0', None, Unset] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.create_browser_session_response_200_live_session_type_0 import CreateBrowserSessionResponse200LiveSessionType0
         success = self.success
 
         session_id: Union[Unset, str] = UNSET
@@ -95,65 +96,34 @@ class CreateBrowserSessionResponse200:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.create_browser_session_response_200_live_session_type_0 import CreateBrowserSessionResponse200LiveSessionType0
-        d = dict(src_dict)
-        success = d.pop("success", UNSET)
-
-        _session_id = d.pop("session_id", UNSET)
-        session_id: Union[Unset, UUID]
-        if isinstance(_session_id,  Unset):
-            session_id = UNSET
-        else:
-            session_id = UUID(_session_id)
-
-
-
-
-        embed_url = d.pop("embed_url", UNSET)
-
-        status = d.pop("status", UNSET)
-
-        _created_at = d.pop("created_at", UNSET)
-        created_at: Union[Unset, datetime.datetime]
-        if isinstance(_created_at,  Unset):
-            created_at = UNSET
-        else:
-            created_at = isoparse(_created_at)
-
+        get = src_dict.get
 
+        session_id = get("session_id", UNSET)
+        if session_id is not UNSET:
+            session_id = UUID(session_id)
 
+        created_at = get("created_at", UNSET)
+        if created_at is not UNSET:
+            created_at = timestamp(created_at)
 
-        def _parse_live_session(data: object) -> Union['CreateBrowserSessionResponse200LiveSessionType0', None, Unset]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
+        live_session = get("live_session", UNSET)
+        if isinstance(live_session, dict):
             try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                live_session_type_0 = CreateBrowserSessionResponse200LiveSessionType0.from_dict(data)
-
-
-
-                return live_session_type_0
+                live_session = CreateBrowserSessionResponse200LiveSessionType0.from_dict(live_session)
             except: # noqa: E722
                 pass
-            return cast(Union['CreateBrowserSessionResponse200LiveSessionType0', None, Unset], data)
-
-        live_session = _parse_live_session(d.pop("live_session", UNSET))
-
 
         create_browser_session_response_200 = cls(
-            success=success,
+            success=get("success", UNSET),
             session_id=session_id,
-            embed_url=embed_url,
-            status=status,
+            embed_url=get("embed_url", UNSET),
+            status=get("status", UNSET),
             created_at=created_at,
             live_session=live_session,
         )
 
 
-        create_browser_session_response_200.additional_properties = d
+        create_browser_session_response_200.additional_properties = additional_properties(src_dict, _FIELDS)
         return create_browser_session_response_200
 
     @property
@@ -164,6 +134,8 @@ class CreateBrowserSessionResponse200:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -171,3 +143,6 @@ class CreateBrowserSessionResponse200:
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
+
+
+lazy_timestamp_fields(CreateBrowserSessionResponse200, "created_at")
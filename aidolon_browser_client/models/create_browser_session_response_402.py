@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import cast
@@ -35,7 +35,7 @@ class CreateBrowserSessionResponse402:
     error: str
     error_code: str
     details: Union[Unset, 'CreateBrowserSessionResponse402Details'] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -93,7 +93,7 @@ class CreateBrowserSessionResponse402:
         )
 
 
-        create_browser_session_response_402.additional_properties = d
+        create_browser_session_response_402.additional_properties = d or EMPTY_PROPERTIES
         return create_browser_session_response_402
 
     @property
@@ -104,6 +104,8 @@ class CreateBrowserSessionResponse402:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
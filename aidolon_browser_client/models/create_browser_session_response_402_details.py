@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import Union
@@ -30,7 +30,7 @@ class CreateBrowserSessionResponse402Details:
     required_credits: Union[Unset, float] = UNSET
     current_balance: Union[Unset, float] = UNSET
     missing_credits: Union[Unset, float] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -72,7 +72,7 @@ class CreateBrowserSessionResponse402Details:
         )
 
 
-        create_browser_session_response_402_details.additional_properties = d
+        create_browser_session_response_402_details.additional_properties = d or EMPTY_PROPERTIES
         return create_browser_session_response_402_details
 
     @property
@@ -83,6 +83,8 @@ class CreateBrowserSessionResponse402Details:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 
 
@@ -26,7 +26,7 @@ class DragAndDropBody:
 
     source_selector: str
     target_selector: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -59,7 +59,7 @@ class DragAndDropBody:
         )
 
 
-        drag_and_drop_body.additional_properties = d
+        drag_and_drop_body.additional_properties = d or EMPTY_PROPERTIES
         return drag_and_drop_body
 
     @property
@@ -70,6 +70,8 @@ class DragAndDropBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,19 +4,19 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..models.get_session_status_response_200_status import GetSessionStatusResponse200Status
 from ..types import UNSET, Unset
-from dateutil.parser import isoparse
+from .._dates import lazy_timestamp_fields, timestamp
 from typing import cast
 from typing import cast, Union
 from typing import Union
 from uuid import UUID
 import datetime
 
-if TYPE_CHECKING:
-  from ..models.get_session_status_response_200_live_session_type_0 import GetSessionStatusResponse200LiveSessionType0
+from ..types import additional_properties
+from ..models.get_session_status_response_200_live_session_type_0 import GetSessionStatusResponse200LiveSessionType0
 
 
 
@@ -24,6 +24,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="GetSessionStatusResponse200")
 
+_FIELDS = frozenset(("success", "session_id", "status", "created_at", "updated_at", "last_active_at", "closed_at", "live_session"))
+
 
 
 @_attrs_define
@@ -49,11 +51,10 @@ class GetSessionStatusResponse200:
     last_active_at: Union[Unset, datetime.datetime] = UNSET
     closed_at: Union[Unset, datetime.datetime] = UNSET
     live_session: Union['GetSessionStatusResponse200LiveSessionType0', None, Unset] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.get_session_status_response_200_live_session_type_0 import GetSessionStatusResponse200LiveSessionType0
         success = self.success
 
         session_id: Union[Unset, str] = UNSET
@@ -117,92 +118,41 @@ class GetSessionStatusResponse200:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.get_session_status_response_200_live_session_type_0 import GetSessionStatusResponse200LiveSessionType0
-        d = dict(src_dict)
-        success = d.pop("success", UNSET)
-
-        _session_id = d.pop("session_id", UNSET)
-        session_id: Union[Unset, UUID]
-        if isinstance(_session_id,  Unset):
-            session_id = UNSET
-        else:
-            session_id = UUID(_session_id)
-
-
-
-
-        _status = d.pop("status", UNSET)
-        status: Union[Unset, GetSessionStatusResponse200Status]
-        if isinstance(_status,  Unset):
-            status = UNSET
-        else:
-            status = GetSessionStatusResponse200Status(_status)
-
-
-
-
-        _created_at = d.pop("created_at", UNSET)
-        created_at: Union[Unset, datetime.datetime]
-        if isinstance(_created_at,  Unset):
-            created_at = UNSET
-        else:
-            created_at = isoparse(_created_at)
-
-
-
-
-        _updated_at = d.pop("updated_at", UNSET)
-        updated_at: Union[Unset, datetime.datetime]
-        if isinstance(_updated_at,  Unset):
-            updated_at = UNSET
-        else:
-            updated_at = isoparse(_updated_at)
-
-
-
-
-        _last_active_at = d.pop("last_active_at", UNSET)
-        last_active_at: Union[Unset, datetime.datetime]
-        if isinstance(_last_active_at,  Unset):
-            last_active_at = UNSET
-        else:
-            last_active_at = isoparse(_last_active_at)
-
+        get = src_dict.get
 
+        session_id = get("session_id", UNSET)
+        if session_id is not UNSET:
+            session_id = UUID(session_id)
 
+        status = get("status", UNSET)
+        if status is not UNSET:
+            status = GetSessionStatusResponse200Status(status)
 
-        _closed_at = d.pop("closed_at", UNSET)
-        closed_at: Union[Unset, datetime.datetime]
-        if isinstance(_closed_at,  Unset):
-            closed_at = UNSET
-        else:
-            closed_at = isoparse(_closed_at)
+        created_at = get("created_at", UNSET)
+        if created_at is not UNSET:
+            created_at = timestamp(created_at)
 
+        updated_at = get("updated_at", UNSET)
+        if updated_at is not UNSET:
+            updated_at = timestamp(updated_at)
 
+        last_active_at = get("last_active_at", UNSET)
+        if last_active_at is not UNSET:
+            last_active_at = timestamp(last_active_at)
 
+        closed_at = get("closed_at", UNSET)
+        if closed_at is not UNSET:
+            closed_at = timestamp(closed_at)
 
-        def _parse_live_session(data: object) -> Union['GetSessionStatusResponse200LiveSessionType0', None, Unset]:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
+        live_session = get("live_session", UNSET)
+        if isinstance(live_session, dict):
             try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                live_session_type_0 = GetSessionStatusResponse200LiveSessionType0.from_dict(data)
-
-
-
-                return live_session_type_0
+                live_session = GetSessionStatusResponse200LiveSessionType0.from_dict(live_session)
             except: # noqa: E722
                 pass
-            return cast(Union['GetSessionStatusResponse200LiveSessionType0', None, Unset], data)
-
-        live_session = _parse_live_session(d.pop("live_session", UNSET))
-
 
         get_session_status_response_200 = cls(
-            success=success,
+            success=get("success", UNSET),
             session_id=session_id,
             status=status,
             created_at=created_at,
@@ -213,7 +163,7 @@ class GetSessionStatusResponse200:
         )
 
 
-        get_session_status_response_200.additional_properties = d
+        get_session_status_response_200.additional_properties = additional_properties(src_dict, _FIELDS)
         return get_session_status_response_200
 
     @property
@@ -224,6 +174,8 @@ class GetSessionStatusResponse200:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -231,3 +183,6 @@ class GetSessionStatusResponse200:
 
     def __contains__(self, key: str) -> bool:
         return key in self.additional_properties
+
+
+lazy_timestamp_fields(GetSessionStatusResponse200, "created_at", "updated_at", "last_active_at", "closed_at")
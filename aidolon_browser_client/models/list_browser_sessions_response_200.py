@@ -4,14 +4,14 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import cast
 from typing import Union
 
-if TYPE_CHECKING:
-  from ..models.browser_session import BrowserSession
+from ..types import additional_properties
+from ..models.browser_session import BrowserSession
 
 
 
@@ -19,6 +19,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="ListBrowserSessionsResponse200")
 
+_FIELDS = frozenset(("success", "sessions", "count", "filtered_by"))
+
 
 
 @_attrs_define
@@ -35,11 +37,10 @@ class ListBrowserSessionsResponse200:
     sessions: Union[Unset, list['BrowserSession']] = UNSET
     count: Union[Unset, int] = UNSET
     filtered_by: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.browser_session import BrowserSession
         success = self.success
 
         sessions: Union[Unset, list[dict[str, Any]]] = UNSET
@@ -75,33 +76,17 @@ class ListBrowserSessionsResponse200:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.browser_session import BrowserSession
-        d = dict(src_dict)
-        success = d.pop("success", UNSET)
-
-        sessions = []
-        _sessions = d.pop("sessions", UNSET)
-        for sessions_item_data in (_sessions or []):
-            sessions_item = BrowserSession.from_dict(sessions_item_data)
-
-
-
-            sessions.append(sessions_item)
-
-
-        count = d.pop("count", UNSET)
-
-        filtered_by = d.pop("filtered_by", UNSET)
-
+        get = src_dict.get
+        browser_session_from_dict = BrowserSession.from_dict
         list_browser_sessions_response_200 = cls(
-            success=success,
-            sessions=sessions,
-            count=count,
-            filtered_by=filtered_by,
+            success=get("success", UNSET),
+            sessions=[browser_session_from_dict(sessions_item_data) for sessions_item_data in (get("sessions") or [])],
+            count=get("count", UNSET),
+            filtered_by=get("filtered_by", UNSET),
         )
 
 
-        list_browser_sessions_response_200.additional_properties = d
+        list_browser_sessions_response_200.additional_properties = additional_properties(src_dict, _FIELDS)
         return list_browser_sessions_response_200
 
     @property
@@ -112,6 +97,8 @@ class ListBrowserSessionsResponse200:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
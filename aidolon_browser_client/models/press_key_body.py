@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..models.press_key_body_wait import PressKeyBodyWait
 from ..types import UNSET, Unset
@@ -36,7 +36,7 @@ class PressKeyBody:
     selector: str
     key: str
     wait: Union[Unset, PressKeyBodyWait] = PressKeyBodyWait.AUTO
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -87,7 +87,7 @@ class PressKeyBody:
         )
 
 
-        press_key_body.additional_properties = d
+        press_key_body.additional_properties = d or EMPTY_PROPERTIES
         return press_key_body
 
     @property
@@ -98,6 +98,8 @@ class PressKeyBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
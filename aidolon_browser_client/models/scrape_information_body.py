@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..models.scrape_information_body_level_of_detail import ScrapeInformationBodyLevelOfDetail
 from ..types import UNSET, Unset
@@ -33,7 +33,7 @@ class ScrapeInformationBody:
 
     description: str
     level_of_detail: Union[Unset, ScrapeInformationBodyLevelOfDetail] = ScrapeInformationBodyLevelOfDetail.FULL
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -78,7 +78,7 @@ class ScrapeInformationBody:
         )
 
 
-        scrape_information_body.additional_properties = d
+        scrape_information_body.additional_properties = d or EMPTY_PROPERTIES
         return scrape_information_body
 
     @property
@@ -89,6 +89,8 @@ class ScrapeInformationBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
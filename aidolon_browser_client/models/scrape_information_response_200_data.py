@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 
 
@@ -22,7 +22,7 @@ class ScrapeInformationResponse200Data:
 
      """
 
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -41,7 +41,7 @@ class ScrapeInformationResponse200Data:
         )
 
 
-        scrape_information_response_200_data.additional_properties = d
+        scrape_information_response_200_data.additional_properties = d or EMPTY_PROPERTIES
         return scrape_information_response_200_data
 
     @property
@@ -52,6 +52,8 @@ class ScrapeInformationResponse200Data:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..models.scrape_page_body_format_item import ScrapePageBodyFormatItem
 from ..types import UNSET, Unset
@@ -34,7 +34,7 @@ class ScrapePageBody:
     delay: Union[Unset, float] = UNSET
     screenshot: Union[Unset, bool] = False
     pdf: Union[Unset, bool] = False
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -98,7 +98,7 @@ class ScrapePageBody:
         )
 
 
-        scrape_page_body.additional_properties = d
+        scrape_page_body.additional_properties = d or EMPTY_PROPERTIES
         return scrape_page_body
 
     @property
@@ -109,6 +109,8 @@ class ScrapePageBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,9 +4,11 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
+from .. import _base64
 from ..types import UNSET, Unset
+import os
 from typing import cast
 from typing import Union
 
@@ -39,7 +41,7 @@ class ScrapePageResponse200Data:
     markdown: Union[Unset, str] = UNSET
     screenshot: Union[Unset, str] = UNSET
     pdf: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -114,9 +116,57 @@ class ScrapePageResponse200Data:
         )
 
 
-        scrape_page_response_200_data.additional_properties = d
+        scrape_page_response_200_data.additional_properties = d or EMPTY_PROPERTIES
         return scrape_page_response_200_data
 
+    def screenshot_bytes(self) -> Optional[bytes]:
+        """ Decode the base64 screenshot, None if it was not requested """
+        if isinstance(self.screenshot, Unset):
+            return None
+        return _base64.decode(self.screenshot)
+
+    def pdf_bytes(self) -> Optional[bytes]:
+        """ Decode the base64 PDF, None if it was not requested """
+        if isinstance(self.pdf, Unset):
+            return None
+        return _base64.decode(self.pdf)
+
+    def screenshot_view(self) -> Optional[memoryview]:
+        """ Decode the base64 screenshot to a memoryview that can be sliced without copying, None if it was not requested """
+        if isinstance(self.screenshot, Unset):
+            return None
+        return _base64.decode_view(self.screenshot)
+
+    def pdf_view(self) -> Optional[memoryview]:
+        """ Decode the base64 PDF to a memoryview that can be sliced without copying, None if it was not requested """
+        if isinstance(self.pdf, Unset):
+            return None
+        return _base64.decode_view(self.pdf)
+
+    def write_screenshot(self, destination: Union[str, "os.PathLike[str]", BinaryIO], release: bool = False) -> int:
+        """ Decode the base64 screenshot into a file path or binary file object in chunks, returning the bytes written.
+
+        With ``release`` the encoded string is dropped from this object afterwards so it can be garbage collected.
+        """
+        if isinstance(self.screenshot, Unset):
+            raise ValueError("No screenshot in this response, request it with ScrapePageBody(screenshot=True)")
+        written = _base64.decode_to(self.screenshot, destination)
+        if release:
+            self.screenshot = UNSET
+        return written
+
+    def write_pdf(self, destination: Union[str, "os.PathLike[str]", BinaryIO], release: bool = False) -> int:
+        """ Decode the base64 PDF into a file path or binary file object in chunks, returning the bytes written.
+
+        With ``release`` the encoded string is dropped from this object afterwards so it can be garbage collected.
+        """
+        if isinstance(self.pdf, Unset):
+            raise ValueError("No PDF in this response, request it with ScrapePageBody(pdf=True)")
+        written = _base64.decode_to(self.pdf, destination)
+        if release:
+            self.pdf = UNSET
+        return written
+
     @property
     def additional_keys(self) -> list[str]:
         return list(self.additional_properties.keys())
@@ -125,6 +175,8 @@ class ScrapePageResponse200Data:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import Union
@@ -28,7 +28,7 @@ class TakeScreenshotResponse200Data:
 
     url: Union[Unset, str] = UNSET
     screenshot_url: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -63,7 +63,7 @@ class TakeScreenshotResponse200Data:
         )
 
 
-        take_screenshot_response_200_data.additional_properties = d
+        take_screenshot_response_200_data.additional_properties = d or EMPTY_PROPERTIES
         return take_screenshot_response_200_data
 
     @property
@@ -74,6 +74,8 @@ class TakeScreenshotResponse200Data:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import Union
@@ -32,7 +32,7 @@ class TypeTextResponse200:
     action: Union[Unset, str] = UNSET
     selector: Union[Unset, str] = UNSET
     text: Union[Unset, str] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -81,7 +81,7 @@ class TypeTextResponse200:
         )
 
 
-        type_text_response_200.additional_properties = d
+        type_text_response_200.additional_properties = d or EMPTY_PROPERTIES
         return type_text_response_200
 
     @property
@@ -92,6 +92,8 @@ class TypeTextResponse200:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
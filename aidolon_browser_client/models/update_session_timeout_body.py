@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 
 
@@ -24,7 +24,7 @@ class UpdateSessionTimeoutBody:
      """
 
     timeout: int
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -51,7 +51,7 @@ class UpdateSessionTimeoutBody:
         )
 
 
-        update_session_timeout_body.additional_properties = d
+        update_session_timeout_body.additional_properties = d or EMPTY_PROPERTIES
         return update_session_timeout_body
 
     @property
@@ -62,6 +62,8 @@ class UpdateSessionTimeoutBody:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
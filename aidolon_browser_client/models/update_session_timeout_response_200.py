@@ -4,7 +4,7 @@ from typing import Any, TypeVar, Optional, BinaryIO, TextIO, TYPE_CHECKING
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, Unset, EMPTY_PROPERTIES
 
 from ..types import UNSET, Unset
 from typing import Union
@@ -31,7 +31,7 @@ class UpdateSessionTimeoutResponse200:
     success: Union[Unset, bool] = UNSET
     session_id: Union[Unset, UUID] = UNSET
     timeout: Union[Unset, int] = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    additional_properties: dict[str, Any] = _attrs_field(init=False, default=EMPTY_PROPERTIES)
 
 
     def to_dict(self) -> dict[str, Any]:
@@ -83,7 +83,7 @@ class UpdateSessionTimeoutResponse200:
         )
 
 
-        update_session_timeout_response_200.additional_properties = d
+        update_session_timeout_response_200.additional_properties = d or EMPTY_PROPERTIES
         return update_session_timeout_response_200
 
     @property
@@ -94,6 +94,8 @@ class UpdateSessionTimeoutResponse200:
         return self.additional_properties[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
+        if self.additional_properties is EMPTY_PROPERTIES:
+            self.additional_properties = {}
         self.additional_properties[key] = value
 
     def __delitem__(self, key: str) -> None:
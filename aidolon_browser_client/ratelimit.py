@@ -0,0 +1,344 @@
+""" Client-side rate limiting and in-flight caps per endpoint group, as httpx transports """
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Mapping, Optional
+
+import httpx
+from attrs import define
+
+from .endpoints import GROUPS, resolve_endpoint
+from .metrics import _AsyncTimedStream, _TimedStream
+from .retry import _parse_retry_after
+
+THROTTLE_STATUSES: frozenset[int] = frozenset({402, 429})
+
+
+@define(frozen=True)
+class Limit:
+    """ How fast and how many requests may be sent at once
+
+        Attributes:
+            rate (Optional[float]): Requests per second, None for no rate limit
+            burst (Optional[int]): Requests that may be sent at once after an idle period, by default the rate
+                rounded up (and at least 1)
+            max_in_flight (Optional[int]): Requests that may wait for their response at the same time, None for
+                no cap
+    """
+
+    rate: Optional[float] = None
+    burst: Optional[int] = None
+    max_in_flight: Optional[int] = None
+
+    def __attrs_post_init__(self):
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError(f"Invalid rate: {self.rate}. It must be above 0, or None for no rate limit")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError(f"Invalid burst: {self.burst}. It must be at least 1")
+        if self.max_in_flight is not None and self.max_in_flight < 1:
+            raise ValueError(f"Invalid max_in_flight: {self.max_in_flight}. It must be at least 1, or None for no cap")
+
+
+class _Slots:
+    """Counting semaphore that threads and tasks of any event loop can wait on together, first come first served"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        self._waiters: deque[_Waiter] = deque()
+
+    def _try_acquire(self) -> bool:
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        with self._lock:
+            if self._try_acquire():
+                return
+            waiter = _Waiter(threading.Event())
+            self._waiters.append(waiter)
+        waiter.wake.wait()
+
+    async def acquire_async(self) -> None:
+        import asyncio
+
+        with self._lock:
+            if self._try_acquire():
+                return
+            future = asyncio.get_running_loop().create_future()
+            waiter = _Waiter(future)
+            self._waiters.append(waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                handed = waiter.handed
+                if not handed:
+                    self._waiters.remove(waiter)
+            if handed:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self.in_flight -= 1
+                    return
+                # the slot goes straight to the longest waiting caller, so in_flight stays the same
+                waiter = self._waiters.popleft()
+                waiter.handed = True
+            if isinstance(waiter.wake, threading.Event):
+                waiter.wake.set()
+                return
+            try:
+                waiter.wake.get_loop().call_soon_threadsafe(_resolve, waiter.wake)
+                return
+            except RuntimeError:
+                # the waiter's event loop is closed and will never take the slot, try the next waiter
+                continue
+
+
+class _Waiter:
+    __slots__ = ("wake", "handed")
+
+    def __init__(self, wake: Any):
+        self.wake = wake
+        self.handed = False
+
+
+def _resolve(future: Any) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Gate:
+    """Token bucket, in-flight slots and adaptive throttling state of one endpoint group (or of all requests)"""
+
+    def __init__(self, limit: Limit):
+        self.rate = limit.rate
+        self.burst = limit.burst if limit.burst is not None else max(1, math.ceil(limit.rate or 1))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.factor = 1.0
+        self.paused_until = 0.0
+        self.streak = 0
+        self.slots = _Slots(limit.max_in_flight) if limit.max_in_flight is not None else None
+
+    def reserve(self, now: float) -> float:
+        """Take a token, possibly ahead of time, and return the seconds to wait before sending"""
+        wait = 0.0
+        if self.rate is not None:
+            rate = self.rate * self.factor
+            self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait = -self.tokens / rate
+        return max(wait, self.paused_until - now)
+
+
+class RateLimiter:
+    """Token-bucket rate limits and in-flight caps for all requests and per endpoint group
+
+    A request to the API waits until both the overall ``limit`` and the limit of its endpoint group
+    (``"session_management"``, ``"browser_actions"`` or ``"content_extraction"``) let it through. Requests outside
+    the API, such as artifact downloads, are not limited. One limiter can be passed to several clients and is safe to
+    share between threads and event loops, so a whole process can be held to one quota.
+
+    When a group is answered with a quota status (402 or 429 by default), the limiter backs off adaptively: the
+    group is paused for the ``Retry-After`` delay, or an exponential backoff when there is none, and its rate is cut
+    by ``decrease``. Every successful response gives back ``recovery`` of the configured rate.
+
+    Example:
+
+        limiter = RateLimiter(Limit(rate=20, max_in_flight=50),
+                              groups={"session_management": Limit(rate=2), "content_extraction": Limit(max_in_flight=5)})
+        client = AuthenticatedClient(base_url=..., token=..., rate_limit=limiter)
+    """
+
+    def __init__(
+        self,
+        limit: Limit = Limit(),
+        groups: Optional[Mapping[str, Limit]] = None,
+        *,
+        throttle_statuses: frozenset[int] = THROTTLE_STATUSES,
+        backoff_factor: float = 1.0,
+        max_backoff: float = 30.0,
+        decrease: float = 0.5,
+        recovery: float = 0.05,
+        min_rate_factor: float = 0.1,
+    ):
+        groups = dict(groups or {})
+        unknown = set(groups) - GROUPS
+        if unknown:
+            raise ValueError(f"Unknown endpoint groups {sorted(unknown)}, expected some of {sorted(GROUPS)}")
+        self.throttle_statuses = frozenset(throttle_statuses)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.decrease = decrease
+        self.recovery = recovery
+        self.min_rate_factor = min_rate_factor
+        self._global = _Gate(limit)
+        self._groups = {group: _Gate(groups.get(group, Limit())) for group in GROUPS}
+        self._lock = threading.Lock()
+
+    def _gate(self, group: Optional[str]) -> _Gate:
+        return self._global if group is None else self._groups[group]
+
+    def rate(self, group: Optional[str] = None) -> Optional[float]:
+        """Current requests per second allowed overall or for a group, after adaptive throttling"""
+        gate = self._gate(group)
+        return None if gate.rate is None else gate.rate * gate.factor
+
+    def in_flight(self, group: Optional[str] = None) -> int:
+        """Requests currently counted against ``max_in_flight`` overall or for a group"""
+        slots = self._gate(group).slots
+        return 0 if slots is None else slots.in_flight
+
+    def paused_for(self, group: str) -> float:
+        """Seconds until a throttled group sends requests again"""
+        return max(0.0, self._groups[group].paused_until - time.monotonic())
+
+    def _gates(self, request: httpx.Request) -> Optional[tuple[_Gate, _Gate]]:
+        endpoint = resolve_endpoint(request.method, request.url.path)
+        if endpoint is None:
+            return None
+        return self._groups[endpoint.group], self._global
+
+    def _reserve(self, gates: tuple[_Gate, _Gate]) -> float:
+        now = time.monotonic()
+        with self._lock:
+            return max(gate.reserve(now) for gate in gates)
+
+    def _paused(self, gates: tuple[_Gate, _Gate]) -> float:
+        now = time.monotonic()
+        with self._lock:
+            return max(gate.paused_until for gate in gates) - now
+
+    def acquire(self, request: httpx.Request) -> Optional[tuple[_Gate, _Gate]]:
+        """Block until the request may be sent; pass the result to ``release`` once it is done"""
+        gates = self._gates(request)
+        if gates is None:
+            return None
+        wait = self._reserve(gates)
+        while wait > 0:
+            time.sleep(wait)
+            wait = self._paused(gates)
+        for gate in gates:
+            if gate.slots is not None:
+                gate.slots.acquire()
+        return gates
+
+    async def acquire_async(self, request: httpx.Request) -> Optional[tuple[_Gate, _Gate]]:
+        """Async counterpart of ``acquire``, waiting without blocking the event loop"""
+        import asyncio
+
+        gates = self._gates(request)
+        if gates is None:
+            return None
+        wait = self._reserve(gates)
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._paused(gates)
+        acquired = []
+        try:
+            for gate in gates:
+                if gate.slots is not None:
+                    await gate.slots.acquire_async()
+                    acquired.append(gate.slots)
+        except BaseException:
+            for slots in acquired:
+                slots.release()
+            raise
+        return gates
+
+    def release(self, gates: Optional[tuple[_Gate, _Gate]]) -> None:
+        """Free the in-flight slots taken by ``acquire``"""
+        if gates is None:
+            return
+        for gate in reversed(gates):
+            if gate.slots is not None:
+                gate.slots.release()
+
+    def observe(self, gates: Optional[tuple[_Gate, _Gate]], response: httpx.Response) -> None:
+        """Adapt the rate of the request's group to its response status"""
+        if gates is None:
+            return
+        gate = gates[0]
+        with self._lock:
+            if response.status_code not in self.throttle_statuses:
+                gate.streak = 0
+                gate.factor = min(1.0, gate.factor + self.recovery)
+                return
+            gate.streak += 1
+            pause = _parse_retry_after(response.headers.get("Retry-After"))
+            if pause is None:
+                pause = self.backoff_factor * 2 ** (gate.streak - 1)
+            gate.paused_until = max(gate.paused_until, time.monotonic() + min(pause, self.max_backoff))
+            gate.factor = max(self.min_rate_factor, gate.factor * self.decrease)
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Wraps a transport and holds each request back according to a RateLimiter
+
+    The in-flight slot is held until the response body has been read and closed.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter):
+        self._transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        gates = self.limiter.acquire(request)
+        if gates is None:
+            return self._transport.handle_request(request)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            self.limiter.release(gates)
+            raise
+        self.limiter.observe(gates, response)
+        if response.is_closed:
+            self.limiter.release(gates)
+        else:
+            response.stream = _TimedStream(response.stream, lambda: self.limiter.release(gates))
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``RateLimitTransport``"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter):
+        self._transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        gates = await self.limiter.acquire_async(request)
+        if gates is None:
+            return await self._transport.handle_async_request(request)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.limiter.release(gates)
+            raise
+        self.limiter.observe(gates, response)
+        if response.is_closed:
+            self.limiter.release(gates)
+        else:
+            response.stream = _AsyncTimedStream(response.stream, lambda: self.limiter.release(gates))
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = ["THROTTLE_STATUSES", "AsyncRateLimitTransport", "Limit", "RateLimitTransport", "RateLimiter"]
@@ -0,0 +1,194 @@
+""" Retries with exponential backoff for transient API failures, as httpx transports """
+
+import email.utils
+import random
+import threading
+import time
+from typing import Optional
+
+import httpx
+from attrs import define, field
+
+from .endpoints import resolve_endpoint
+
+RETRYABLE_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+RETRYABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+class RetryBudget:
+    """Caps retries to a fraction of traffic so retries cannot multiply load on a struggling API.
+
+    Works like gRPC retry throttling: the budget starts full with ``max_tokens``, every retryable
+    failure takes one token, every success gives back ``token_ratio`` tokens, and retries are only
+    allowed while more than half of the tokens are left. Safe to share between threads and tasks.
+    """
+
+    def __init__(self, max_tokens: float = 100.0, token_ratio: float = 0.1):
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def record_failure(self) -> bool:
+        """Take a token for a failed attempt and return whether a retry is still allowed"""
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self.max_tokens / 2
+
+
+@define
+class RetryPolicy:
+    """ When and how long to wait before retrying a request
+
+        Idempotent endpoints (``get_session_status``, ``list_browser_sessions``, ``get_browser_context``) are
+        retried by default. Endpoints that change state are only retried when listed in ``retry_endpoints``
+        by module name (e.g. ``"take_screenshot"``) or api/ package (e.g. ``"content_extraction"``).
+        Requests outside the API, such as artifact downloads, are retried when their method is GET or HEAD.
+
+        Attributes:
+            max_attempts (int): Total attempts per request, including the first one
+            backoff_factor (float): Base delay in seconds, doubled on every attempt
+            max_backoff (float): Upper bound for a single delay, including ``Retry-After`` values
+            jitter (bool): Whether to pick a random delay between zero and the backoff ("full jitter")
+            retry_statuses (frozenset[int]): Response status codes that are retried
+            retry_endpoints (frozenset[str]): Non-idempotent endpoint names or groups that opt in to retries
+            respect_retry_after (bool): Whether to wait for the server's ``Retry-After`` header when present
+            budget (Optional[RetryBudget]): Shared retry budget, None to disable
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = field(default=RETRYABLE_STATUSES, converter=frozenset)
+    retry_endpoints: frozenset[str] = field(factory=frozenset, converter=frozenset)
+    respect_retry_after: bool = True
+    budget: Optional[RetryBudget] = field(factory=RetryBudget)
+
+    def allows(self, request: httpx.Request) -> bool:
+        """Whether the request may be retried at all"""
+        endpoint = resolve_endpoint(request.method, request.url.path)
+        if endpoint is None:
+            return request.method in ("GET", "HEAD")
+        return endpoint.idempotent or endpoint.name in self.retry_endpoints or endpoint.group in self.retry_endpoints
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait after the given (1-based) failed attempt"""
+        if response is not None and self.respect_retry_after:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        delay = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def _should_retry(self, attempt: int) -> bool:
+        # every failed attempt is charged to the budget, the last one included
+        allowed = self.budget is None or self.budget.record_failure()
+        return allowed and attempt < self.max_attempts
+
+    def _record_success(self) -> None:
+        if self.budget is not None:
+            self.budget.record_success()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given either in seconds or as an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Wraps a transport and retries requests according to a RetryPolicy"""
+
+    def __init__(self, transport: httpx.BaseTransport, policy: RetryPolicy):
+        self._transport = transport
+        self.policy = policy
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.policy.allows(request):
+            return self._transport.handle_request(request)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = self._transport.handle_request(request)
+            except RETRYABLE_EXCEPTIONS:
+                if not self.policy._should_retry(attempt):
+                    raise
+                delay = self.policy.backoff(attempt)
+            else:
+                if response.status_code not in self.policy.retry_statuses:
+                    self.policy._record_success()
+                    return response
+                if not self.policy._should_retry(attempt):
+                    return response
+                delay = self.policy.backoff(attempt, response)
+                response.close()
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Wraps an async transport and retries requests according to a RetryPolicy"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: RetryPolicy):
+        self._transport = transport
+        self.policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        import asyncio  # imported here so that importing the package does not load asyncio
+
+        if not self.policy.allows(request):
+            return await self._transport.handle_async_request(request)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._transport.handle_async_request(request)
+            except RETRYABLE_EXCEPTIONS:
+                if not self.policy._should_retry(attempt):
+                    raise
+                delay = self.policy.backoff(attempt)
+            else:
+                if response.status_code not in self.policy.retry_statuses:
+                    self.policy._record_success()
+                    return response
+                if not self.policy._should_retry(attempt):
+                    return response
+                delay = self.policy.backoff(attempt, response)
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+__all__ = ["RETRYABLE_EXCEPTIONS", "RETRYABLE_STATUSES", "AsyncRetryTransport", "RetryBudget", "RetryPolicy", "RetryTransport"]
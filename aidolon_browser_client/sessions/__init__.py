@@ -1,3 +1,19 @@
-from .sessions import list_all_sessions, close_all_sessions
+from .sessions import list_all_sessions, list_sessions_columnar, iter_sessions, iter_sessions_async, close_all_sessions
+from .columnar import SessionColumns
+from .streaming import SessionStreamParser
+from .bulk_close import BulkCloseReport, CloseResult, close_sessions, close_sessions_async, idle_seconds
 
-__all__ = ["list_all_sessions", "close_all_sessions"]
\ No newline at end of file
+__all__ = [
+    "list_all_sessions",
+    "list_sessions_columnar",
+    "iter_sessions",
+    "iter_sessions_async",
+    "close_all_sessions",
+    "close_sessions",
+    "close_sessions_async",
+    "idle_seconds",
+    "BulkCloseReport",
+    "CloseResult",
+    "SessionColumns",
+    "SessionStreamParser",
+]
@@ -0,0 +1,214 @@
+import asyncio
+import datetime
+import time
+from typing import Any, Callable, Iterable, List, Optional, Union
+from uuid import UUID
+
+from attrs import define, field
+
+from aidolon_browser_client.client import AuthenticatedClient
+from aidolon_browser_client.api.session_management import close_browser_session
+from aidolon_browser_client.models.browser_session import BrowserSession
+from aidolon_browser_client.models.close_browser_session_response_200 import CloseBrowserSessionResponse200
+from aidolon_browser_client.shared import _run_blocking, get_shared_async_client
+from aidolon_browser_client.types import Unset
+from .sessions import DEFAULT_PAGE_SIZE, _credentials, iter_sessions_async
+
+
+@define
+class CloseResult:
+    """ The outcome of closing one session
+
+        Attributes:
+            session_id (UUID): The session that was closed
+            status_code (Optional[int]): HTTP status of the close request, None if it raised
+            response (Any): The parsed response: ``CloseBrowserSessionResponse200`` or ``Error``
+            error (Optional[BaseException]): The exception raised while closing, if any
+            latency (float): Wall time of the close request in seconds
+    """
+
+    session_id: UUID
+    status_code: Optional[int] = None
+    response: Any = None
+    error: Optional[BaseException] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and isinstance(self.response, CloseBrowserSessionResponse200)
+
+
+@define
+class BulkCloseReport:
+    """ The outcome of a bulk close
+
+        Attributes:
+            results (list[CloseResult]): One result per targeted session, in completion order
+            wall_time (float): Seconds from the start of the listing to the last close
+    """
+
+    results: List[CloseResult] = field(factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def closed(self) -> List[CloseResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[CloseResult]:
+        return [result for result in self.results if not result.ok]
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+
+ProgressCallback = Callable[[int, int, CloseResult], None]
+
+
+def idle_seconds(session: BrowserSession, now: Optional[datetime.datetime] = None) -> Optional[float]:
+    """Seconds since the session was last active, or since it was created if it never was
+
+    Timestamps without an offset are read as UTC. Returns None if the timestamp is missing or was
+    kept as an unparsable string.
+    """
+    last_active = session.last_active_at
+    if isinstance(last_active, Unset) or last_active is None:
+        last_active = session.created_at
+    if not isinstance(last_active, datetime.datetime):
+        return None
+    if last_active.tzinfo is None:
+        last_active = last_active.replace(tzinfo=datetime.timezone.utc)
+    if now is None:
+        now = datetime.datetime.now(datetime.timezone.utc)
+    return (now - last_active).total_seconds()
+
+
+async def close_sessions_async(
+    *,
+    session_ids: Optional[Iterable[Union[UUID, str]]] = None,
+    idle_for: Optional[float] = None,
+    where: Optional[Callable[[BrowserSession], bool]] = None,
+    concurrency: int = 10,
+    on_progress: Optional[ProgressCallback] = None,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    client: Optional[AuthenticatedClient] = None,
+) -> BulkCloseReport:
+    """Close many sessions concurrently, one ``close_browser_session`` request each.
+
+    Use it when ``close_all_sessions`` times out, or to close only some sessions. Without
+    ``session_ids``, the active sessions are listed with ``iter_sessions_async`` and the ones
+    matching ``idle_for`` and ``where`` are closed. At most ``concurrency`` close requests are in
+    flight at a time, all over one async client. A failed close is reported in its result and does
+    not stop the others.
+
+    Example:
+
+        report = await close_sessions_async(idle_for=3600, concurrency=20,
+                                            on_progress=lambda done, total, result: print(f"{done}/{total}"))
+        print(f"closed {len(report.closed)} in {report.wall_time:.1f}s", report.failed)
+
+    Args:
+        session_ids: Sessions to close. If None, the active sessions are listed and filtered.
+        idle_for: Only close listed sessions idle for at least this many seconds, see ``idle_seconds``.
+        where: Only close listed sessions for which this returns True.
+        concurrency: Maximum number of close requests in flight.
+        on_progress: Called after each close with the number of sessions done, the number targeted
+            and the result.
+        api_key: Optional API key to use. If None, will try to get from environment variable.
+        base_url: Optional base URL to use. If None, will try to get from environment variable.
+        client: Optional client to send the requests with. If None, the shared client of the running event loop
+            for the API key and base URL is used.
+
+    Returns:
+        The per-session results and the total wall time
+
+    Raises:
+        ValueError: If no API key is provided and AIDOLONS_API_KEY environment variable is not set,
+                   or if concurrency is less than 1
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if client is None:
+        api_key, base_url = _credentials(api_key=api_key, base_url=base_url)
+        client = get_shared_async_client(base_url, api_key)
+
+    started = time.perf_counter()
+    if session_ids is None:
+        targets = await _list_targets(client, idle_for, where)
+    else:
+        targets = [session_id if isinstance(session_id, UUID) else UUID(session_id) for session_id in session_ids]
+    report = BulkCloseReport()
+    pending: asyncio.Queue = asyncio.Queue()
+    for session_id in targets:
+        pending.put_nowait(session_id)
+
+    async def worker() -> None:
+        while True:
+            try:
+                session_id = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = await _close(client, session_id)
+            report.results.append(result)
+            if on_progress is not None:
+                on_progress(len(report.results), len(targets), result)
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(targets)))))
+    report.wall_time = time.perf_counter() - started
+    return report
+
+
+def close_sessions(
+    *,
+    session_ids: Optional[Iterable[Union[UUID, str]]] = None,
+    idle_for: Optional[float] = None,
+    where: Optional[Callable[[BrowserSession], bool]] = None,
+    concurrency: int = 10,
+    on_progress: Optional[ProgressCallback] = None,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    client: Optional[AuthenticatedClient] = None,
+) -> BulkCloseReport:
+    """Blocking counterpart of ``close_sessions_async``.
+
+    Runs its own event loop, so it cannot be called from inside a running one; use ``close_sessions_async`` there.
+    A given ``client`` lends its settings to a copy with a connection pool of its own for the run.
+    """
+    return _run_blocking(lambda run_client: close_sessions_async(
+        session_ids=session_ids, idle_for=idle_for, where=where, concurrency=concurrency,
+        on_progress=on_progress, api_key=api_key, base_url=base_url, client=run_client,
+    ), client)
+
+
+async def _list_targets(
+    client: AuthenticatedClient,
+    idle_for: Optional[float],
+    where: Optional[Callable[[BrowserSession], bool]],
+) -> List[UUID]:
+    """Ids of the active sessions matching the filters"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    targets = []
+    async for page in iter_sessions_async(status="active", page_size=DEFAULT_PAGE_SIZE, client=client):
+        for session in page:
+            if idle_for is not None:
+                idle = idle_seconds(session, now)
+                if idle is None or idle < idle_for:
+                    continue
+            if where is not None and not where(session):
+                continue
+            targets.append(session.session_id)
+    return targets
+
+
+async def _close(client: AuthenticatedClient, session_id: UUID) -> CloseResult:
+    result = CloseResult(session_id=session_id)
+    started = time.perf_counter()
+    try:
+        response = await close_browser_session.asyncio_detailed(session_id, client=client)
+        result.status_code = response.status_code
+        result.response = response.parsed
+    except Exception as exc:
+        result.error = exc
+    result.latency = time.perf_counter() - started
+    return result
@@ -0,0 +1,118 @@
+from collections.abc import Iterable, Mapping
+from typing import Any, Dict, List, Optional
+
+from attrs import define, field
+
+from aidolon_browser_client._dates import epoch_us
+
+TIMESTAMP_COLUMNS = ("created_at", "updated_at", "last_active_at", "closed_at")
+
+
+def _timestamp(value: Any) -> Optional[int]:
+    """Epoch microseconds of a timestamp, None when it is missing or cannot be parsed"""
+    if not value:
+        return None
+    try:
+        return epoch_us(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+@define
+class SessionColumns:
+    """ A session listing stored as one list per column instead of one model per session
+
+        Timestamps are integers counting microseconds since the Unix epoch (UTC). Values missing from a
+        session are None, in every column, and so are timestamps that cannot be parsed.
+
+        Attributes:
+            session_id (list[str]): Session ids, as in the API response
+            status (list[Optional[str]]): Session statuses, e.g. ``"active"``
+            created_at (list[Optional[int]]): When each session was created
+            updated_at (list[Optional[int]]): When each session was last updated
+            last_active_at (list[Optional[int]]): When each session was last active
+            closed_at (list[Optional[int]]): When each session was closed
+            url (list[Optional[str]]): Current URL of each live session
+            title (list[Optional[str]]): Current page title of each live session
+    """
+
+    session_id: List[str] = field(factory=list)
+    status: List[Optional[str]] = field(factory=list)
+    created_at: List[Optional[int]] = field(factory=list)
+    updated_at: List[Optional[int]] = field(factory=list)
+    last_active_at: List[Optional[int]] = field(factory=list)
+    closed_at: List[Optional[int]] = field(factory=list)
+    url: List[Optional[str]] = field(factory=list)
+    title: List[Optional[str]] = field(factory=list)
+
+    @classmethod
+    def from_json(cls, sessions: Iterable[Mapping[str, Any]]) -> "SessionColumns":
+        """Build the columns in one pass over the decoded ``sessions`` array of a listing, without models"""
+        columns = cls()
+        session_id = columns.session_id.append
+        status = columns.status.append
+        timestamps = [(name, getattr(columns, name).append) for name in TIMESTAMP_COLUMNS]
+        url = columns.url.append
+        title = columns.title.append
+        for session in sessions:
+            get = session.get
+            session_id(session["session_id"])
+            status(get("status"))
+            for name, append in timestamps:
+                append(_timestamp(get(name)))
+            live_session = get("live_session")
+            if isinstance(live_session, Mapping):
+                url(live_session.get("url"))
+                title(live_session.get("title"))
+            else:
+                url(None)
+                title(None)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.session_id)
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """The columns by name"""
+        return {
+            "session_id": self.session_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "last_active_at": self.last_active_at,
+            "closed_at": self.closed_at,
+            "url": self.url,
+            "title": self.title,
+        }
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """The columns as NumPy arrays: ``datetime64[us]`` for timestamps (NaT when missing), ``object`` otherwise
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        import numpy as np
+
+        nat = np.iinfo(np.int64).min  # the int64 value of NaT
+        arrays = {}
+        for name, values in self.to_dict().items():
+            if name in TIMESTAMP_COLUMNS:
+                ticks = [nat if value is None else value for value in values]
+                arrays[name] = np.array(ticks, dtype=np.int64).view("datetime64[us]")
+            else:
+                arrays[name] = np.array(values, dtype=object)
+        return arrays
+
+    def to_arrow(self):
+        """The columns as a ``pyarrow.Table``, with UTC microsecond timestamps and nulls for missing values
+
+        Raises:
+            ImportError: If PyArrow is not installed.
+        """
+        import pyarrow as pa
+
+        timestamp = pa.timestamp("us", tz="UTC")
+        return pa.table({
+            name: pa.array(values, type=timestamp if name in TIMESTAMP_COLUMNS else pa.string())
+            for name, values in self.to_dict().items()
+        })
@@ -1,31 +1,50 @@
-import os
-from typing import Optional, Union
+from collections.abc import AsyncIterator, Iterator
+from typing import List, Optional, Union
 
+from aidolon_browser_client import _env
+from aidolon_browser_client import errors
 from aidolon_browser_client.client import AuthenticatedClient, Client
+from aidolon_browser_client.shared import get_shared_client
+from aidolon_browser_client.api.session_management import list_browser_sessions
 from aidolon_browser_client.api.session_management.list_browser_sessions import sync as list_sync
 from aidolon_browser_client.api.session_management.close_all_browser_sessions import sync as close_all_sync
+from aidolon_browser_client.models.browser_session import BrowserSession
 from aidolon_browser_client.models.error import Error
 from aidolon_browser_client.models.list_browser_sessions_response_200 import ListBrowserSessionsResponse200
 from aidolon_browser_client.models.close_all_browser_sessions_response_200 import CloseAllBrowserSessionsResponse200
 from aidolon_browser_client.models.list_browser_sessions_status import ListBrowserSessionsStatus
 from aidolon_browser_client.types import UNSET, Unset
+from .columnar import SessionColumns
+from .streaming import SessionStreamParser
+
+DEFAULT_PAGE_SIZE = 100
 
 
 def _get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> AuthenticatedClient:
-    """Create and return an authenticated client using the provided API key or from environment variables.
+    """Return the shared authenticated client for the provided API key or the one from environment variables.
     
     Args:
         api_key: Optional API key to use. If None, will try to get from environment variable.
         base_url: Optional base URL to use. If None, will try to get from environment variable.
     
     Returns:
-        An authenticated client instance
+        The shared authenticated client instance
         
+    Raises:
+        ValueError: If no API key is provided and AIDOLONS_API_KEY environment variable is not set
+    """
+    api_key, base_url = _credentials(api_key=api_key, base_url=base_url)
+    return get_shared_client(base_url, api_key)
+
+
+def _credentials(api_key: Optional[str] = None, base_url: Optional[str] = None) -> tuple[str, str]:
+    """Return the API key and base URL to use, reading the ones not provided from environment variables.
+
     Raises:
         ValueError: If no API key is provided and AIDOLONS_API_KEY environment variable is not set
     """
     if not api_key:
-        api_key = os.getenv("AIDOLONS_API_KEY")
+        api_key = _env.getenv("AIDOLONS_API_KEY")
         if not api_key:
             raise ValueError(
                 "AIDOLONS_API_KEY environment variable is not set and no API key was provided. "
@@ -33,9 +52,9 @@ def _get_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -
             )
     
     if not base_url:
-        base_url = os.getenv("AIDOLONS_API_BASE_URL", "https://api.aidolons.com/api/v1")
-    
-    return AuthenticatedClient(base_url=base_url, token=api_key)
+        base_url = _env.getenv("AIDOLONS_API_BASE_URL", "https://api.aidolons.com/api/v1")
+
+    return api_key, base_url
 
 
 def list_all_sessions(
@@ -43,6 +62,7 @@ def list_all_sessions(
     status: Optional[str] = None,
     api_key: Optional[str] = None,
     base_url: Optional[str] = None,
+    client: Optional[AuthenticatedClient] = None,
 ) -> Optional[Union[Error, ListBrowserSessionsResponse200]]:
     """List all browser sessions
 
@@ -53,33 +73,175 @@ def list_all_sessions(
                If None or not provided, all sessions will be returned.
         api_key: Optional API key to use. If None, will try to get from environment variable.
         base_url: Optional base URL to use. If None, will try to get from environment variable.
+        client: Optional client to send the request with. If None, the shared client is used.
 
     Returns:
-        The response model containing session information or an error
+        The response model containing session information or an error. Like the generated endpoints,
+        an error status is returned as the parsed Error model, and an undocumented status only raises
+        errors.UnexpectedStatus when the client has ``raise_on_unexpected_status`` set. ``iter_sessions``
+        and ``iter_sessions_async`` differ here: they have no return value to carry the Error model,
+        so they always raise errors.UnexpectedStatus when the status is not 200.
         
     Raises:
         ValueError: If no API key is provided and AIDOLONS_API_KEY environment variable is not set
                    or if an invalid status is provided
     """
-    client = _get_client(api_key=api_key, base_url=base_url)
-    
-    # Convert string status to enum if provided
-    status_enum = UNSET
-    if status is not None:
-        if status.lower() == "active":
-            status_enum = ListBrowserSessionsStatus.ACTIVE
-        elif status.lower() == "closed":
-            status_enum = ListBrowserSessionsStatus.CLOSED
-        else:
-            raise ValueError(f"Invalid status: {status}. Supported values are 'active' and 'closed'")
+    if client is None:
+        client = _get_client(api_key=api_key, base_url=base_url)
     
-    return list_sync(client=client, status=status_enum)
+    return list_sync(client=client, status=_status_filter(status))
+
+
+def list_sessions_columnar(
+    *,
+    status: Optional[str] = None,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    client: Optional[AuthenticatedClient] = None,
+) -> Optional[Union[Error, SessionColumns]]:
+    """List all browser sessions as columns
+
+    Like ``list_all_sessions``, but the sessions are read straight from the decoded JSON into one list
+    per column (session_id, status, timestamps as epoch microseconds, url and title) without creating
+    a model per session. Use ``to_numpy()`` or ``to_arrow()`` on the result to get arrays.
+
+    Args:
+        status: Optional string to filter sessions by status. Supported values: "active", "closed".
+               If None or not provided, all sessions will be returned.
+        api_key: Optional API key to use. If None, will try to get from environment variable.
+        base_url: Optional base URL to use. If None, will try to get from environment variable.
+        client: Optional client to send the request with. If None, the shared client is used.
+
+    Returns:
+        The session columns, or the parsed error response
+        
+    Raises:
+        ValueError: If no API key is provided and AIDOLONS_API_KEY environment variable is not set
+                   or if an invalid status is provided
+    """
+    if client is None:
+        client = _get_client(api_key=api_key, base_url=base_url)
+
+    kwargs = list_browser_sessions._get_kwargs(status=_status_filter(status))
+    response = client.get_httpx_client().request(**kwargs)
+    if response.status_code != 200:
+        return list_browser_sessions._parse_response(client=client, response=response)
+    return SessionColumns.from_json(client.json_codec.decode(response.content).get("sessions") or [])
+
+
+def iter_sessions(
+    *,
+    status: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    client: Optional[AuthenticatedClient] = None,
+) -> Iterator[List[BrowserSession]]:
+    """Iterate over browser sessions in pages, while the listing is still being received
+
+    The API returns every session in one response, so instead of requesting pages this streams that
+    response and parses its ``sessions`` array incrementally: each page is yielded as soon as
+    ``page_size`` sessions have arrived, and memory use does not grow with the number of sessions.
+
+    Args:
+        status: Optional string to filter sessions by status. Supported values: "active", "closed".
+               If None or not provided, all sessions will be returned.
+        page_size: Maximum number of sessions per page. The last page may be shorter.
+        api_key: Optional API key to use. If None, will try to get from environment variable.
+        base_url: Optional base URL to use. If None, will try to get from environment variable.
+        client: Optional client to send the request with. If None, the shared client is used.
+
+    Yields:
+        Lists of up to ``page_size`` sessions, in the order the API returns them
+
+    Raises:
+        ValueError: If no API key is provided and AIDOLONS_API_KEY environment variable is not set,
+                   if an invalid status or page size is provided, or if the response body is invalid
+        errors.UnexpectedStatus: If the API does not return the listing (status other than 200), whatever
+                   the client's ``raise_on_unexpected_status``, since a generator cannot return the Error model
+                   the way ``list_all_sessions`` does
+    """
+    if page_size < 1:
+        raise ValueError(f"Invalid page_size: {page_size}. It must be at least 1")
+    if client is None:
+        client = _get_client(api_key=api_key, base_url=base_url)
+
+    httpx_client = client.get_httpx_client()
+    request = httpx_client.build_request(**list_browser_sessions._get_kwargs(status=_status_filter(status)))
+    response = httpx_client.send(request, stream=True)
+    try:
+        if response.status_code != 200:
+            raise errors.UnexpectedStatus(response.status_code, response.read())
+        parser = SessionStreamParser()
+        page: List[BrowserSession] = []
+        for chunk in response.iter_bytes():
+            for session in parser.feed(chunk):
+                page.append(BrowserSession.from_dict(session))
+                if len(page) == page_size:
+                    yield page
+                    page = []
+        parser.close()
+        if page:
+            yield page
+    finally:
+        response.close()
+
+
+async def iter_sessions_async(
+    *,
+    status: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    api_key: Optional[str] = None,
+    base_url: Optional[str] = None,
+    client: Optional[AuthenticatedClient] = None,
+) -> AsyncIterator[List[BrowserSession]]:
+    """Async counterpart of ``iter_sessions`` using the client's ``httpx.AsyncClient``
+
+    Use it with ``async for page in iter_sessions_async(...)``. Arguments, pages and errors are the
+    same as for ``iter_sessions``.
+    """
+    if page_size < 1:
+        raise ValueError(f"Invalid page_size: {page_size}. It must be at least 1")
+    if client is None:
+        client = _get_client(api_key=api_key, base_url=base_url)
+
+    httpx_client = client.get_async_httpx_client()
+    request = httpx_client.build_request(**list_browser_sessions._get_kwargs(status=_status_filter(status)))
+    response = await httpx_client.send(request, stream=True)
+    try:
+        if response.status_code != 200:
+            raise errors.UnexpectedStatus(response.status_code, await response.aread())
+        parser = SessionStreamParser()
+        page: List[BrowserSession] = []
+        async for chunk in response.aiter_bytes():
+            for session in parser.feed(chunk):
+                page.append(BrowserSession.from_dict(session))
+                if len(page) == page_size:
+                    yield page
+                    page = []
+        parser.close()
+        if page:
+            yield page
+    finally:
+        await response.aclose()
+
+
+def _status_filter(status: Optional[str]) -> Union[Unset, ListBrowserSessionsStatus]:
+    """Convert a status string to the list_browser_sessions filter"""
+    if status is None:
+        return UNSET
+    if status.lower() == "active":
+        return ListBrowserSessionsStatus.ACTIVE
+    if status.lower() == "closed":
+        return ListBrowserSessionsStatus.CLOSED
+    raise ValueError(f"Invalid status: {status}. Supported values are 'active' and 'closed'")
 
 
 def close_all_sessions(
     *,
     api_key: Optional[str] = None,
     base_url: Optional[str] = None,
+    client: Optional[AuthenticatedClient] = None,
 ) -> Optional[Union[CloseAllBrowserSessionsResponse200, Error]]:
     """Close all browser sessions
 
@@ -88,6 +250,7 @@ def close_all_sessions(
     Args:
         api_key: Optional API key to use. If None, will try to get from environment variable.
         base_url: Optional base URL to use. If None, will try to get from environment variable.
+        client: Optional client to send the request with. If None, the shared client is used.
 
     Returns:
         The response model confirming sessions were closed or an error
@@ -95,5 +258,6 @@ def close_all_sessions(
     Raises:
         ValueError: If no API key is provided and AIDOLONS_API_KEY environment variable is not set
     """
-    client = _get_client(api_key=api_key, base_url=base_url)
+    if client is None:
+        client = _get_client(api_key=api_key, base_url=base_url)
     return close_all_sync(client=client)
@@ -0,0 +1,182 @@
+import codecs
+import json
+import re
+from typing import Any, List
+
+_WHITESPACE = " \t\n\r"
+
+# Characters that can end an object, array or string value
+_STRUCTURE = re.compile(r'[\\"\[\]{}]')
+
+# Parser states
+_START, _KEY, _COLON, _VALUE, _AFTER_VALUE, _ITEM, _AFTER_ITEM, _DONE = range(8)
+
+
+class SessionStreamParser:
+    """ Incrementally reads the ``sessions`` array of a list_browser_sessions response body
+
+        Feed the body as it arrives from the network and each call returns the sessions completed by that
+        chunk, as decoded JSON objects. Only the session being read and the unread rest of the current chunk
+        are kept in memory, so memory stays flat however many sessions the response holds. Other top-level
+        members (``success``, ``count``, ...) are skipped.
+    """
+
+    def __init__(self, key: str = "sessions"):
+        self._key = key
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = _START
+        self._in_key = False
+        self._reset_scan()
+
+    def _reset_scan(self) -> None:
+        # Progress through the object, array or string value being read, relative to its start, so each chunk
+        # is only scanned once and the value is decoded once it is complete
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = -1
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Add the next chunk of the body and return the sessions it completed
+
+        Raises:
+            ValueError: If the body is not a JSON object or its ``sessions`` member is not an array.
+        """
+        self._buffer += self._text.decode(data)
+        items: List[Any] = []
+        position = self._parse(items)
+        self._buffer = self._buffer[position:]
+        return items
+
+    def close(self) -> None:
+        """Check that the whole body was read
+
+        Raises:
+            ValueError: If the body ended before the top-level object was complete.
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        if self._state != _DONE or self._buffer.strip(_WHITESPACE):
+            raise ValueError("Incomplete or invalid list_browser_sessions response body")
+
+    def _parse(self, items: List[Any]) -> int:
+        buffer = self._buffer
+        end = len(buffer)
+        position = 0
+        while True:
+            while position < end and buffer[position] in _WHITESPACE:
+                position += 1
+            if position == end or self._state == _DONE:
+                return position
+            char = buffer[position]
+            state = self._state
+            if state == _START:
+                self._expect(char, "{")
+                position += 1
+                self._state = _KEY
+            elif state == _KEY:
+                if char == "}":
+                    position += 1
+                    self._state = _DONE
+                    continue
+                key, position, complete = self._decode(buffer, position)
+                if not complete:
+                    return position
+                if not isinstance(key, str):
+                    raise ValueError("Invalid list_browser_sessions response body: expected an object key")
+                self._in_key = key == self._key
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(char, ":")
+                position += 1
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._in_key:
+                    self._expect(char, "[")
+                    position += 1
+                    self._state = _ITEM
+                    continue
+                _, position, complete = self._decode(buffer, position)
+                if not complete:
+                    return position
+                self._state = _AFTER_VALUE
+            elif state == _AFTER_VALUE:
+                if char == "}":
+                    self._state = _DONE
+                else:
+                    self._expect(char, ",")
+                    self._state = _KEY
+                position += 1
+            elif state == _ITEM:
+                if char == "]":
+                    position += 1
+                    self._state = _AFTER_VALUE
+                    continue
+                item, position, complete = self._decode(buffer, position)
+                if not complete:
+                    return position
+                items.append(item)
+                self._state = _AFTER_ITEM
+            elif state == _AFTER_ITEM:
+                if char == "]":
+                    self._state = _AFTER_VALUE
+                else:
+                    self._expect(char, ",")
+                    self._state = _ITEM
+                position += 1
+
+    def _decode(self, buffer: str, position: int):
+        """Decode the JSON value at ``position``: (value, end, True), or (None, position, False) if it is cut off"""
+        if buffer[position] in '{["':
+            if self._scan(buffer, position) < 0:
+                return None, position, False
+            self._reset_scan()
+        try:
+            value, end = self._decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            # A value is only known to be invalid once more of the body cannot complete it, see close()
+            return None, position, False
+        if end == len(buffer) and not isinstance(value, (dict, list, str)):
+            # A number, true, false or null at the end of the chunk may continue in the next one
+            return None, position, False
+        return value, end, True
+
+    def _scan(self, buffer: str, start: int) -> int:
+        """Scan the object, array or string value at ``start`` up to the end of ``buffer``
+
+        Returns the index just past the value's closing character, or -1 while it is still cut off.
+        """
+        depth = self._depth
+        in_string = self._in_string
+        for match in _STRUCTURE.finditer(buffer, start + self._scanned):
+            index = match.start()
+            if index - start == self._escaped:
+                continue
+            char = buffer[index]
+            if in_string:
+                if char == "\\":
+                    self._escaped = index + 1 - start
+                elif char == '"':
+                    in_string = False
+                    if depth == 0:
+                        return index + 1
+            elif char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                depth -= 1
+                if depth <= 0:
+                    return index + 1
+        self._scanned = len(buffer) - start
+        self._depth = depth
+        self._in_string = in_string
+        return -1
+
+    @staticmethod
+    def _expect(char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(
+                f"Invalid list_browser_sessions response body: expected {expected!r}, found {char!r}"
+            )
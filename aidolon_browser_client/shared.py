@@ -0,0 +1,173 @@
+""" A process-wide registry of AuthenticatedClients so sessions can share one connection pool """
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+import httpx
+from attrs import evolve
+
+from . import _env
+from .client import AuthenticatedClient
+
+_lock = threading.Lock()
+_clients: dict[tuple[str, Optional[str]], AuthenticatedClient] = {}
+# Clients for asyncio callers, per event loop; a loop's clients are dropped once the loop is garbage collected
+T = TypeVar("T")
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+
+
+def _new_client(base_url: str, token: Optional[str], limits: Optional[httpx.Limits], http2: bool) -> AuthenticatedClient:
+    options: dict[str, Any] = {"http2": http2}
+    if limits is not None:
+        options["limits"] = limits
+    return AuthenticatedClient(base_url=base_url, token=token, **options)
+
+
+def get_shared_client(
+    base_url: str,
+    api_key: Optional[str] = None,
+    *,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+) -> AuthenticatedClient:
+    """Return the shared client for ``base_url`` and ``api_key``, creating it on first use.
+
+    Every caller asking for the same base URL and API key gets the same ``AuthenticatedClient``,
+    and therefore the same ``httpx.Client`` connection pool, so TCP and TLS handshakes are paid
+    once per process instead of once per session.
+
+    Args:
+        base_url: Base URL for the Aidolon API.
+        api_key: API key to authenticate with. If None, will try to get from the API_KEY environment variable.
+        limits: Connection pool limits, only applied when the shared client is first created.
+        http2: Whether to negotiate HTTP/2, only applied when the shared client is first created.
+
+    Returns:
+        The shared client instance
+
+    Raises:
+        ValueError: If no API key is provided and API_KEY environment variable is not set
+    """
+    token = api_key or _env.getenv("API_KEY")
+    key = (base_url, token)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _new_client(base_url, token, limits, http2)
+        return client
+
+
+def get_shared_async_client(
+    base_url: str,
+    api_key: Optional[str] = None,
+    *,
+    limits: Optional[httpx.Limits] = None,
+    http2: bool = False,
+) -> AuthenticatedClient:
+    """Return the shared client for ``base_url`` and ``api_key`` on the running event loop, creating it on first use.
+
+    An ``httpx.AsyncClient`` connection pool can only be used from the event loop it was created on, so
+    asyncio callers share one client per event loop rather than the process-wide client of
+    ``get_shared_client``. Must be called from a coroutine.
+
+    Args:
+        base_url: Base URL for the Aidolon API.
+        api_key: API key to authenticate with. If None, will try to get from the API_KEY environment variable.
+        limits: Connection pool limits, only applied when the shared client is first created.
+        http2: Whether to negotiate HTTP/2, only applied when the shared client is first created.
+
+    Returns:
+        The shared client instance of the running event loop
+
+    Raises:
+        RuntimeError: If no event loop is running
+    """
+    loop = asyncio.get_running_loop()
+    token = api_key or _env.getenv("API_KEY")
+    key = (base_url, token)
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(key)
+        if client is None:
+            client = clients[key] = _new_client(base_url, token, limits, http2)
+        return client
+
+
+def set_shared_client(client: AuthenticatedClient) -> AuthenticatedClient:
+    """Register an existing client as the shared client for its base URL and token.
+
+    Use this to share a client configured with custom settings (timeouts, transports, limits, ...).
+
+    Returns:
+        The registered client
+    """
+    with _lock:
+        _clients[(client._base_url, client.token)] = client
+    return client
+
+
+def close_shared_clients() -> None:
+    """Close the synchronous connection pools of every shared client and forget them."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        if client._client is not None:
+            client._client.close()
+
+
+async def aclose_shared_clients() -> None:
+    """Close both the synchronous and asynchronous connection pools of every shared client and forget them.
+
+    The clients of ``get_shared_async_client`` are closed for the running event loop only.
+    """
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+        clients.extend(_async_clients.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        if client._client is not None:
+            client._client.close()
+        if client._async_client is not None:
+            await client._async_client.aclose()
+
+
+async def _aclose_loop_clients() -> None:
+    """Close and forget the ``get_shared_async_client`` clients of the running event loop"""
+    with _lock:
+        clients = list(_async_clients.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        if client._async_client is not None:
+            await client._async_client.aclose()
+
+
+def _run_blocking(main: Callable[[Optional[AuthenticatedClient]], Awaitable[T]],
+                  client: Optional[AuthenticatedClient]) -> T:
+    """Run ``main(client)`` in a new event loop for the blocking counterpart of an async helper
+
+    ``asyncio.run`` closes its event loop at the end, and with it any async connection pool opened on it. So a
+    given ``client`` is passed on as a copy with its own async connection pool, and the copy and the shared clients
+    of the loop are closed before the loop is, leaving ``client`` usable for the next call.
+    """
+    async def run() -> T:
+        run_client = evolve(client) if client is not None else None
+        try:
+            return await main(run_client)
+        finally:
+            if run_client is not None and run_client._async_client is not None:
+                await run_client._async_client.aclose()
+            await _aclose_loop_clients()
+
+    return asyncio.run(run())
+
+
+__all__ = [
+    "get_shared_client",
+    "get_shared_async_client",
+    "set_shared_client",
+    "close_shared_clients",
+    "aclose_shared_clients",
+]
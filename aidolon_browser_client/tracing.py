@@ -0,0 +1,245 @@
+""" Optional OpenTelemetry tracing for sessions, actions and the HTTP requests they send
+
+With ``tracing=True`` on the client and ``opentelemetry-api`` installed, a ``BrowserSession`` is traced as an
+``aidolon.session`` span covering its lifetime, each action as a child span (``aidolon.click``,
+``aidolon.navigate``, ...) and each HTTP attempt as a client span below it, carrying the W3C ``traceparent``
+header to the API. Spans are only recorded when the application configures an OpenTelemetry SDK; without the
+package every helper here does nothing.
+"""
+
+from contextlib import contextmanager, nullcontext
+from typing import Any, Iterator, Optional
+
+import httpx
+
+from .endpoints import resolve_endpoint, session_id_from_path
+
+_api: Any = None  # the opentelemetry modules once imported, False when they are not installed
+
+_NULL_CONTEXT = nullcontext()
+
+INSTRUMENTATION_NAME = "aidolon_browser_client"
+
+
+def _otel() -> Any:
+    """The OpenTelemetry API, imported on first use, or None when it is not installed"""
+    global _api
+    if _api is None:
+        try:
+            from opentelemetry import context, propagate, trace
+        except ImportError:
+            _api = False
+        else:
+            _api = (trace, context, propagate, trace.get_tracer(INSTRUMENTATION_NAME))
+    return _api or None
+
+
+def available() -> bool:
+    """Whether ``opentelemetry-api`` is installed"""
+    return _otel() is not None
+
+
+def start_session_span(client: Any) -> Any:
+    """Start the span covering a session's lifetime, not made current
+
+    Returns None when the client does not have tracing enabled or OpenTelemetry is not installed.
+    """
+    if not getattr(client, "_tracing", False):
+        return None
+    otel = _otel()
+    if otel is None:
+        return None
+    return otel[3].start_span("aidolon.session", kind=otel[0].SpanKind.INTERNAL)
+
+
+def end_session_span(span: Any, session_id: Any = None) -> None:
+    if span is None:
+        return
+    if session_id is not None:
+        span.set_attribute("aidolon.session_id", str(session_id))
+    span.end()
+
+
+def action_span(parent: Any, action: str, session_id: Any = None):
+    """Context manager running an action in a span that is a child of the session span ``parent``
+
+    Yields the span, or None when ``parent`` is None because the session is not traced. Pass the action's
+    response to ``record_response``.
+    """
+    if parent is None:
+        return _NULL_CONTEXT
+    return _action_span(_otel(), parent, action, session_id)
+
+
+@contextmanager
+def _action_span(otel: Any, parent: Any, action: str, session_id: Any) -> Iterator[Any]:
+    trace = otel[0]
+    context = trace.set_span_in_context(parent)
+    attributes = {"aidolon.action": action}
+    if session_id is not None:
+        attributes["aidolon.session_id"] = str(session_id)
+    with otel[3].start_as_current_span(f"aidolon.{action}", context=context, kind=trace.SpanKind.INTERNAL,
+                                       attributes=attributes) as span:
+        yield span
+
+
+def record_response(span: Any, response: Any) -> None:
+    """Mark an action span as failed when the API answered with an ``Error`` model (or nothing)"""
+    if span is None:
+        return
+    from .models.error import Error
+
+    trace = _otel()[0]
+    if isinstance(response, Error):
+        span.set_attribute("aidolon.error_code", str(response.error_code))
+        span.set_attribute("aidolon.error", str(response.error))
+        span.set_status(trace.Status(trace.StatusCode.ERROR, str(response.error)))
+    elif response is None:
+        span.set_status(trace.Status(trace.StatusCode.ERROR, "No response"))
+
+
+def _start_client_span(request: httpx.Request) -> Any:
+    """Start the client span of one HTTP attempt and inject its trace context into the headers of API requests"""
+    trace, _, propagate, tracer = _otel()
+    path = request.url.path
+    endpoint = resolve_endpoint(request.method, path)
+    attributes = {
+        "http.request.method": request.method,
+        "url.full": str(request.url.copy_with(query=None)),
+        "server.address": request.url.host,
+    }
+    if request.url.port is not None:
+        attributes["server.port"] = request.url.port
+    if endpoint is not None:
+        attributes["aidolon.endpoint"] = endpoint.name
+        session_id = session_id_from_path(path)
+        if session_id is not None:
+            attributes["aidolon.session_id"] = session_id
+    try:
+        attributes["http.request.body.size"] = len(request.content)
+    except httpx.RequestNotRead:
+        pass
+    name = f"{request.method} {endpoint.name}" if endpoint is not None else request.method
+    span = tracer.start_span(name, kind=trace.SpanKind.CLIENT, attributes=attributes)
+    if endpoint is not None:
+        # Artifact hosts and other third parties do not get the trace context
+        propagate.inject(request.headers, context=trace.set_span_in_context(span))
+    return span
+
+
+def _on_response(span: Any, response: httpx.Response, stream_class: type) -> None:
+    span.set_attribute("http.response.status_code", response.status_code)
+    if response.status_code >= 400:
+        trace = _otel()[0]
+        span.set_attribute("error.type", str(response.status_code))
+        span.set_status(trace.Status(trace.StatusCode.ERROR))
+    if response.is_closed:
+        # The body was already read, e.g. by a transport returning a complete httpx.Response
+        span.set_attribute("http.response.body.size", len(response.content))
+        span.end()
+    else:
+        response.stream = stream_class(response.stream, span)
+
+
+def _on_exception(span: Any, exc: BaseException) -> None:
+    trace = _otel()[0]
+    span.record_exception(exc)
+    span.set_attribute("error.type", type(exc).__qualname__)
+    span.set_status(trace.Status(trace.StatusCode.ERROR, str(exc)))
+    span.end()
+
+
+class TracingTransport(httpx.BaseTransport):
+    """Sends each request in an OpenTelemetry client span, ended once the response body has been read"""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        span = _start_client_span(request)
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException as exc:
+            _on_exception(span, exc)
+            raise
+        _on_response(span, response, _SpanStream)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncTracingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``TracingTransport``"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        span = _start_client_span(request)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException as exc:
+            _on_exception(span, exc)
+            raise
+        _on_response(span, response, _AsyncSpanStream)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _SpanStream(httpx.SyncByteStream):
+    """Response body counting its size and ending the client span when closed"""
+
+    def __init__(self, stream: Any, span: Any):
+        self._stream = stream
+        self._span: Optional[Any] = span
+        self._size = 0
+
+    def __iter__(self):
+        for chunk in self._stream:
+            self._size += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            _end(self)
+
+
+class _AsyncSpanStream(httpx.AsyncByteStream):
+    def __init__(self, stream: Any, span: Any):
+        self._stream = stream
+        self._span: Optional[Any] = span
+        self._size = 0
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._size += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            _end(self)
+
+
+def _end(stream: Any) -> None:
+    span, stream._span = stream._span, None
+    if span is not None:
+        span.set_attribute("http.response.body.size", stream._size)
+        span.end()
+
+
+__all__ = [
+    "AsyncTracingTransport",
+    "TracingTransport",
+    "action_span",
+    "available",
+    "end_session_span",
+    "record_response",
+    "start_session_span",
+]
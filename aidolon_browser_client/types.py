@@ -1,10 +1,11 @@
 """ Contains some shared types for properties """
 
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 from http import HTTPStatus
-from typing import BinaryIO, Generic, Optional, TypeVar, Literal
+from typing import Any, BinaryIO, Callable, Generic, Optional, TypeVar, Literal, Union
 
-from attrs import define
+import httpx
+from attrs import define, field
 
 
 class Unset:
@@ -35,12 +36,62 @@ T = TypeVar("T")
 
 @define
 class Response(Generic[T]):
-    """ A response from an endpoint """
+    """ A response from an endpoint
+
+    ``content`` may be given as a callable, which is called on first access to produce the bytes.
+    """
 
     status_code: HTTPStatus
-    content: bytes
+    _content: Union[bytes, Callable[[], bytes]] = field(alias="content")
     headers: MutableMapping[str, str]
     parsed: Optional[T]
 
+    @property
+    def content(self) -> bytes:
+        if not isinstance(self._content, bytes):
+            self._content = self._content()
+        return self._content
+
+
+def raw_content(client: Any, response: httpx.Response, parsed: Any) -> Union[bytes, Callable[[], bytes]]:
+    """ The ``Response.content`` for a parsed response, according to the client's raw content settings
+
+    Keeps the body when ``client.keep_raw_content`` is True or the body could not be parsed. Otherwise
+    returns empty bytes, or with ``client.lazy_content`` a callable that re-encodes the parsed model with
+    the client's JSON codec when ``content`` is first read.
+    """
+    if client.keep_raw_content or parsed is None:
+        return response.content
+    if client.lazy_content and hasattr(parsed, "to_dict"):
+        return lambda: client.json_codec.encode(parsed.to_dict())
+    return b""
+
+
+class EmptyProperties(dict):
+    """ The read-only empty dict shared as ``additional_properties`` by every model that has none
+
+    Models replace it with their own dict on the first ``model[key] = value``, so the many instances
+    decoded from large responses do not each hold an empty dict. Adding keys to it directly raises
+    TypeError; reading, copying and pickling behave like an empty dict.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("additional_properties is shared while empty, set keys with model[key] = value")
+
+    __setitem__ = setdefault = update = __ior__ = _read_only
+
+    def __reduce__(self) -> str:
+        return "EMPTY_PROPERTIES"
+
+
+EMPTY_PROPERTIES: dict[str, Any] = EmptyProperties()
+
+
+def additional_properties(src_dict: Mapping[str, Any], known: frozenset[str]) -> dict[str, Any]:
+    """ The entries of ``src_dict`` whose keys are not in ``known``, without copying when there are none """
+    if known.issuperset(src_dict):
+        return EMPTY_PROPERTIES
+    return {key: value for key, value in src_dict.items() if key not in known}
+
 
-__all__ = ["UNSET", "File", "FileJsonType", "Response", "Unset"]
+__all__ = ["EMPTY_PROPERTIES", "UNSET", "EmptyProperties", "File", "FileJsonType", "Response", "Unset", "additional_properties", "raw_content"]
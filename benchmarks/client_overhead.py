@@ -0,0 +1,276 @@
+""" Measure the CPU the client spends per call of every endpoint, apart from the network
+
+Each endpoint module under ``aidolon_browser_client/api`` is called through ``sync_detailed`` against an in-memory
+transport answering with a pre-encoded payload, so nothing but the client and httpx runs. For every case the
+table splits one call into:
+
+    request: ``_get_kwargs``, i.e. ``to_dict`` and encoding the body
+    parse:   ``_build_response``, i.e. decoding the body, ``from_dict`` and wrapping it in a ``Response``
+    httpx:   ``httpx.Client.request`` with the prepared arguments
+    total:   the whole ``sync_detailed`` call
+
+Results can be appended to a history file and compared with the last entry saved there; the script exits with
+status 1 when the client's own time (request + parse) of any case grew by more than ``--threshold`` and
+``--min-delta`` microseconds. A run with regressions is only saved with ``--force``, so it cannot become the
+baseline by accident.
+
+    python benchmarks/client_overhead.py --save                 # record a baseline
+    python benchmarks/client_overhead.py --compare              # fail on regressions against it
+    python benchmarks/client_overhead.py --filter scrape_page   # only the matching cases
+
+Run it from the repository root.
+"""
+
+import argparse
+import datetime
+import inspect
+import json
+import platform
+import subprocess
+import sys
+import timeit
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import httpx
+
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.browser_actions import click_element, drag_and_drop, navigate_browser, press_key, type_text
+from aidolon_browser_client.api.content_extraction import generate_pdf, scrape_information, scrape_page, take_screenshot
+from aidolon_browser_client.api.session_management import (
+    close_all_browser_sessions,
+    close_browser_session,
+    create_browser_session,
+    get_browser_context,
+    get_session_status,
+    list_browser_sessions,
+    update_session_timeout,
+)
+from aidolon_browser_client.endpoints import resolve_endpoint
+from aidolon_browser_client.models import (
+    ClickElementBody,
+    CreateBrowserSessionBody,
+    DragAndDropBody,
+    GeneratePdfBody,
+    ListBrowserSessionsStatus,
+    NavigateBrowserBody,
+    PressKeyBody,
+    ScrapeInformationBody,
+    ScrapePageBody,
+    ScrapePageBodyFormatItem,
+    TakeScreenshotBody,
+    TypeTextBody,
+    UpdateSessionTimeoutBody,
+)
+
+DEFAULT_HISTORY = Path(".benchmarks") / "client_overhead.jsonl"
+
+SESSION_ID = uuid.UUID(int=1)
+
+MB = 1024 * 1024
+
+
+def _session(index: int) -> dict:
+    return {
+        "session_id": str(uuid.UUID(int=index)),
+        "status": "active",
+        "created_at": "2025-03-01T12:00:00Z",
+        "embed_url": f"https://app.aidolon.com/embed/{index}",
+        "updated_at": "2025-03-01T12:05:00.123456+00:00",
+        "last_active_at": "2025-03-01T12:05:00Z",
+        "closed_at": None,
+        "live_session": {
+            "url": "https://example.com",
+            "title": "Example Domain",
+            "is_loading": False,
+            "viewport": {"width": 1280, "height": 720},
+        },
+    }
+
+
+def _html(size: int) -> str:
+    row = '<div class="result"><a href="https://example.com/item">An example search result</a></div>\n'
+    return ("<html><body>\n" + row * (size // len(row) + 1))[:size]
+
+
+ACTION = {"success": True}
+
+# (label, endpoint module, call arguments, response payload)
+CASES: list[tuple[str, Any, dict[str, Any], dict]] = [
+    ("click_element", click_element, {"session_id": SESSION_ID, "body": ClickElementBody(selector="#submit")},
+     {**ACTION, "action": "click", "selector": "#submit"}),
+    ("drag_and_drop", drag_and_drop,
+     {"session_id": SESSION_ID, "body": DragAndDropBody(source_selector="#a", target_selector="#b")},
+     {**ACTION, "action": "drag_and_drop", "source_selector": "#a", "target_selector": "#b"}),
+    ("navigate_browser", navigate_browser,
+     {"session_id": SESSION_ID, "body": NavigateBrowserBody(url="https://example.com")},
+     {**ACTION, "action": "navigate", "url": "https://example.com"}),
+    ("press_key", press_key, {"session_id": SESSION_ID, "body": PressKeyBody(selector="#q", key="Enter")},
+     {**ACTION, "action": "press", "selector": "#q", "key": "Enter"}),
+    ("type_text", type_text, {"session_id": SESSION_ID, "body": TypeTextBody(selector="#q", text="browser automation")},
+     {**ACTION, "action": "type_text", "selector": "#q", "text": "browser automation"}),
+    ("generate_pdf", generate_pdf, {"session_id": SESSION_ID, "body": GeneratePdfBody()},
+     {**ACTION, "action": "pdf", "data": {"url": "https://example.com", "pdf_url": "https://cdn.example.com/a.pdf"}}),
+    ("scrape_information", scrape_information,
+     {"session_id": SESSION_ID, "body": ScrapeInformationBody(description="the product names and prices")},
+     {**ACTION, "action": "scrape_information", "description": "the product names and prices",
+      "data": {"products": [{"name": f"Product {i}", "price": f"{i}.99"} for i in range(50)]}}),
+    ("scrape_page (5 MB html)", scrape_page,
+     {"session_id": SESSION_ID, "body": ScrapePageBody(format_=[ScrapePageBodyFormatItem.HTML])},
+     {**ACTION, "action": "scrape", "data": {"html": _html(5 * MB)}}),
+    ("take_screenshot", take_screenshot, {"session_id": SESSION_ID, "body": TakeScreenshotBody(full_page=True)},
+     {**ACTION, "action": "screenshot",
+      "data": {"url": "https://example.com", "screenshot_url": "https://cdn.example.com/a.png"}}),
+    ("close_all_browser_sessions", close_all_browser_sessions, {},
+     {**ACTION, "closed_count": 3, "message": "Closed 3 sessions"}),
+    ("close_browser_session", close_browser_session, {"session_id": SESSION_ID},
+     {**ACTION, "session_id": str(SESSION_ID), "status": "closed"}),
+    ("create_browser_session", create_browser_session, {"body": CreateBrowserSessionBody(timeout=600)},
+     {**ACTION, "session_id": str(SESSION_ID), "embed_url": "https://app.aidolon.com/embed/1", "status": "active",
+      "created_at": "2025-03-01T12:00:00Z", "live_session": _session(1)["live_session"]}),
+    ("get_browser_context", get_browser_context, {"session_id": SESSION_ID},
+     {**ACTION, "context": {
+         "cookies": [{"name": f"c{i}", "value": "x" * 32, "domain": "example.com", "path": "/"} for i in range(20)],
+         "localStorage": {"theme": "dark"}, "sessionStorage": {}, "userAgent": "Mozilla/5.0"}}),
+    ("get_session_status", get_session_status, {"session_id": SESSION_ID},
+     {**ACTION, **_session(1), "closed_at": "2025-03-01T12:10:00Z"}),
+    ("list_browser_sessions (1000)", list_browser_sessions, {"status": ListBrowserSessionsStatus.ACTIVE},
+     {**ACTION, "sessions": [_session(i) for i in range(1000)], "count": 1000, "filtered_by": "active"}),
+    ("update_session_timeout", update_session_timeout,
+     {"session_id": SESSION_ID, "body": UpdateSessionTimeoutBody(timeout=900)},
+     {**ACTION, "session_id": str(SESSION_ID), "timeout": 900}),
+]
+
+COLUMNS = ("request", "parse", "httpx", "total")
+
+MIN_RUN_TIME = 0.1
+
+
+class CannedTransport(httpx.BaseTransport):
+    """Answers each endpoint with its pre-encoded payload, without copying it"""
+
+    def __init__(self, payloads: dict[str, bytes]):
+        self._payloads = payloads
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint = resolve_endpoint(request.method, request.url.path)
+        return httpx.Response(200, content=self._payloads[endpoint.name],
+                              headers={"content-type": "application/json"})
+
+
+def _time(call: Callable[[], Any], repeat: int) -> float:
+    """Fastest time of one call in microseconds, over ``repeat`` runs of at least ``MIN_RUN_TIME`` each"""
+    timer = timeit.Timer(call)
+    number = 1
+    while timer.timeit(number) < MIN_RUN_TIME:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def measure(cases: list[tuple[str, Any, dict[str, Any], dict]], repeat: int) -> dict[str, dict[str, float]]:
+    """Time each case, returning microseconds per call for every column of ``COLUMNS``"""
+    results = {}
+    for label, module, arguments, payload in cases:
+        name = module.__name__.rpartition(".")[2]
+        client = AuthenticatedClient(base_url="http://bench", token="bench", httpx_args={
+            "transport": CannedTransport({name: json.dumps(payload).encode()})})
+        httpx_client = client.get_httpx_client()
+        if "json_codec" in inspect.signature(module._get_kwargs).parameters:
+            arguments = {**arguments, "json_codec": client.json_codec}
+        kwargs = module._get_kwargs(**arguments)
+        response = httpx_client.request(**kwargs)
+        call_arguments = {key: value for key, value in arguments.items() if key != "json_codec"}
+        if module.sync_detailed(client=client, **call_arguments).status_code != 200:
+            raise SystemExit(f"{label}: the request failed")
+        results[label] = {
+            "request": _time(lambda: module._get_kwargs(**arguments), repeat),
+            "parse": _time(lambda: module._build_response(client=client, response=response), repeat),
+            "httpx": _time(lambda: httpx_client.request(**kwargs), repeat),
+            "total": _time(lambda: module.sync_detailed(client=client, **call_arguments), repeat),
+        }
+        httpx_client.close()
+    return results
+
+
+def client_time(result: dict[str, float]) -> float:
+    return result["request"] + result["parse"]
+
+
+def revision() -> str:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], check=True, capture_output=True, text=True)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], check=True,
+                               capture_output=True, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit.stdout.strip() + ("-dirty" if dirty.stdout.strip() else "")
+
+
+def load_last(history: Path) -> Optional[dict]:
+    if not history.exists():
+        return None
+    lines = history.read_text().splitlines()
+    return json.loads(lines[-1]) if lines else None
+
+
+def save(history: Path, results: dict[str, dict[str, float]]) -> None:
+    entry = {
+        "revision": revision(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    history.parent.mkdir(parents=True, exist_ok=True)
+    with history.open("a") as file:
+        file.write(json.dumps(entry) + "\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="only run cases whose label contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per column; the fastest is reported")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY, help="JSON lines file of saved runs")
+    parser.add_argument("--save", action="store_true", help="append this run to the history file")
+    parser.add_argument("--force", action="store_true", help="with --save, save the run even if it regressed")
+    parser.add_argument("--compare", action="store_true", help="compare with the last run in the history file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative growth of request + parse time counted as a regression")
+    parser.add_argument("--min-delta", type=float, default=5.0,
+                        help="microseconds of growth below which a case is never a regression, to ignore noise")
+    args = parser.parse_args()
+
+    baseline = load_last(args.history) if args.compare else None
+    if args.compare and baseline is None:
+        raise SystemExit(f"No saved run in {args.history}, record one with --save first")
+
+    results = measure([case for case in CASES if args.filter in case[0]], args.repeat)
+    header = f"{'case':<32}" + "".join(f"{column + ' us':>14}" for column in COLUMNS)
+    if baseline is not None:
+        header += f"{'change':>10}"
+        print(f"compared with {baseline['revision']} of {baseline['timestamp']}")
+    print(header)
+    regressions = []
+    for label, result in results.items():
+        line = f"{label:<32}" + "".join(f"{result[column]:>14.1f}" for column in COLUMNS)
+        previous = baseline["results"].get(label) if baseline is not None else None
+        if previous is not None:
+            change = client_time(result) / client_time(previous) - 1
+            line += f"{change:>+10.0%}"
+            if change > args.threshold and client_time(result) - client_time(previous) > args.min_delta:
+                regressions.append(label)
+        print(line)
+
+    if args.save and (args.force or not regressions):
+        save(args.history, results)
+    if regressions:
+        print(f"Regressed by more than {args.threshold:.0%}: {', '.join(regressions)}", file=sys.stderr)
+        if args.save and not args.force:
+            print(f"Not saved to {args.history}, pass --force to save it anyway", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+""" Compare HTTP/1.1 and HTTP/2 throughput and socket usage against a local stand-in server
+
+Every simulated session sends ``--requests`` navigate calls through one shared AuthenticatedClient.
+The server counts accepted TCP connections, so the table shows how many sockets each mode needed.
+
+    python benchmarks/http2_multiplexing.py --sessions 1 10 100 --requests 20 --latency 0.01
+
+HTTP/2 rows are skipped when the ``h2`` package is not installed.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.browser_actions import navigate_browser
+from aidolon_browser_client.models import NavigateBrowserBody
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:  # pragma: no cover - depends on the environment
+    h2 = None
+
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+RESPONSE_BODY = json.dumps({"success": True, "action": "navigate", "url": "https://example.com"}).encode()
+
+
+class StandInServer:
+    """A tiny keep-alive HTTP/1.1 and prior-knowledge HTTP/2 server answering every request with RESPONSE_BODY"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.connections = 0
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            head = await reader.readexactly(len(H2_PREFACE))
+            if head == H2_PREFACE:
+                await self._serve_h2(head, reader, writer)
+            else:
+                await self._serve_h11(head, reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_h11(self, buffer: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+            head, _, buffer = buffer.partition(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            while len(buffer) < length:
+                buffer += await reader.readexactly(length - len(buffer))
+            buffer = buffer[length:]
+            await asyncio.sleep(self.latency)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + b"Content-Length: " + str(len(RESPONSE_BODY)).encode() + b"\r\n\r\n" + RESPONSE_BODY
+            )
+            await writer.drain()
+
+    async def _serve_h2(self, preface: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.latency)
+            conn.send_headers(stream_id, [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(RESPONSE_BODY))),
+            ])
+            conn.send_data(stream_id, RESPONSE_BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        pending = set()
+        data = preface
+        while data:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            writer.write(conn.data_to_send())
+            await writer.drain()
+            data = await reader.read(65536)
+
+
+async def _run_session(client: AuthenticatedClient, requests: int) -> None:
+    session_id = uuid.uuid4()
+    body = NavigateBrowserBody(url="https://example.com")
+    for _ in range(requests):
+        await navigate_browser.asyncio_detailed(session_id, client=client, body=body)
+
+
+async def measure(http2: bool, sessions: int, requests: int, latency: float) -> tuple[float, int]:
+    server = StandInServer(latency)
+    base_url = await server.start()
+    httpx_args = {"http1": False} if http2 else {}
+    client = AuthenticatedClient(base_url=base_url, token="benchmark", http2=http2, httpx_args=httpx_args)
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(_run_session(client, requests) for _ in range(sessions)))
+        elapsed = time.perf_counter() - started
+    finally:
+        await client.get_async_httpx_client().aclose()
+        await server.stop()
+    return sessions * requests / elapsed, server.connections
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--requests", type=int, default=20, help="requests per session")
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated server processing time in seconds")
+    args = parser.parse_args()
+
+    modes = [False, True] if h2 is not None else [False]
+    print(f"{'protocol':<10}{'sessions':>10}{'req/s':>12}{'sockets':>10}")
+    for sessions in args.sessions:
+        for http2 in modes:
+            rate, sockets = asyncio.run(measure(http2, sessions, args.requests, args.latency))
+            print(f"{'HTTP/2' if http2 else 'HTTP/1.1':<10}{sessions:>10}{rate:>12.1f}{sockets:>10}")
+    if h2 is None:
+        print("HTTP/2 rows skipped: install the 'h2' package to include them")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+""" Compare model ``from_dict`` speed against the models of another git revision
+
+The baseline package is exported from ``--baseline`` with ``git archive`` into a temporary directory and
+imported next to the working tree's, then each model is decoded from the same payload by both. Before
+timing, the two results are checked to serialize identically.
+
+    python benchmarks/model_decoding.py --baseline c3c3260 --number 2000
+
+Run it from the repository root, with the working tree holding the version to measure.
+"""
+
+import argparse
+import importlib
+import io
+import subprocess
+import sys
+import tarfile
+import tempfile
+import timeit
+import uuid
+from pathlib import Path
+
+import aidolon_browser_client.models as current_models
+from aidolon_browser_client import set_lazy_timestamps
+
+BASELINE_PACKAGE = "_baseline_aidolon_browser_client"
+
+
+def _session(index: int) -> dict:
+    return {
+        "session_id": str(uuid.UUID(int=index)),
+        "status": "active",
+        "created_at": "2025-03-01T12:00:00Z",
+        "embed_url": f"https://app.aidolon.com/embed/{index}",
+        "updated_at": "2025-03-01T12:05:00.123456+00:00",
+        "last_active_at": "2025-03-01T12:05:00Z",
+        "closed_at": None,
+        "live_session": {
+            "url": "https://example.com",
+            "title": "Example Domain",
+            "is_loading": False,
+            "viewport": {"width": 1280, "height": 720},
+        },
+    }
+
+
+# (row label, model name, payload)
+CASES = [
+    ("BrowserSessionLiveSessionType0", "BrowserSessionLiveSessionType0", _session(0)["live_session"]),
+    ("BrowserSession", "BrowserSession", _session(0)),
+    ("ListBrowserSessionsResponse200 (10)", "ListBrowserSessionsResponse200",
+     {"success": True, "sessions": [_session(i) for i in range(10)], "count": 10, "filtered_by": "active"}),
+    ("ListBrowserSessionsResponse200 (1000)", "ListBrowserSessionsResponse200",
+     {"success": True, "sessions": [_session(i) for i in range(1000)], "count": 1000, "filtered_by": "active"}),
+    ("GetSessionStatusResponse200", "GetSessionStatusResponse200",
+     {"success": True, **_session(0), "closed_at": "2025-03-01T12:10:00Z", "live_session": {"url": "https://example.com"}}),
+    ("CreateBrowserSessionResponse200", "CreateBrowserSessionResponse200",
+     {"success": True, "session_id": str(uuid.UUID(int=1)), "embed_url": "https://app.aidolon.com/embed/1",
+      "status": "active", "created_at": "2025-03-01T12:00:00Z", "live_session": {"url": "about:blank"}}),
+]
+
+
+def load_baseline(revision: str, directory: str):
+    """Export the package at ``revision`` under another name, without its ``__init__``, and import its models"""
+    archive = subprocess.run(
+        ["git", "archive", "--format=tar", revision, "aidolon_browser_client"],
+        check=True, capture_output=True,
+    ).stdout
+    root = Path(directory)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(root)
+    package = root / BASELINE_PACKAGE
+    (root / "aidolon_browser_client").rename(package)
+    (package / "__init__.py").write_text("")
+    sys.path.insert(0, str(root))
+    return importlib.import_module(f"{BASELINE_PACKAGE}.models")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default="HEAD", help="git revision whose models are the baseline")
+    parser.add_argument("--number", type=int, default=2000, help="decodes per timing run of the single-session cases")
+    parser.add_argument("--repeat", type=int, default=5, help="timing runs per case; the fastest is reported")
+    parser.add_argument("--lazy-timestamps", action="store_true",
+                        help="defer timestamp parsing in the current models (see set_lazy_timestamps)")
+    args = parser.parse_args()
+    set_lazy_timestamps(args.lazy_timestamps)
+
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_models = load_baseline(args.baseline, directory)
+        print(f"{'model':<40}{'baseline us':>14}{'current us':>14}{'speedup':>10}")
+        for label, name, payload in CASES:
+            baseline = getattr(baseline_models, name).from_dict
+            current = getattr(current_models, name).from_dict
+            if baseline(payload).to_dict() != current(payload).to_dict():
+                raise SystemExit(f"{label}: decoded objects differ from the baseline")
+            number = max(1, args.number // len(payload.get("sessions", [None])))
+            timings = [
+                min(timeit.repeat(lambda: decode(payload), number=number, repeat=args.repeat)) / number * 1e6
+                for decode in (baseline, current)
+            ]
+            print(f"{label:<40}{timings[0]:>14.2f}{timings[1]:>14.2f}{timings[0] / timings[1]:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+""" Compare the memory held by decoded models with the models of another git revision
+
+Decodes a ``list_browser_sessions`` payload of ``--sessions`` sessions with the working tree's models and with
+the models exported from ``--baseline`` (see ``model_decoding.py``), and reports per session:
+
+- the model objects themselves (``BrowserSession``, its live session and viewport) and their
+  ``additional_properties`` dicts, counted once when shared
+- everything allocated while decoding and still held by the result, measured with ``tracemalloc``
+
+    python benchmarks/model_memory.py --baseline c3c3260 --sessions 10000
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import tracemalloc
+
+import aidolon_browser_client.models as current_models
+from model_decoding import _session, load_baseline
+
+
+def model_bytes(session) -> int:
+    """Size of a decoded session's model objects and their additional_properties dicts"""
+    objects = [session, session.live_session, session.live_session.viewport]
+    size = sum(sys.getsizeof(obj) for obj in objects)
+    return size + sum(sys.getsizeof(obj.additional_properties) for obj in objects
+                      if type(obj.additional_properties) is dict)
+
+
+def measure(models, payload) -> tuple[float, float]:
+    """Return (model bytes, retained bytes) per session for decoding ``payload`` with ``models``"""
+    from_dict = models.ListBrowserSessionsResponse200.from_dict
+    from_dict({"sessions": payload["sessions"][:1]})  # import lazily loaded modules outside the measurement
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    parsed = from_dict(payload)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    count = len(parsed.sessions)
+    return sum(model_bytes(session) for session in parsed.sessions) / count, retained / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default="HEAD", help="git revision whose models are the baseline")
+    parser.add_argument("--sessions", type=int, default=10000, help="sessions in the decoded listing")
+    args = parser.parse_args()
+
+    payload = {"success": True, "sessions": [_session(i) for i in range(args.sessions)], "count": args.sessions}
+    with tempfile.TemporaryDirectory() as directory:
+        baseline_models = load_baseline(args.baseline, directory)
+        print(f"{'models':<12}{'model bytes/session':>22}{'retained bytes/session':>25}")
+        for label, models in (("baseline", baseline_models), ("current", current_models)):
+            per_model, retained = measure(models, payload)
+            print(f"{label:<12}{per_model:>22.0f}{retained:>25.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# This file makes the directory a package
@@ -0,0 +1,77 @@
+import asyncio
+import io
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.browser import AsyncBrowserSession, BrowserSession
+from aidolon_browser_client.browser.artifacts import download
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+IMAGE = bytes(range(256)) * 4096
+
+
+def _mock_client(downloads):
+    """Return a client whose screenshots and PDFs are hosted on a separate storage host"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "storage.example.com":
+            downloads.append(request)
+            if request.url.path == "/missing.pdf":
+                return httpx.Response(404)
+            return httpx.Response(200, content=IMAGE)
+        path = request.url.path
+        if path == "/browser/session":
+            return httpx.Response(200, json={"success": True, "session_id": SESSION_ID, "status": "active"})
+        if path.endswith("/screenshot"):
+            return httpx.Response(200, json={"success": True, "action": "screenshot",
+                                             "data": {"screenshot_url": "https://storage.example.com/shot.png"}})
+        return httpx.Response(200, json={"success": True, "action": "pdf",
+                                         "data": {"pdf_url": "https://storage.example.com/missing.pdf"}})
+
+    transport = httpx.MockTransport(handler)
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token")
+    client.set_httpx_client(httpx.Client(base_url="http://testserver", transport=transport,
+                                         headers={"X-API-Key": "test-token"}))
+    client.set_async_httpx_client(httpx.AsyncClient(base_url="http://testserver", transport=transport,
+                                                    headers={"X-API-Key": "test-token"}))
+    return client
+
+
+def test_save_screenshot_to_path(tmp_path):
+    """Test streaming a screenshot to disk without sending the API key to the storage host"""
+    downloads = []
+    session = BrowserSession(client=_mock_client(downloads))
+    response = session.save_screenshot(tmp_path / "shot.png")
+    assert response.data.screenshot_url == "https://storage.example.com/shot.png"
+    assert (tmp_path / "shot.png").read_bytes() == IMAGE
+    assert "X-API-Key" not in downloads[0].headers
+
+
+def test_api_key_is_only_sent_to_the_api_origin():
+    """Test that the same host on another scheme or port does not get the API key"""
+    downloads = []
+    client = AuthenticatedClient(base_url="https://api.example.com", token="test-token", httpx_args={
+        "transport": httpx.MockTransport(lambda request: downloads.append(request) or httpx.Response(200))})
+    for url in ("https://api.example.com:443/a.png", "/b.png", "http://api.example.com/c.png",
+                "https://api.example.com:8443/d.png"):
+        download(client, url, io.BytesIO())
+    assert [client.auth_header_name in request.headers for request in downloads] == [True, True, False, False]
+
+
+def test_failed_download_removes_partial_file(tmp_path):
+    """Test that an error status raises and leaves no file behind"""
+    session = BrowserSession(client=_mock_client([]))
+    with pytest.raises(httpx.HTTPStatusError):
+        session.save_pdf(tmp_path / "page.pdf")
+    assert not (tmp_path / "page.pdf").exists()
+
+
+def test_save_screenshot_async_to_file_object():
+    """Test the async variant writing to a file-like object"""
+    async def run():
+        session = await AsyncBrowserSession(client=_mock_client([])).start()
+        buffer = io.BytesIO()
+        await session.save_screenshot(buffer)
+        return buffer.getvalue()
+
+    assert asyncio.run(run()) == IMAGE
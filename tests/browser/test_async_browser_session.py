@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.browser import AsyncBrowserSession, create_async_session
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    """Answer the handful of routes the async session needs"""
+    path = request.url.path
+    if path == "/browser/session":
+        return httpx.Response(200, json={
+            "success": True,
+            "session_id": SESSION_ID,
+            "embed_url": "https://example.com/embed",
+            "status": "active",
+        })
+    if path.endswith("/navigate"):
+        return httpx.Response(200, json={"success": True, "action": "navigate", "url": "https://example.com"})
+    if request.method == "DELETE":
+        return httpx.Response(200, json={"success": True, "session_id": SESSION_ID, "status": "closed"})
+    return httpx.Response(404, json={"success": False, "error": "not found", "error_code": "NOT_FOUND"})
+
+
+def _mock_client() -> AuthenticatedClient:
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token")
+    client.set_async_httpx_client(httpx.AsyncClient(
+        base_url="http://testserver", transport=httpx.MockTransport(_handler)
+    ))
+    return client
+
+
+def test_async_session_lifecycle():
+    """Test creating, using and closing a session with async with"""
+    async def run():
+        async with AsyncBrowserSession(client=_mock_client()) as session:
+            assert str(session.session_id) == SESSION_ID
+            response = await session.navigate("https://example.com")
+            assert response.success is True
+            assert response.url == "https://example.com"
+        assert session.session_id is None
+
+    asyncio.run(run())
+
+
+def test_async_sessions_share_client():
+    """Test that sessions created from one client reuse its httpx.AsyncClient"""
+    async def run():
+        client = _mock_client()
+        sessions = await asyncio.gather(*(create_async_session(client=client) for _ in range(3)))
+        assert {id(s.client.get_async_httpx_client()) for s in sessions} == {id(client.get_async_httpx_client())}
+        await asyncio.gather(*(s.close_session() for s in sessions))
+
+    asyncio.run(run())
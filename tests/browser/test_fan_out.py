@@ -0,0 +1,66 @@
+import asyncio
+import json
+import uuid
+
+import httpx
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.browser import map_sessions, run_many
+from aidolon_browser_client.mock import MOCK_TOKEN, MockAPI, serve
+
+
+def _mock_client(created):
+    """Return a client whose server creates sessions and echoes navigations"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/browser/session":
+            created.append(1)
+            return httpx.Response(200, json={"success": True, "session_id": str(uuid.uuid4()), "status": "active"})
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"success": True, "status": "closed"})
+        url = json.loads(request.content)["url"]
+        return httpx.Response(200, json={"success": True, "action": "navigate", "url": url})
+
+    return AuthenticatedClient(base_url="http://testserver", token="test-token",
+                               httpx_args={"transport": httpx.MockTransport(handler)})
+
+
+async def _visit(session, url):
+    if url.endswith("/broken"):
+        raise RuntimeError("page crashed")
+    response = await session.navigate(url)
+    return response.url
+
+
+def test_run_many_reuses_sessions_and_reports_failures():
+    """Test that items share a bounded number of sessions and failures do not stop the batch"""
+    created = []
+    urls = [f"https://example.com/{i}" for i in range(20)] + ["https://example.com/broken"]
+
+    async def run():
+        return [result async for result in run_many(urls, _visit, concurrency=3, client=_mock_client(created))]
+
+    results = asyncio.run(run())
+    assert len(results) == 21
+    failed = [result for result in results if not result.ok]
+    assert [result.item for result in failed] == ["https://example.com/broken"]
+    assert all(result.result == result.item for result in results if result.ok)
+    assert all(result.latency >= 0 for result in results)
+    # one session per worker, plus at most one replacement after the failure
+    assert len(created) <= 4
+
+
+def test_map_sessions_returns_results_in_order():
+    """Test the blocking helper"""
+    urls = [f"https://example.com/{i}" for i in range(5)]
+    results = map_sessions(urls, _visit, concurrency=2, client=_mock_client([]))
+    assert [result.result for result in results] == urls
+
+
+def test_map_sessions_can_reuse_a_client():
+    """Test that one client can be passed to several map_sessions calls, each running its own event loop"""
+    urls = [f"https://example.com/{i}" for i in range(4)]
+    with serve(MockAPI()) as base_url:
+        client = AuthenticatedClient(base_url=base_url, token=MOCK_TOKEN)
+        for _ in range(2):
+            results = map_sessions(urls, _visit, concurrency=2, client=client)
+            assert [result.error for result in results] == [None] * 4
+            assert [result.result for result in results] == urls
@@ -0,0 +1,71 @@
+import asyncio
+
+import httpx
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.browser import AsyncBrowserSession, BrowserSession
+from aidolon_browser_client.models import NavigateBrowserBody
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+ERROR = {"success": False, "error": "element not found", "error_code": "ELEMENT_NOT_FOUND"}
+
+
+def _mock_client(requests, fail_on=None) -> AuthenticatedClient:
+    """Return a client answering session creation and every action, failing the action named ``fail_on``"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        action = request.url.path.rsplit("/", 1)[-1]
+        if action == "session":
+            return httpx.Response(200, json={"success": True, "session_id": SESSION_ID, "status": "active"})
+        requests.append(action)
+        if action == fail_on:
+            return httpx.Response(400, json=ERROR)
+        return httpx.Response(200, json={"success": True, "action": action})
+
+    transport = httpx.MockTransport(handler)
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token")
+    client.set_httpx_client(httpx.Client(base_url="http://testserver", transport=transport))
+    client.set_async_httpx_client(httpx.AsyncClient(base_url="http://testserver", transport=transport))
+    return client
+
+
+def test_pipeline_runs_steps_in_order():
+    """Test that every recorded action is sent in order with its timing"""
+    requests = []
+    session = BrowserSession(client=_mock_client(requests))
+    result = (
+        session.pipeline()
+        .navigate("https://www.google.com")
+        .type("the search input", "donuts")
+        .press("the search input", "Enter")
+        .add(NavigateBrowserBody(url="https://example.com"))
+        .run()
+    )
+    assert result.ok
+    assert requests == ["navigate", "type_text", "press", "navigate"]
+    assert [step.action for step in result.steps] == ["navigate_browser", "type_text", "press_key", "navigate_browser"]
+    assert all(step.elapsed >= 0 for step in result.steps)
+    assert result.responses[1].action == "type_text"
+
+
+def test_pipeline_stops_on_first_error():
+    """Test that steps after a failed one are not sent"""
+    requests = []
+    session = BrowserSession(client=_mock_client(requests, fail_on="click"))
+    result = session.pipeline().navigate("https://example.com").click("missing").take_screenshot().run()
+    assert not result.ok
+    assert requests == ["navigate", "click"]
+    assert result.failed_step.action == "click_element"
+    assert result.failed_step.parsed.error_code == "ELEMENT_NOT_FOUND"
+    assert result.pending == 1
+
+
+def test_pipeline_async():
+    """Test running a batch with an AsyncBrowserSession"""
+    requests = []
+
+    async def run():
+        session = await AsyncBrowserSession(client=_mock_client(requests)).start()
+        return await session.pipeline().navigate("https://example.com").click("a link").run_async()
+
+    result = asyncio.run(run())
+    assert result.ok
+    assert requests == ["navigate", "click"]
@@ -0,0 +1,75 @@
+import io
+import logging
+
+import httpx
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.browser import BrowserSession
+from aidolon_browser_client.log import disable_verbose_logging, enable_verbose_logging
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path == "/browser/session":
+        return httpx.Response(200, json={"success": True, "session_id": SESSION_ID, "status": "active"})
+    if path.endswith("/navigate"):
+        return httpx.Response(200, json={"success": True, "action": "navigate", "url": "https://example.com"})
+    if request.method == "DELETE":
+        return httpx.Response(200, json={"success": True, "session_id": SESSION_ID, "status": "closed"})
+    return httpx.Response(404, json={"success": False, "error": "not found", "error_code": "NOT_FOUND"})
+
+
+def _client() -> AuthenticatedClient:
+    return AuthenticatedClient(base_url="http://testserver", token="test-token",
+                               httpx_args={"transport": httpx.MockTransport(_handler)})
+
+
+def test_actions_write_nothing_by_default(capsys):
+    """Test that session actions no longer print"""
+    with BrowserSession(client=_client()) as session:
+        session.navigate("https://example.com")
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert captured.err == ""
+
+
+def test_actions_emit_structured_events(caplog):
+    """Test that every action logs one record with session_id, action, duration and status"""
+    with caplog.at_level(logging.INFO, logger="aidolon_browser_client"):
+        with BrowserSession(client=_client()) as session:
+            session.navigate("https://example.com")
+            session.click("#missing")
+    records = [(r.action, r.status) for r in caplog.records]
+    assert records == [("create", "ok"), ("navigate", "ok"), ("click", "error"), ("close", "ok")]
+    assert all(str(r.session_id) == SESSION_ID and r.duration >= 0 for r in caplog.records)
+    assert caplog.records[1].url == "https://example.com"
+
+
+def test_verbose_logging():
+    stream = io.StringIO()
+    enable_verbose_logging(stream=stream)
+    try:
+        session = BrowserSession(client=_client())
+        session.close_session()
+        session.close_session()
+    finally:
+        disable_verbose_logging()
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 3
+    assert f"session {SESSION_ID} create ok in" in lines[0]
+    assert lines[2].endswith("session None close skipped in 0.000s")
+
+
+def test_disable_verbose_logging_restores_the_logger():
+    logger = logging.getLogger("aidolon_browser_client")
+    logger.setLevel(logging.WARNING)
+    try:
+        enable_verbose_logging(logging.DEBUG, stream=io.StringIO())
+        enable_verbose_logging(stream=io.StringIO())
+        assert logger.level == logging.INFO
+        disable_verbose_logging()
+        assert logger.level == logging.WARNING and logger.propagate
+        assert not logger.isEnabledFor(logging.INFO)
+    finally:
+        logger.setLevel(logging.NOTSET)
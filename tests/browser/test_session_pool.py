@@ -0,0 +1,189 @@
+import asyncio
+import uuid
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.browser import AsyncSessionPool, SessionPool
+from aidolon_browser_client.mock import MOCK_TOKEN, MockAPI, serve
+
+
+class FakeAPI:
+    """Tracks sessions so the pool's create/status/refresh/close calls can be checked"""
+
+    def __init__(self):
+        self.active = set()
+        self.created = 0
+        self.refreshed = 0
+        self.fail_creates = 0
+        self.fail_status = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/browser/session":
+            if self.fail_creates:
+                self.fail_creates -= 1
+                return httpx.Response(500, json={"success": False, "error": "Internal error", "error_code": "INTERNAL_ERROR"})
+            session_id = str(uuid.uuid4())
+            self.active.add(session_id)
+            self.created += 1
+            return httpx.Response(200, json={"success": True, "session_id": session_id, "status": "active"})
+        session_id = path.split("/")[3]
+        if path.endswith("/update-timeout"):
+            self.refreshed += 1
+            return httpx.Response(200, json={"success": True, "session_id": session_id, "timeout": 300})
+        if request.method == "DELETE":
+            self.active.discard(session_id)
+            return httpx.Response(200, json={"success": True, "session_id": session_id, "status": "closed"})
+        if self.fail_status:
+            self.fail_status -= 1
+            return httpx.Response(500, json={"success": False, "error": "Internal error", "error_code": "INTERNAL_ERROR"})
+        status = "active" if session_id in self.active else "closed"
+        return httpx.Response(200, json={"success": True, "session_id": session_id, "status": status,
+                                         "created_at": "2025-04-02T10:00:00Z"})
+
+    def client(self) -> AuthenticatedClient:
+        transport = httpx.MockTransport(self.handler)
+        client = AuthenticatedClient(base_url="http://testserver", token="test-token")
+        client.set_httpx_client(httpx.Client(base_url="http://testserver", transport=transport))
+        client.set_async_httpx_client(httpx.AsyncClient(base_url="http://testserver", transport=transport))
+        return client
+
+
+def test_pool_hands_out_warm_sessions():
+    """Test that sessions are created up front and reused after release"""
+    api = FakeAPI()
+    with SessionPool(size=2, client=api.client(), refresh_interval=3600) as pool:
+        assert api.created == 2
+        first = pool.acquire()
+        second = pool.acquire()
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+        pool.release(first)
+        assert pool.acquire() is first
+        pool.release(first)
+        pool.release(second)
+        assert api.created == 2
+    assert api.active == set()
+
+
+def test_pool_refresh_replaces_closed_sessions():
+    """Test that refresh extends live sessions and replaces closed ones"""
+    api = FakeAPI()
+    with SessionPool(size=2, client=api.client(), refresh_interval=3600) as pool:
+        expired = next(iter(api.active))
+        api.active.discard(expired)
+        pool.refresh()
+        assert api.refreshed == 1
+        assert api.created == 3
+        assert len(api.active) == 2
+
+
+class RecordingSpan:
+    def __init__(self):
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        pass
+
+    def end(self):
+        self.ended = True
+
+
+def test_pool_refresh_keeps_sessions_on_error_status():
+    """Test that a failed status check keeps the session, while a closed one is replaced with its span ended"""
+    api = FakeAPI()
+    with SessionPool(size=2, client=api.client(), refresh_interval=3600) as pool:
+        sessions = list(pool._idle)
+        spans = {session.session_id: RecordingSpan() for session in sessions}
+        for session in sessions:
+            session._span = spans[session.session_id]
+        api.fail_status = 2
+        pool.refresh()
+        assert api.created == 2
+        assert set(pool._idle) == set(sessions)
+
+        expired = sessions[0].session_id
+        api.active.discard(str(expired))
+        pool.refresh()
+        assert api.created == 3
+        assert spans[expired].ended
+        assert [span.ended for span in spans.values()].count(True) == 1
+
+
+def test_pool_refresh_survives_failed_creates():
+    """Test that a replacement that cannot be created is retried by the next refresh"""
+    api = FakeAPI()
+    with SessionPool(size=2, client=api.client(), refresh_interval=3600) as pool:
+        api.active.discard(next(iter(api.active)))
+        # the replacement and the top-up after it both fail
+        api.fail_creates = 2
+        pool.refresh()
+        assert len(api.active) == 1
+        pool.refresh()
+        assert len(api.active) == 2
+    assert api.active == set()
+
+
+def test_pool_start_closes_created_sessions_on_failure():
+    """Test that start() does not leave sessions open when one of them cannot be created"""
+    api = FakeAPI()
+    api.fail_creates = 1
+    with pytest.raises(Exception):
+        SessionPool(size=3, client=api.client(), refresh_interval=3600).start()
+    assert api.created == 2
+    assert api.active == set()
+
+
+def test_async_pool():
+    """Test acquiring, discarding and refreshing with the asyncio pool"""
+    api = FakeAPI()
+
+    async def run():
+        async with AsyncSessionPool(size=2, client=api.client(), refresh_interval=3600) as pool:
+            with pytest.raises(RuntimeError):
+                async with pool.session():
+                    raise RuntimeError("broken page")
+            await asyncio.sleep(0.01)
+            await pool.refresh()
+            assert api.created == 3
+            assert api.refreshed == 2
+
+    asyncio.run(run())
+    assert api.active == set()
+
+
+def test_async_pool_survives_failed_creates():
+    """Test failed creates during start() and refresh() with the asyncio pool"""
+    api = FakeAPI()
+
+    async def run():
+        api.fail_creates = 1
+        with pytest.raises(Exception):
+            await AsyncSessionPool(size=3, client=api.client(), refresh_interval=3600).start()
+        assert api.created == 2 and api.active == set()
+
+        async with AsyncSessionPool(size=2, client=api.client(), refresh_interval=3600) as pool:
+            api.active.discard(next(iter(api.active)))
+            api.fail_creates = 2
+            await pool.refresh()
+            assert len(api.active) == 1
+            await pool.refresh()
+            assert len(api.active) == 2
+
+    asyncio.run(run())
+    assert api.active == set()
+
+
+def test_async_pool_uses_shared_client_per_loop():
+    """Test that a pool without a client can be started from several event loops"""
+    api = MockAPI()
+
+    async def run(base_url):
+        async with AsyncSessionPool(size=2, api_key=MOCK_TOKEN, base_url=base_url, refresh_interval=3600) as pool:
+            async with pool.session() as browser:
+                assert browser.session_id
+
+    with serve(api) as base_url:
+        for _ in range(2):
+            asyncio.run(run(base_url))
@@ -2,9 +2,10 @@ import os
 import pytest
 from uuid import UUID
 from aidolon_browser_client.client import AuthenticatedClient
+from aidolon_browser_client.mock import MockAPI
 
-# Set default base URL if environment variable is not set
-BASE_URL = os.environ.get("API_BASE_URL", "http://localhost:3005")
+# Without API_BASE_URL the tests run against the in-process mock API instead of a live server
+BASE_URL = os.environ.get("API_BASE_URL")
 
 @pytest.fixture
 def mock_session_id():
@@ -14,6 +15,13 @@ def mock_session_id():
 @pytest.fixture
 def client():
     """Return an authenticated client with the mock API key"""
+    if BASE_URL is None:
+        return AuthenticatedClient(
+            base_url="http://localhost:3005",
+            token="give-me-mock-data",
+            headers={"Content-Type": "application/json"},
+            httpx_args={"transport": MockAPI().transport()},
+        )
     return AuthenticatedClient(
         base_url=BASE_URL,
         token="give-me-mock-data",
@@ -0,0 +1,54 @@
+import base64
+import io
+
+import httpx
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.content_extraction import scrape_page
+from aidolon_browser_client.models import ScrapePageBody, ScrapePageResponse200Data
+from aidolon_browser_client.types import UNSET
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+PDF = b"%PDF-1.7\n" + bytes(range(256)) * 1000
+
+
+def _client(keep_raw_content: bool) -> AuthenticatedClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"success": True, "data": {"pdf": base64.b64encode(PDF).decode()}})
+
+    return AuthenticatedClient(
+        base_url="http://testserver",
+        token="test-token",
+        keep_raw_content=keep_raw_content,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+def test_decode_inline_payloads(tmp_path):
+    """Test decoding the base64 PDF to bytes and to a file"""
+    data = ScrapePageResponse200Data(pdf=base64.b64encode(PDF).decode())
+    assert data.pdf_bytes() == PDF
+    assert data.screenshot_bytes() is None
+    view = data.pdf_view()
+    assert isinstance(view, memoryview) and view[:8] == PDF[:8] and view.tobytes() == PDF
+    assert data.screenshot_view() is None
+    assert data.write_pdf(tmp_path / "page.pdf") == len(PDF)
+    assert (tmp_path / "page.pdf").read_bytes() == PDF
+
+
+def test_write_payload_in_chunks_and_release():
+    """Test chunked decoding of wrapped base64 into a file object, dropping the string afterwards"""
+    data = ScrapePageResponse200Data(screenshot=base64.encodebytes(PDF).decode())
+    buffer = io.BytesIO()
+    data.write_screenshot(buffer, release=True)
+    assert buffer.getvalue() == PDF
+    assert data.screenshot is UNSET
+
+
+def test_drop_raw_content():
+    """Test that keep_raw_content=False leaves only the parsed model"""
+    body = ScrapePageBody(pdf=True)
+    kept = scrape_page.sync_detailed(SESSION_ID, client=_client(True), body=body)
+    dropped = scrape_page.sync_detailed(SESSION_ID, client=_client(False), body=body)
+    assert kept.content
+    assert dropped.content == b""
+    assert dropped.parsed.data.pdf_bytes() == PDF
@@ -0,0 +1,98 @@
+import asyncio
+import datetime
+import uuid
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.mock import MockAPI, serve
+from aidolon_browser_client.models import BrowserSession, Error
+from aidolon_browser_client.sessions import close_sessions, close_sessions_async, idle_seconds
+
+NOW = datetime.datetime.now(datetime.timezone.utc)
+
+
+def _session(idle: float, **extra) -> dict:
+    last_active = (NOW - datetime.timedelta(seconds=idle)).isoformat()
+    return {"session_id": str(uuid.uuid4()), "status": "active", "created_at": "2025-04-02T10:00:00Z",
+            "last_active_at": last_active, **extra}
+
+
+def _mock_client(sessions, closed, failing=(), in_flight=None):
+    """Return a client whose server lists ``sessions`` and records the closed ids and concurrent closes"""
+    current = [0]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            assert request.url.params["status"] == "active"
+            return httpx.Response(200, json={"success": True, "sessions": sessions, "count": len(sessions)})
+        session_id = request.url.path.rsplit("/", 1)[-1]
+        if in_flight is not None:
+            current[0] += 1
+            in_flight.append(current[0])
+            await asyncio.sleep(0.01)
+            current[0] -= 1
+        if session_id in failing:
+            return httpx.Response(404, json={"success": False, "error": "Not found", "error_code": "NOT_FOUND"})
+        closed.append(session_id)
+        return httpx.Response(200, json={"success": True, "session_id": session_id, "status": "closed"})
+
+    return AuthenticatedClient(base_url="http://testserver", token="test-token",
+                               httpx_args={"transport": httpx.MockTransport(handler)})
+
+
+def test_closes_idle_sessions_and_reports_failures():
+    """Test that only sessions idle long enough are closed, and a failed close is reported, not raised"""
+    sessions = [_session(7200), _session(10), _session(3600 * 5), _session(4000)]
+    failing = {sessions[3]["session_id"]}
+    closed, progress = [], []
+    report = close_sessions(idle_for=3600, client=_mock_client(sessions, closed, failing),
+                            on_progress=lambda done, total, result: progress.append((done, total)))
+    assert sorted(closed) == sorted([sessions[0]["session_id"], sessions[2]["session_id"]])
+    assert len(report) == 3
+    assert [str(result.session_id) for result in report.failed] == [sessions[3]["session_id"]]
+    assert report.failed[0].status_code == 404
+    assert isinstance(report.failed[0].response, Error)
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert report.wall_time >= max(result.latency for result in report.results)
+
+
+def test_concurrency_is_bounded():
+    ids = [str(uuid.uuid4()) for _ in range(12)]
+    closed, in_flight = [], []
+    report = asyncio.run(close_sessions_async(session_ids=ids, concurrency=3,
+                                              client=_mock_client([], closed, in_flight=in_flight)))
+    assert len(report.closed) == 12
+    assert sorted(closed) == sorted(ids)
+    assert max(in_flight) == 3
+
+
+def test_where_filter():
+    sessions = [_session(0, embed_url="https://embed/1"), _session(0)]
+    closed = []
+    close_sessions(where=lambda session: session.embed_url == "https://embed/1",
+                   client=_mock_client(sessions, closed))
+    assert closed == [sessions[0]["session_id"]]
+
+
+def test_idle_seconds_falls_back_to_created_at():
+    session = BrowserSession.from_dict({"session_id": str(uuid.uuid4()), "status": "active",
+                                        "created_at": "2025-04-02T10:00:00"})
+    now = datetime.datetime(2025, 4, 2, 11, tzinfo=datetime.timezone.utc)
+    assert idle_seconds(session, now) == 3600
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        close_sessions(session_ids=[], concurrency=0, client=_mock_client([], []))
+
+
+def test_blocking_calls_can_reuse_a_client():
+    """Test that one client can be passed to several close_sessions calls, each running its own event loop"""
+    api = MockAPI()
+    with serve(api) as base_url:
+        client = AuthenticatedClient(base_url=base_url, token="test-token")
+        for _ in range(2):
+            session_ids = [api.create_session() for _ in range(3)]
+            report = close_sessions(session_ids=session_ids, client=client)
+            assert len(report.closed) == 3
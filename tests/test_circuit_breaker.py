@@ -0,0 +1,125 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.browser_actions import click_element, navigate_browser
+from aidolon_browser_client.circuit import CircuitBreaker, CircuitState
+from aidolon_browser_client.errors import CircuitOpenError
+from aidolon_browser_client.metrics import Metrics
+from aidolon_browser_client.models import ClickElementBody, NavigateBrowserBody
+from aidolon_browser_client.retry import RetryPolicy
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+NAVIGATED = {"success": True, "action": "navigate", "url": "https://example.com"}
+ERROR = {"success": False, "error": "unavailable", "error_code": "UNAVAILABLE"}
+BODY = NavigateBrowserBody(url="https://example.com")
+
+
+def _client(outcomes, breaker, **options):
+    """Return a client whose server plays back ``outcomes`` (a status or an exception) and the requests it got"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        outcome = outcomes[min(len(requests), len(outcomes)) - 1]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json=NAVIGATED if outcome == 200 else ERROR)
+
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token", circuit_breaker=breaker,
+                                 httpx_args={"transport": httpx.MockTransport(handler)}, **options)
+    return client, requests
+
+
+def test_opens_fails_fast_and_recovers_through_a_probe():
+    changes = []
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+    client, requests = _client([503, httpx.ReadTimeout("timed out"), 200], breaker,
+                               metrics=Metrics(circuit_callbacks=[changes.append]))
+
+    assert navigate_browser.sync_detailed(SESSION_ID, client=client, body=BODY).status_code == 503
+    with pytest.raises(httpx.ReadTimeout):
+        navigate_browser.sync(SESSION_ID, client=client, body=BODY)
+    assert breaker.state("navigate_browser") is CircuitState.OPEN
+
+    started = time.monotonic()
+    with pytest.raises(CircuitOpenError) as error:
+        navigate_browser.sync(SESSION_ID, client=client, body=BODY)
+    assert time.monotonic() - started < 0.01
+    assert error.value.endpoint == "navigate_browser" and 0 < error.value.retry_after <= 0.05
+    assert len(requests) == 2
+    # circuits are per endpoint
+    assert breaker.state("click_element") is CircuitState.CLOSED
+
+    time.sleep(0.06)
+    assert navigate_browser.sync(SESSION_ID, client=client, body=BODY).success is True
+    assert breaker.state("navigate_browser") is CircuitState.CLOSED
+    assert [(change.old_state, change.new_state) for change in changes] == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+    assert changes[0].group == "browser_actions" and changes[0].failures == 2
+
+
+def test_failed_probe_reopens_and_extra_calls_are_rejected():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.02)
+    client, requests = _client([500], breaker)
+    navigate_browser.sync_detailed(SESSION_ID, client=client, body=BODY)
+    time.sleep(0.03)
+
+    release = asyncio.Event()
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(500, json=ERROR)
+
+    async def slow_handler(request):
+        await release.wait()
+        return handler(request)
+
+    async_client = AuthenticatedClient(base_url="http://testserver", token="test-token", circuit_breaker=breaker,
+                                       httpx_args={"transport": httpx.MockTransport(slow_handler)})
+
+    async def run():
+        probe = asyncio.ensure_future(navigate_browser.asyncio_detailed(SESSION_ID, client=async_client, body=BODY))
+        await asyncio.sleep(0)
+        assert breaker.state("navigate_browser") is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError, match="half-open"):
+            await navigate_browser.asyncio(SESSION_ID, client=async_client, body=BODY)
+        release.set()
+        return await probe
+
+    assert asyncio.run(run()).status_code == 500
+    assert breaker.state("navigate_browser") is CircuitState.OPEN
+    assert len(requests) == 2
+
+
+def test_open_circuit_stops_retries():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    client, requests = _client([503], breaker, retry=RetryPolicy(
+        max_attempts=5, backoff_factor=0, budget=None, retry_endpoints={"click_element"}))
+    with pytest.raises(CircuitOpenError):
+        click_element.sync(SESSION_ID, client=client, body=ClickElementBody(selector="#go"))
+    assert len(requests) == 2
+
+
+class _TimingOutBody(httpx.SyncByteStream):
+    def __iter__(self):
+        yield b'{"success": '
+        raise httpx.ReadTimeout("timed out reading the body")
+
+
+def test_body_read_timeouts_count_as_failures():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token", circuit_breaker=breaker,
+                                 httpx_args={"transport": httpx.MockTransport(
+                                     lambda request: httpx.Response(200, stream=_TimingOutBody()))})
+    for _ in range(2):
+        with pytest.raises(httpx.ReadTimeout):
+            navigate_browser.sync(SESSION_ID, client=client, body=BODY)
+    assert breaker.state("navigate_browser") is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError, match="for another"):
+        navigate_browser.sync(SESSION_ID, client=client, body=BODY)
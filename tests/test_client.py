@@ -0,0 +1,20 @@
+import sys
+
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+
+
+def test_http2_enabled_when_h2_installed():
+    """Test that http2=True configures an HTTP/2 capable pool"""
+    pytest.importorskip("h2")
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token", http2=True)
+    assert client.get_httpx_client()._transport._pool._http2 is True
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    """Test that a missing h2 package only warns and keeps HTTP/1.1"""
+    monkeypatch.setitem(sys.modules, "h2", None)
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token", http2=True)
+    with pytest.warns(RuntimeWarning, match="h2"):
+        httpx_client = client.get_httpx_client()
+    assert httpx_client._transport._pool._http2 is False
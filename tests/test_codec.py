@@ -0,0 +1,79 @@
+import json
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.browser_actions import navigate_browser
+from aidolon_browser_client.codec import CODECS, JSONCodec, default_codec, get_codec
+from aidolon_browser_client.models import NavigateBrowserBody
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def _installed_codecs():
+    names = []
+    for name in CODECS:
+        try:
+            get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def _client(json_codec, requests) -> AuthenticatedClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"success": True, "url": json.loads(request.content)["url"]})
+
+    return AuthenticatedClient(base_url="http://testserver", token="test-token", json_codec=json_codec,
+                               httpx_args={"transport": httpx.MockTransport(handler)})
+
+
+@pytest.mark.parametrize("name", _installed_codecs())
+def test_endpoint_round_trip_with_codec(name):
+    """Test that every installed codec encodes the body and decodes the response"""
+    requests = []
+    client = _client(name, requests)
+    assert client.json_codec.name == name
+    response = navigate_browser.sync(SESSION_ID, client=client, body=NavigateBrowserBody(url="https://example.com/ü"))
+    assert response.url == "https://example.com/ü"
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert json.loads(requests[0].content) == {"url": "https://example.com/ü"}
+
+
+@pytest.mark.parametrize("name", _installed_codecs())
+def test_invalid_json_raises_value_error(name):
+    """Test that every codec reports invalid JSON as a ValueError"""
+    with pytest.raises(ValueError):
+        get_codec(name).decode(b"{not json")
+
+
+def test_custom_codec_is_used_for_both_directions():
+    """Test that a JSONCodec subclass passed to the client handles encoding and decoding"""
+    calls = []
+
+    class RecordingCodec(JSONCodec):
+        name = "recording"
+
+        def encode(self, obj):
+            calls.append("encode")
+            return super().encode(obj)
+
+        def decode(self, data):
+            calls.append("decode")
+            return super().decode(data)
+
+    navigate_browser.sync(SESSION_ID, client=_client(RecordingCodec(), []), body=NavigateBrowserBody(url="https://example.com"))
+    assert calls == ["encode", "decode"]
+
+
+def test_default_codec_prefers_installed_fast_library():
+    """Test that the default is the first installed codec in preference order"""
+    assert default_codec().name == _installed_codecs()[0]
+    assert get_codec(None) is default_codec()
+
+
+def test_unknown_codec_name():
+    with pytest.raises(ValueError):
+        get_codec("yaml")
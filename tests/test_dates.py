@@ -0,0 +1,64 @@
+import datetime
+
+import pytest
+from aidolon_browser_client import _dates, set_lazy_timestamps
+from aidolon_browser_client.models import BrowserSession, GetSessionStatusResponse200
+from dateutil.parser import isoparse as dateutil_isoparse
+
+SESSION = {"session_id": "11111111-1111-1111-1111-111111111111", "status": "active",
+           "created_at": "2025-04-02T10:00:00Z", "updated_at": "2025-04-02T10:05:00.123+02:00"}
+
+
+@pytest.fixture
+def lazy_timestamps():
+    set_lazy_timestamps(True)
+    yield
+    set_lazy_timestamps(False)
+
+
+@pytest.mark.parametrize("value", [
+    "2025-04-02T10:00:00Z",
+    "2025-04-02T10:00:00+00:00",
+    "2025-04-02T10:00:00.123456-05:30",
+    "2025-04-02T10:00:00.5+02:00",
+    "2025-04-02T10:00:00",
+    "2025-04-02",
+    "2025-04-02T24:00:00Z",
+])
+def test_isoparse_matches_dateutil(value):
+    """Test that the fast path and the dateutil fallback give the same instant as dateutil"""
+    parsed = _dates.isoparse(value)
+    assert parsed == dateutil_isoparse(value)
+    assert parsed.utcoffset() == dateutil_isoparse(value).utcoffset()
+    assert parsed.tzinfo is None or isinstance(parsed.tzinfo, datetime.timezone)
+
+
+def test_isoparse_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        _dates.isoparse("yesterday")
+
+
+def test_models_parse_timestamps_eagerly_by_default():
+    session = BrowserSession.from_dict(SESSION)
+    assert type(BrowserSession.__dict__["created_at"]._slot.__get__(session)) is datetime.datetime
+
+
+def test_lazy_timestamps_parse_on_first_access(lazy_timestamps):
+    """Test that lazy timestamps stay strings until read, then are parsed once and stored"""
+    session = BrowserSession.from_dict(SESSION)
+    slot = BrowserSession.__dict__["updated_at"]._slot
+    assert slot.__get__(session) == "2025-04-02T10:05:00.123+02:00"
+    assert session.updated_at == datetime.datetime(2025, 4, 2, 8, 5, 0, 123000, tzinfo=datetime.timezone.utc)
+    assert type(slot.__get__(session)) is datetime.datetime
+    assert session.to_dict() == BrowserSession.from_dict(SESSION).to_dict()
+
+
+def test_lazy_timestamps_report_invalid_values_on_access(lazy_timestamps):
+    """Test that invalid lazy values raise when read, except for fields that allow the raw string"""
+    session = BrowserSession.from_dict({**SESSION, "created_at": "soon", "closed_at": "never"})
+    assert session.closed_at == "never"
+    with pytest.raises(ValueError):
+        session.created_at
+    status = GetSessionStatusResponse200.from_dict({"closed_at": "never"})
+    with pytest.raises(ValueError):
+        status.closed_at
@@ -0,0 +1,51 @@
+import json
+import subprocess
+import sys
+
+# Upper bound for the time spent in the package's own modules (not httpx/attrs) on `import aidolon_browser_client`.
+# Currently about 10ms; the budget leaves room for slow CI machines.
+IMPORT_BUDGET_US = 50_000
+
+DEFERRED = ("aidolon_browser_client.models.", "aidolon_browser_client.api.", "aidolon_browser_client.browser",
+            "aidolon_browser_client.sessions", "dateutil", "dotenv")
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Run ``statement`` in a fresh interpreter with ``-X importtime`` and return the self time of each module"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def _loaded_modules(statement: str) -> list[str]:
+    """Run ``statement`` in a fresh interpreter and return the names in ``sys.modules`` afterwards"""
+    script = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_package_import_within_budget():
+    """Test that importing the package stays within the import time budget"""
+    times = _import_times("import aidolon_browser_client")
+    own = sum(us for name, us in times.items() if name.split(".")[0] == "aidolon_browser_client")
+    assert own < IMPORT_BUDGET_US, f"import took {own}us in aidolon_browser_client modules"
+
+
+def test_package_import_defers_models_endpoints_and_optional_modules():
+    """Test that models, endpoint modules, the session helpers, dateutil and dotenv are loaded on first use"""
+    modules = _loaded_modules("import aidolon_browser_client, aidolon_browser_client.models, aidolon_browser_client.api")
+    loaded = [name for name in modules if name.startswith(DEFERRED)]
+    assert loaded == []
+
+
+def test_model_access_imports_only_that_model():
+    """Test that accessing one model loads its module and dependencies, not the whole package"""
+    modules = _loaded_modules("from aidolon_browser_client.models import NavigateBrowserBody")
+    models = [name for name in modules if name.startswith("aidolon_browser_client.models.")]
+    assert models == ["aidolon_browser_client.models.navigate_browser_body"]
@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient, errors
+from aidolon_browser_client.models import BrowserSession
+from aidolon_browser_client.sessions import SessionStreamParser, iter_sessions, iter_sessions_async
+
+SESSIONS = [
+    {"session_id": f"{i:08d}-1111-1111-1111-111111111111", "status": "active", "created_at": "2025-04-02T10:00:00Z",
+     "live_session": {"url": "https://example.com/ü", "title": "Ex \"ample\" ]}", "viewport": {"width": 1280}}}
+    for i in range(5)
+]
+BODY = json.dumps({"success": True, "sessions": SESSIONS, "count": len(SESSIONS)}, ensure_ascii=False).encode()
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _parse(chunks) -> list:
+    parser = SessionStreamParser()
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    parser.close()
+    return items
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, len(BODY)])
+def test_parser_handles_any_chunking(size):
+    """Test that sessions split across chunks, including inside UTF-8 characters, are read whole"""
+    assert _parse(_chunks(BODY, size)) == SESSIONS
+
+
+def test_parser_returns_sessions_as_they_complete():
+    """Test that a session is returned by the chunk that completes it, before the body ends"""
+    parser = SessionStreamParser()
+    first_end = BODY.index(b"}},") + 2
+    assert parser.feed(BODY[:first_end - 1]) == []
+    assert parser.feed(BODY[first_end - 1:first_end]) == SESSIONS[:1]
+
+
+def test_parser_decodes_a_large_session_once():
+    """Test that a session cut into many chunks is decoded once it is complete, not retried on every chunk"""
+    session = {"session_id": "a", "context": {"localStorage": {f"k{i}": "\\\"}]" * 10 for i in range(2000)}}}
+    body = json.dumps({"sessions": [session, session]}).encode()
+    parser = SessionStreamParser()
+    decoder, calls = parser._decoder, []
+
+    class _CountingDecoder:
+        def raw_decode(self, text, position):
+            calls.append(position)
+            return decoder.raw_decode(text, position)
+
+    parser._decoder = _CountingDecoder()
+    items = []
+    for chunk in _chunks(body, 100):
+        items.extend(parser.feed(chunk))
+    parser.close()
+    assert items == [session, session]
+    assert len(calls) <= 4
+
+
+def test_parser_skips_members_around_sessions():
+    body = b'{"count": 12, "meta": {"sessions": [1]}, "sessions": [], "success": true}'
+    assert _parse(_chunks(body, 3)) == []
+    assert _parse([b'{"success": true}']) == []
+
+
+@pytest.mark.parametrize("body", [b'[{"session_id": "a"}]', b'{"sessions": {"a": 1}}', b'{"sessions": [{"a": 1}'])
+def test_parser_rejects_invalid_bodies(body):
+    with pytest.raises(ValueError):
+        _parse([body])
+
+
+def _client(status_code=200, body=BODY, requests=None) -> AuthenticatedClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(status_code, stream=_Stream(_chunks(body, 50)))
+
+    return AuthenticatedClient(base_url="http://testserver", token="test-token",
+                               httpx_args={"transport": httpx.MockTransport(handler)})
+
+
+class _Stream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def __iter__(self):
+        yield from self._chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def test_iter_sessions_pages():
+    """Test that sessions are yielded as models in pages of page_size, with a shorter last page"""
+    requests = []
+    pages = list(iter_sessions(status="closed", page_size=2, client=_client(requests=requests)))
+    assert requests[0].url.params["status"] == "closed"
+    assert [len(page) for page in pages] == [2, 2, 1]
+    sessions = [session for page in pages for session in page]
+    assert all(isinstance(session, BrowserSession) for session in sessions)
+    assert [session.to_dict() for session in sessions] == [BrowserSession.from_dict(s).to_dict() for s in SESSIONS]
+
+
+def test_iter_sessions_async_pages():
+    async def collect():
+        return [page async for page in iter_sessions_async(page_size=3, client=_client())]
+
+    pages = asyncio.run(collect())
+    assert [[str(session.session_id) for session in page] for page in pages] == [
+        [s["session_id"] for s in SESSIONS[:3]], [s["session_id"] for s in SESSIONS[3:]]]
+
+
+def test_iter_sessions_error_status():
+    body = b'{"success": false, "error": "Unauthorized", "error_code": "UNAUTHORIZED"}'
+    with pytest.raises(errors.UnexpectedStatus) as excinfo:
+        next(iter_sessions(client=_client(401, body)))
+    assert excinfo.value.status_code == 401
+    assert excinfo.value.content == body
+
+
+def test_iter_sessions_invalid_page_size():
+    with pytest.raises(ValueError):
+        next(iter_sessions(page_size=0, client=_client()))
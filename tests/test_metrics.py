@@ -0,0 +1,134 @@
+import asyncio
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.browser_actions import navigate_browser
+from aidolon_browser_client.api.session_management import list_browser_sessions
+from aidolon_browser_client.circuit import CircuitBreaker
+from aidolon_browser_client.errors import CircuitOpenError
+from aidolon_browser_client.metrics import HistogramAdapter, Metrics, MetricsRecorder
+from aidolon_browser_client.models import NavigateBrowserBody
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+
+
+class _TracingTransport(httpx.BaseTransport):
+    """Answer like the API and report transport steps through the trace extension, as httpcore does"""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        trace = request.extensions["trace"]
+        for step in ("connection.connect_tcp", "http11.send_request_headers", "http11.receive_response_headers"):
+            trace(f"{step}.started", {})
+            trace(f"{step}.complete", {})
+        if request.url.path.endswith("/navigate"):
+            return httpx.Response(200, json={"success": True, "action": "navigate", "url": "https://example.com"})
+        return httpx.Response(200, json={"success": True, "sessions": [], "count": 0})
+
+
+def test_timings_are_tagged_with_endpoint_and_session():
+    recorder = MetricsRecorder()
+    seen = []
+    client = AuthenticatedClient(base_url="http://testserver/api/v1", token="test-token",
+                                 metrics=Metrics(recorder), httpx_args={
+                                     "transport": _TracingTransport(),
+                                     "event_hooks": {"request": [lambda request: seen.append(request.url.path)]},
+                                 })
+    navigate_browser.sync(SESSION_ID, client=client, body=NavigateBrowserBody(url="https://example.com"))
+    list_browser_sessions.sync(client=client)
+
+    navigate, listing = recorder.timings
+    assert (navigate.endpoint, navigate.group, navigate.session_id) == ("navigate_browser", "browser_actions", SESSION_ID)
+    assert (listing.endpoint, listing.session_id, listing.status_code) == ("list_browser_sessions", None, 200)
+    assert set(navigate.phases) == {"connect_tcp", "send_request_headers", "receive_response_headers"}
+    assert navigate.duration >= navigate.connect + navigate.server
+    assert recorder.durations("navigate_browser") == [navigate.duration]
+    # hooks given in httpx_args still run
+    assert len(seen) == 2
+
+
+class _Stream(httpx.AsyncByteStream):
+    """A body that is only read when the client iterates over it, like one coming from the network"""
+
+    async def __aiter__(self):
+        yield b'{"success": true, "sessions": [], "count": 0}'
+
+
+def test_async_client_and_streamed_responses():
+    """Test that async requests are reported and a streamed response is reported once it is closed"""
+    recorder = MetricsRecorder()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=_Stream())
+
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token", metrics=Metrics(recorder),
+                                 httpx_args={"transport": httpx.MockTransport(handler)})
+
+    async def run():
+        await list_browser_sessions.asyncio(client=client)
+        async with client.get_async_httpx_client().stream("GET", "/browser/sessions") as response:
+            assert len(recorder.timings) == 1
+            await response.aread()
+
+    asyncio.run(run())
+    assert [timing.endpoint for timing in recorder.timings] == ["list_browser_sessions"] * 2
+
+
+class _TimingOutBody(httpx.SyncByteStream):
+    def __iter__(self):
+        yield b'{"success": '
+        raise httpx.ReadTimeout("timed out reading the body")
+
+
+def test_failed_requests_are_reported():
+    """Test that requests raising a transport error, a body read error or CircuitOpenError are reported"""
+    recorder = MetricsRecorder()
+    outcomes = [httpx.ConnectError("refused"), httpx.Response(200, stream=_TimingOutBody())]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token", metrics=Metrics(recorder),
+                                 circuit_breaker=CircuitBreaker(failure_threshold=2, recovery_timeout=60),
+                                 httpx_args={"transport": httpx.MockTransport(handler)})
+    for error in (httpx.ConnectError, httpx.ReadTimeout, CircuitOpenError):
+        with pytest.raises(error):
+            list_browser_sessions.sync(client=client)
+
+    timings = recorder.timings
+    assert [(timing.status_code, timing.error) for timing in timings] == [
+        (None, "ConnectError"), (200, "ReadTimeout"), (None, "CircuitOpenError")]
+    assert all(timing.endpoint == "list_browser_sessions" for timing in timings)
+
+
+class _Histogram:
+    def __init__(self):
+        self.observed = []
+
+    def labels(self, **labels):
+        histogram = self
+
+        class _Child:
+            def observe(self, value):
+                histogram.observed.append((labels, value))
+
+        return _Child()
+
+
+def test_histogram_adapter():
+    latency, phases = _Histogram(), _Histogram()
+    recorder = MetricsRecorder()
+    metrics = Metrics(recorder, HistogramAdapter(latency, phase_histogram=phases))
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token", metrics=metrics,
+                                 httpx_args={"transport": _TracingTransport()})
+    list_browser_sessions.sync(client=client)
+    client.get_httpx_client().get("https://artifacts.example.com/shot.png").close()
+
+    assert [labels for labels, _ in latency.observed] == [
+        {"endpoint": "list_browser_sessions", "status_code": "200"}, {"endpoint": "other", "status_code": "200"}]
+    assert latency.observed[0][1] == recorder.timings[0].duration
+    assert {labels["phase"] for labels, _ in phases.observed} == {
+        "connect_tcp", "send_request_headers", "receive_response_headers"}
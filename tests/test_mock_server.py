@@ -0,0 +1,87 @@
+import asyncio
+
+import httpx
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.browser_actions import navigate_browser
+from aidolon_browser_client.api.content_extraction import scrape_page
+from aidolon_browser_client.api.session_management import (
+    close_browser_session,
+    create_browser_session,
+    get_session_status,
+    list_browser_sessions,
+)
+from aidolon_browser_client.mock import MockAPI, MockConfig, serve
+from aidolon_browser_client.mock.loadtest import main, run_load_test
+from aidolon_browser_client.models import (
+    CreateBrowserSessionBody,
+    Error,
+    ListBrowserSessionsStatus,
+    NavigateBrowserBody,
+    ScrapePageBody,
+)
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+
+
+def test_sessions_are_tracked():
+    api = MockAPI()
+    client = AuthenticatedClient(base_url="http://mock", token="key", httpx_args={"transport": api.transport()})
+    created = create_browser_session.sync(client=client, body=CreateBrowserSessionBody())
+    navigated = navigate_browser.sync(created.session_id, client=client,
+                                      body=NavigateBrowserBody(url="https://example.org"))
+    assert navigated.url == "https://example.org"
+    assert get_session_status.sync(created.session_id, client=client).live_session["url"] == "https://example.org"
+
+    close_browser_session.sync(created.session_id, client=client)
+    assert get_session_status.sync(created.session_id, client=client).status == "closed"
+    body = NavigateBrowserBody(url="https://example.org")
+    for closed in (navigate_browser.sync(created.session_id, client=client, body=body),
+                   close_browser_session.sync(created.session_id, client=client)):
+        assert isinstance(closed, Error) and closed.error_code == "SESSION_NOT_ACTIVE"
+    assert list_browser_sessions.sync(client=client, status=ListBrowserSessionsStatus.ACTIVE).count == 0
+    # only the mock token may act on sessions that were never created
+    assert isinstance(get_session_status.sync(SESSION_ID, client=client), Error)
+
+
+def test_missing_key_and_injected_errors():
+    api = MockAPI(error_rate=1.0)
+    transport = api.transport()
+    assert httpx.Client(transport=transport).get("http://mock/browser/sessions").status_code == 401
+    client = AuthenticatedClient(base_url="http://mock", token="key", httpx_args={"transport": transport})
+    response = list_browser_sessions.sync_detailed(client=client)
+    assert response.status_code == 500 and response.parsed.error_code == "INTERNAL_ERROR"
+
+
+def test_asgi_app_and_socket_server():
+    api = MockAPI(payload_size=10)
+
+    async def over_asgi():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=api), base_url="http://mock") as client:
+            response = await client.post(f"/browser/session/{SESSION_ID}/scrape",
+                                         headers={"X-API-Key": "give-me-mock-data"}, json={"format": ["text"]})
+        return response.json()
+
+    assert asyncio.run(over_asgi())["data"] == {"text": "Lorem ipsu"}
+
+    with serve(MockAPI()) as base_url:
+        client = AuthenticatedClient(base_url=base_url, token="key")
+        assert create_browser_session.sync(client=client, body=CreateBrowserSessionBody()).success
+        assert list_browser_sessions.sync(client=client).count == 1
+
+
+def test_binary_payloads_are_valid_base64():
+    api = MockAPI(payload_size=10)
+    client = AuthenticatedClient(base_url="http://mock", token="give-me-mock-data",
+                                 httpx_args={"transport": api.transport()})
+    data = scrape_page.sync(SESSION_ID, client=client, body=ScrapePageBody(screenshot=True, pdf=True)).data
+    assert data.screenshot_bytes() == bytes(range(7))
+    assert data.pdf_bytes() == bytes(range(7))
+
+
+def test_load_test(capsys):
+    result = run_load_test("async", requests=20, concurrency=4, config=MockConfig(error_rate=0.5, seed=1))
+    assert len(result.latencies) == 20 and 0 < result.errors < 20
+    assert result.percentile(50) <= result.percentile(99) == max(result.latencies)
+
+    assert main(["--requests", "5", "--concurrency", "2", "--endpoint", "get_session_status"]) == 0
+    assert [line.split()[0] for line in capsys.readouterr().out.splitlines()] == ["sync", "pooled", "async"]
@@ -0,0 +1,128 @@
+import copy
+import datetime
+import pickle
+from types import MappingProxyType
+from uuid import UUID
+
+import pytest
+from aidolon_browser_client.models import (
+    BrowserSession,
+    BrowserSessionLiveSessionType0,
+    CreateBrowserSessionResponse200,
+    GetSessionStatusResponse200,
+    ListBrowserSessionsResponse200,
+    NavigateBrowserBody,
+)
+from aidolon_browser_client.types import EMPTY_PROPERTIES, UNSET
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+SESSION = {
+    "session_id": SESSION_ID,
+    "status": "active",
+    "created_at": "2025-04-02T10:00:00+00:00",
+    "embed_url": "https://app.aidolon.com/embed/1",
+    "updated_at": "2025-04-02T10:05:00+00:00",
+    "last_active_at": "2025-04-02T10:05:00+00:00",
+    "closed_at": None,
+    "live_session": {"url": "https://example.com", "title": "Example", "is_loading": False,
+                     "viewport": {"width": 1280, "height": 720}},
+}
+
+
+def test_browser_session_round_trip():
+    """Test that decoding and re-encoding a session gives back the payload"""
+    session = BrowserSession.from_dict(SESSION)
+    assert session.session_id == UUID(SESSION_ID)
+    assert session.created_at == datetime.datetime(2025, 4, 2, 10, tzinfo=datetime.timezone.utc)
+    assert isinstance(session.live_session, BrowserSessionLiveSessionType0)
+    assert session.live_session.viewport.width == 1280
+    assert session.additional_properties == {}
+    assert session.to_dict() == SESSION
+
+
+def test_unknown_keys_kept_as_additional_properties():
+    """Test that keys outside the schema end up in additional_properties, and only those"""
+    session = BrowserSession.from_dict({**SESSION, "region": "eu", "live_session": {**SESSION["live_session"], "tab": 2}})
+    assert session.additional_properties == {"region": "eu"}
+    assert session.live_session.additional_properties == {"tab": 2}
+
+
+def test_decoding_accepts_read_only_mappings():
+    """Test that the source mapping is read, never modified"""
+    payload = MappingProxyType({**SESSION, "region": "eu"})
+    session = BrowserSession.from_dict(payload)
+    assert session["region"] == "eu"
+    assert dict(payload) == {**SESSION, "region": "eu"}
+
+
+def test_unparsable_union_members_fall_back_to_raw_values():
+    """Test that closed_at and live_session keep values that do not match their model, like the generated code"""
+    session = BrowserSession.from_dict({**SESSION, "closed_at": "not a date", "live_session": "gone"})
+    assert session.closed_at == "not a date"
+    assert session.live_session == "gone"
+    session = BrowserSession.from_dict({key: SESSION[key] for key in ("session_id", "status", "created_at")})
+    assert session.updated_at is UNSET
+    assert session.closed_at is UNSET
+    assert session.live_session is UNSET
+
+
+def test_list_browser_sessions_decodes_every_session():
+    """Test the list response, including a missing sessions key"""
+    parsed = ListBrowserSessionsResponse200.from_dict({"success": True, "sessions": [SESSION] * 3, "count": 3})
+    assert [session.session_id for session in parsed.sessions] == [UUID(SESSION_ID)] * 3
+    assert parsed.filtered_by is UNSET
+    assert ListBrowserSessionsResponse200.from_dict({"success": True}).sessions == []
+
+
+def test_status_and_create_responses_round_trip():
+    """Test the session status and create responses"""
+    status = {"success": True, "session_id": SESSION_ID, "status": "closed",
+              "created_at": "2025-04-02T10:00:00+00:00", "closed_at": "2025-04-02T11:00:00+00:00",
+              "live_session": None}
+    assert GetSessionStatusResponse200.from_dict(status).to_dict() == status
+    created = {"success": True, "session_id": SESSION_ID, "status": "active", "embed_url": "https://app.aidolon.com/embed/1",
+               "created_at": "2025-04-02T10:00:00+00:00", "live_session": {"url": "about:blank"}}
+    parsed = CreateBrowserSessionResponse200.from_dict(created)
+    assert parsed.live_session["url"] == "about:blank"
+    assert parsed.to_dict() == created
+
+
+def test_models_without_extra_keys_share_empty_properties():
+    """Test that decoded and new models share one empty additional_properties until a key is set"""
+    parsed = ListBrowserSessionsResponse200.from_dict({"success": True, "sessions": [SESSION] * 2})
+    assert parsed.sessions[0].additional_properties is EMPTY_PROPERTIES
+    assert parsed.sessions[1].live_session.viewport.additional_properties is EMPTY_PROPERTIES
+    body = NavigateBrowserBody(url="https://example.com")
+    assert body.additional_properties is EMPTY_PROPERTIES
+    assert body.additional_properties == {}
+    assert "extra" not in body
+
+
+def test_setting_a_key_materializes_additional_properties():
+    """Test that model[key] = value gives the model its own dict, leaving the shared one empty"""
+    body = NavigateBrowserBody(url="https://example.com")
+    body["extra"] = 1
+    assert body.additional_properties == {"extra": 1}
+    assert body.to_dict() == {"url": "https://example.com", "extra": 1}
+    assert EMPTY_PROPERTIES == {}
+    assert NavigateBrowserBody(url="https://example.com").additional_properties is EMPTY_PROPERTIES
+    del body["extra"]
+    assert body.additional_keys == []
+
+
+def test_shared_empty_properties_are_read_only():
+    """Test that adding keys to the shared dict directly is refused instead of leaking into other models"""
+    body = NavigateBrowserBody(url="https://example.com")
+    with pytest.raises(TypeError):
+        body.additional_properties["extra"] = 1
+    with pytest.raises(TypeError):
+        body.additional_properties.update(extra=1)
+    assert EMPTY_PROPERTIES == {}
+
+
+def test_copies_keep_the_shared_empty_properties():
+    """Test that pickling and copying a model keeps the sentinel rather than making a writable copy of it"""
+    session = BrowserSession.from_dict(SESSION)
+    for clone in (pickle.loads(pickle.dumps(session)), copy.deepcopy(session), copy.copy(session)):
+        assert clone == session
+        assert clone.additional_properties is EMPTY_PROPERTIES
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.browser_actions import navigate_browser
+from aidolon_browser_client.api.session_management import get_session_status
+from aidolon_browser_client.models import NavigateBrowserBody
+from aidolon_browser_client.ratelimit import Limit, RateLimiter, _Waiter
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+STATUS = {"success": True, "session_id": SESSION_ID, "status": "active", "created_at": "2025-04-02T10:00:00Z"}
+NAVIGATED = {"success": True, "action": "navigate", "url": "https://example.com"}
+BODY = NavigateBrowserBody(url="https://example.com")
+
+
+class _Server:
+    """Answers like the API after ``latency`` seconds, tracking how many requests it handles at once"""
+
+    def __init__(self, latency=0.0, responses=None):
+        self.latency = latency
+        self.responses = list(responses or [])
+        self.active = self.peak = self.count = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.count += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            return self.responses.pop(0) if self.responses else None
+
+    def _response(self, request, canned):
+        with self._lock:
+            self.active -= 1
+        if canned is not None:
+            return canned
+        return httpx.Response(200, json=NAVIGATED if request.url.path.endswith("/navigate") else STATUS)
+
+    def handler(self, request):
+        canned = self._enter()
+        time.sleep(self.latency)
+        return self._response(request, canned)
+
+    async def async_handler(self, request):
+        canned = self._enter()
+        await asyncio.sleep(self.latency)
+        return self._response(request, canned)
+
+
+def _client(server, limiter, is_async=False):
+    handler = server.async_handler if is_async else server.handler
+    return AuthenticatedClient(base_url="http://testserver", token="test-token", rate_limit=limiter,
+                               httpx_args={"transport": httpx.MockTransport(handler)})
+
+
+def test_token_bucket_spaces_requests():
+    client = _client(_Server(), RateLimiter(groups={"session_management": Limit(rate=50, burst=1)}))
+    started = time.monotonic()
+    for _ in range(6):
+        get_session_status.sync(SESSION_ID, client=client)
+    assert time.monotonic() - started >= 0.09
+    # other groups are not limited
+    started = time.monotonic()
+    for _ in range(6):
+        navigate_browser.sync(SESSION_ID, client=client, body=BODY)
+    assert time.monotonic() - started < 0.05
+
+
+def test_max_in_flight_is_shared_by_threads_and_tasks():
+    """Test that one limiter caps requests of a sync client in threads and an async client together"""
+    server = _Server(latency=0.02)
+    limiter = RateLimiter(Limit(max_in_flight=3), groups={"browser_actions": Limit(max_in_flight=2)})
+    sync_client, async_client = _client(server, limiter), _client(server, limiter, is_async=True)
+
+    def in_thread():
+        navigate_browser.sync(SESSION_ID, client=sync_client, body=BODY)
+
+    async def run_tasks():
+        await asyncio.gather(*(navigate_browser.asyncio(SESSION_ID, client=async_client, body=BODY)
+                               for _ in range(6)))
+
+    threads = [threading.Thread(target=in_thread) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(run_tasks())
+    for thread in threads:
+        thread.join()
+
+    assert server.count == 12
+    assert server.peak == 2
+    assert limiter.in_flight() == limiter.in_flight("browser_actions") == 0
+
+
+def test_backs_off_on_quota_errors():
+    server = _Server(responses=[httpx.Response(429, headers={"Retry-After": "0.1"}, json={"success": False})])
+    limiter = RateLimiter(groups={"session_management": Limit(rate=100)}, recovery=0.25)
+    client = _client(server, limiter)
+
+    assert get_session_status.sync_detailed(SESSION_ID, client=client).status_code == 429
+    assert limiter.rate("session_management") == 50
+    assert 0 < limiter.paused_for("session_management") <= 0.1
+    assert limiter.paused_for("browser_actions") == 0
+
+    started = time.monotonic()
+    assert get_session_status.sync(SESSION_ID, client=client).status == "active"
+    assert time.monotonic() - started >= 0.08
+    assert limiter.rate("session_management") == 75
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        RateLimiter(groups={"actions": Limit(rate=1)})
+    for options in ({"rate": 0}, {"burst": 0}, {"max_in_flight": 0}):
+        with pytest.raises(ValueError):
+            Limit(**options)
+
+
+def test_slot_of_a_closed_event_loop_goes_to_the_next_waiter():
+    slots = RateLimiter(Limit(max_in_flight=1))._global.slots
+    slots.acquire()
+    # a task waiting for the slot on an event loop that was closed since
+    loop = asyncio.new_event_loop()
+    slots._waiters.append(_Waiter(loop.create_future()))
+    loop.close()
+
+    waiter = threading.Thread(target=slots.acquire)
+    waiter.start()
+    time.sleep(0.01)
+    slots.release()
+    waiter.join(1)
+    assert not waiter.is_alive()
+    assert slots.in_flight == 1
+    slots.release()
+    assert slots.in_flight == 0
@@ -0,0 +1,44 @@
+import json
+
+import httpx
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.session_management import get_session_status
+from aidolon_browser_client.types import Response
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+STATUS = {"success": True, "session_id": SESSION_ID, "status": "active", "created_at": "2025-04-02T10:00:00+00:00"}
+
+
+def _client(**options) -> AuthenticatedClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=STATUS)
+
+    return AuthenticatedClient(base_url="http://testserver", token="test-token",
+                               httpx_args={"transport": httpx.MockTransport(handler)}, **options)
+
+
+def test_keep_raw_content_by_default():
+    """Test that the raw body is kept unless configured otherwise"""
+    response = get_session_status.sync_detailed(SESSION_ID, client=_client())
+    assert json.loads(response.content) == STATUS
+
+
+def test_drop_raw_content_for_every_endpoint():
+    """Test that keep_raw_content=False applies to endpoints other than scrape_page"""
+    response = get_session_status.sync_detailed(SESSION_ID, client=_client(keep_raw_content=False))
+    assert response.content == b""
+    assert response.parsed.status == "active"
+
+
+def test_lazy_content_rebuilds_body_on_access():
+    """Test that lazy_content re-encodes the parsed model only when content is read"""
+    response = get_session_status.sync_detailed(SESSION_ID, client=_client(keep_raw_content=False, lazy_content=True))
+    assert not isinstance(response._content, bytes)
+    assert json.loads(response.content) == STATUS
+    assert isinstance(response._content, bytes)
+
+
+def test_response_accepts_bytes_or_callable():
+    """Test both forms of Response content"""
+    assert Response(status_code=200, content=b"raw", headers={}, parsed=None).content == b"raw"
+    assert Response(status_code=200, content=lambda: b"late", headers={}, parsed=None).content == b"late"
@@ -0,0 +1,102 @@
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.api.browser_actions import navigate_browser
+from aidolon_browser_client.api.session_management import get_session_status
+from aidolon_browser_client.models import NavigateBrowserBody
+from aidolon_browser_client.retry import RetryBudget, RetryPolicy
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+STATUS = {"success": True, "session_id": SESSION_ID, "status": "active", "created_at": "2025-04-02T10:00:00Z"}
+NAVIGATED = {"success": True, "action": "navigate", "url": "https://example.com"}
+ERROR = {"success": False, "error": "unavailable", "error_code": "UNAVAILABLE"}
+
+
+def _client(responses, policy):
+    """Return a client whose server plays back ``responses`` and the list of requests it received"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        response = responses[min(len(requests), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = AuthenticatedClient(
+        base_url="http://testserver",
+        token="test-token",
+        retry=policy,
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+    return client, requests
+
+
+def test_retries_idempotent_endpoint():
+    """Test that a transient 500 and a connection error on get_session_status are retried"""
+    client, requests = _client(
+        [httpx.Response(500, json=ERROR), httpx.ConnectError("reset"), httpx.Response(200, json=STATUS)],
+        RetryPolicy(max_attempts=3, backoff_factor=0),
+    )
+    response = get_session_status.sync(client=client, session_id=SESSION_ID)
+    assert response.status == "active"
+    assert len(requests) == 3
+
+
+def test_mutating_endpoint_requires_opt_in():
+    """Test that navigate_browser is only retried when opted in"""
+    body = NavigateBrowserBody(url="https://example.com")
+    client, requests = _client([httpx.Response(503, json=ERROR), httpx.Response(200, json=NAVIGATED)],
+                               RetryPolicy(backoff_factor=0))
+    assert navigate_browser.sync_detailed(SESSION_ID, client=client, body=body).status_code == 503
+    assert len(requests) == 1
+
+    client, requests = _client([httpx.Response(503, json=ERROR), httpx.Response(200, json=NAVIGATED)],
+                               RetryPolicy(backoff_factor=0, retry_endpoints={"browser_actions"}))
+    assert navigate_browser.sync(SESSION_ID, client=client, body=body).success is True
+    assert len(requests) == 2
+
+
+def test_gives_up_after_max_attempts():
+    """Test that the last failure is surfaced once attempts are exhausted"""
+    client, requests = _client([httpx.ConnectError("down")], RetryPolicy(max_attempts=2, backoff_factor=0))
+    with pytest.raises(httpx.ConnectError):
+        get_session_status.sync(client=client, session_id=SESSION_ID)
+    assert len(requests) == 2
+
+
+def test_every_failed_attempt_is_charged_to_the_budget():
+    budget = RetryBudget(max_tokens=10, token_ratio=1)
+    client, requests = _client([httpx.ConnectError("down")],
+                               RetryPolicy(max_attempts=3, backoff_factor=0, budget=budget))
+    with pytest.raises(httpx.ConnectError):
+        get_session_status.sync(client=client, session_id=SESSION_ID)
+    assert len(requests) == 3
+    assert budget.tokens == 7
+
+
+def test_retry_after_header():
+    """Test that Retry-After takes precedence over the computed backoff"""
+    policy = RetryPolicy(backoff_factor=10, max_backoff=5)
+    assert policy.backoff(1, httpx.Response(429, headers={"Retry-After": "2"})) == 2
+    assert policy.backoff(1, httpx.Response(429, headers={"Retry-After": "60"})) == 5
+    assert 0 <= RetryPolicy(backoff_factor=1, jitter=True).backoff(3) <= 4
+
+
+def test_retry_budget_stops_retry_storms():
+    """Test that an exhausted budget disables retries"""
+    budget = RetryBudget(max_tokens=2, token_ratio=1)
+    client, requests = _client([httpx.Response(500, json=ERROR)], RetryPolicy(backoff_factor=0, budget=budget))
+    get_session_status.sync(client=client, session_id=SESSION_ID)
+    assert len(requests) == 1
+
+
+def test_async_retries():
+    """Test that the async client retries through the same policy"""
+    import asyncio
+
+    client, requests = _client([httpx.Response(502, json=ERROR), httpx.Response(200, json=STATUS)],
+                               RetryPolicy(backoff_factor=0))
+    response = asyncio.run(get_session_status.asyncio(client=client, session_id=SESSION_ID))
+    assert response.status == "active"
+    assert len(requests) == 2
@@ -0,0 +1,84 @@
+import datetime
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.models import Error
+from aidolon_browser_client.sessions import SessionColumns, list_sessions_columnar
+
+SESSIONS = [
+    {"session_id": "11111111-1111-1111-1111-111111111111", "status": "active", "created_at": "2025-04-02T10:00:00Z",
+     "updated_at": "2025-04-02T10:05:00.250+00:00", "last_active_at": "2025-04-02T12:05:00+02:00", "closed_at": None,
+     "live_session": {"url": "https://example.com", "title": "Example", "viewport": {"width": 1280}}},
+    {"session_id": "22222222-2222-2222-2222-222222222222", "status": "closed", "created_at": "2025-04-01T09:00:00",
+     "closed_at": "2025-04-01T09:30:00.123456Z", "live_session": None},
+]
+
+
+def _us(*args) -> int:
+    return (datetime.datetime(*args, tzinfo=datetime.timezone.utc)
+            - datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)) // datetime.timedelta(microseconds=1)
+
+
+def _client(status_code=200, body=None, requests=None) -> AuthenticatedClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(status_code, json=body if body is not None else
+                              {"success": True, "sessions": SESSIONS, "count": len(SESSIONS)})
+
+    return AuthenticatedClient(base_url="http://testserver", token="test-token",
+                               httpx_args={"transport": httpx.MockTransport(handler)})
+
+
+def test_columns_from_listing():
+    """Test that every column is read from the listing, with epoch microseconds and None for missing values"""
+    requests = []
+    columns = list_sessions_columnar(status="active", client=_client(requests=requests))
+    assert requests[0].url.params["status"] == "active"
+    assert len(columns) == 2
+    assert columns.session_id == [session["session_id"] for session in SESSIONS]
+    assert columns.status == ["active", "closed"]
+    assert columns.created_at == [_us(2025, 4, 2, 10), _us(2025, 4, 1, 9)]
+    assert columns.updated_at == [_us(2025, 4, 2, 10, 5, 0, 250000), None]
+    assert columns.last_active_at == [_us(2025, 4, 2, 10, 5), None]
+    assert columns.closed_at == [None, _us(2025, 4, 1, 9, 30, 0, 123456)]
+    assert columns.url == ["https://example.com", None]
+    assert columns.title == ["Example", None]
+
+
+def test_unparsable_timestamps_are_missing():
+    sessions = [{"session_id": SESSIONS[0]["session_id"], "created_at": "yesterday", "closed_at": 1743588000,
+                 "updated_at": "2025-04-02T10:05:00Z"}]
+    columns = SessionColumns.from_json(sessions)
+    assert (columns.created_at, columns.closed_at) == ([None], [None])
+    assert columns.updated_at == [_us(2025, 4, 2, 10, 5)]
+
+
+def test_error_response_is_parsed():
+    """Test that a non-200 response returns the parsed Error like list_all_sessions"""
+    body = {"success": False, "error": "Unauthorized", "error_code": "UNAUTHORIZED"}
+    assert isinstance(list_sessions_columnar(client=_client(401, body)), Error)
+
+
+def test_invalid_status():
+    with pytest.raises(ValueError):
+        list_sessions_columnar(status="paused", client=_client())
+
+
+def test_to_numpy():
+    np = pytest.importorskip("numpy")
+    arrays = SessionColumns.from_json(SESSIONS).to_numpy()
+    assert arrays["created_at"].dtype == np.dtype("datetime64[us]")
+    assert arrays["created_at"][0] == np.datetime64("2025-04-02T10:00:00")
+    assert np.isnat(arrays["updated_at"][1])
+    assert list(arrays["url"]) == ["https://example.com", None]
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = SessionColumns.from_json(SESSIONS).to_arrow()
+    assert table.num_rows == 2
+    assert table.schema.field("closed_at").type == pa.timestamp("us", tz="UTC")
+    assert table.column("closed_at").null_count == 1
+    assert table.column("title").to_pylist() == ["Example", None]
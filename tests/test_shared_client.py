@@ -0,0 +1,59 @@
+import asyncio
+
+import httpx
+from aidolon_browser_client import AuthenticatedClient, aclose_shared_clients
+from aidolon_browser_client.shared import (
+    close_shared_clients,
+    get_shared_async_client,
+    get_shared_client,
+    set_shared_client,
+)
+
+
+def test_get_shared_client_reuses_instance():
+    """Test that one client is shared per base URL and API key"""
+    try:
+        first = get_shared_client("http://testserver", "key-a")
+        assert get_shared_client("http://testserver", "key-a") is first
+        assert get_shared_client("http://testserver", "key-b") is not first
+        assert first.get_httpx_client() is get_shared_client("http://testserver", "key-a").get_httpx_client()
+    finally:
+        close_shared_clients()
+
+
+def test_shared_client_limits():
+    """Test that pool limits are passed through to the httpx client"""
+    limits = httpx.Limits(max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5)
+    try:
+        client = get_shared_client("http://testserver", "key-a", limits=limits)
+        pool = client.get_httpx_client()._transport._pool
+        assert pool._max_connections == 7
+        assert pool._max_keepalive_connections == 3
+        assert pool._keepalive_expiry == 1.5
+    finally:
+        close_shared_clients()
+
+
+def test_set_shared_client():
+    """Test registering a preconfigured client"""
+    try:
+        client = set_shared_client(AuthenticatedClient(base_url="http://testserver", token="key-a"))
+        assert get_shared_client("http://testserver", "key-a") is client
+    finally:
+        close_shared_clients()
+
+
+def test_shared_async_client_per_event_loop():
+    """Test that async callers share one client per event loop"""
+    async def run():
+        try:
+            first = get_shared_async_client("http://testserver", "key-a")
+            assert get_shared_async_client("http://testserver", "key-a") is first
+            assert first is not get_shared_client("http://testserver", "key-a")
+            httpx_client = first.get_async_httpx_client()
+            return first
+        finally:
+            await aclose_shared_clients()
+            assert httpx_client.is_closed
+
+    assert asyncio.run(run()) is not asyncio.run(run())
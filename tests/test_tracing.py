@@ -0,0 +1,120 @@
+import io
+
+import httpx
+import pytest
+from aidolon_browser_client import AuthenticatedClient
+from aidolon_browser_client.browser import BrowserSession
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+SESSION_ID = "11111111-1111-1111-1111-111111111111"
+
+_exporter = InMemorySpanExporter()
+
+
+@pytest.fixture
+def spans():
+    if not isinstance(trace.get_tracer_provider(), sdk_trace.TracerProvider):
+        provider = sdk_trace.TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(_exporter))
+        trace.set_tracer_provider(provider)
+    _exporter.clear()
+    yield _exporter
+    _exporter.clear()
+
+
+def _client(requests, tracing=True) -> AuthenticatedClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        path = request.url.path
+        if path == "/browser/session":
+            return httpx.Response(200, json={"success": True, "session_id": SESSION_ID, "status": "active"})
+        if request.url.host == "artifacts.example.com":
+            return httpx.Response(200, content=b"png")
+        if path.endswith("/screenshot"):
+            return httpx.Response(200, json={"success": True, "action": "screenshot", "data": {
+                "screenshot_url": "https://artifacts.example.com/shot.png"}})
+        if path.endswith("/navigate"):
+            return httpx.Response(200, json={"success": True, "action": "navigate", "url": "https://example.com"})
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"success": True, "session_id": SESSION_ID, "status": "closed"})
+        return httpx.Response(404, json={"success": False, "error": "not found", "error_code": "NOT_FOUND"})
+
+    return AuthenticatedClient(base_url="http://testserver", token="test-token", tracing=tracing,
+                               httpx_args={"transport": httpx.MockTransport(handler)})
+
+
+def test_session_actions_and_requests_form_one_trace(spans):
+    """Test that actions are children of the session span and requests children of their action"""
+    requests = []
+    with BrowserSession(client=_client(requests)) as session:
+        session.navigate("https://example.com")
+        session.click("#missing")
+
+    by_name = {span.name: span for span in spans.get_finished_spans()}
+    session_span = by_name["aidolon.session"]
+    assert session_span.attributes["aidolon.session_id"] == SESSION_ID
+    for action in ("create", "navigate", "click", "close"):
+        assert by_name[f"aidolon.{action}"].parent.span_id == session_span.context.span_id
+    assert by_name["POST navigate_browser"].parent.span_id == by_name["aidolon.navigate"].context.span_id
+
+    request_span = by_name["POST navigate_browser"]
+    assert request_span.kind == trace.SpanKind.CLIENT
+    assert request_span.attributes["aidolon.session_id"] == SESSION_ID
+    assert request_span.attributes["http.response.status_code"] == 200
+    assert request_span.attributes["http.request.body.size"] == len(requests[1].content)
+    assert request_span.attributes["http.response.body.size"] > 0
+    trace_id, span_id = requests[1].headers["traceparent"].split("-")[1:3]
+    assert int(trace_id, 16) == session_span.context.trace_id
+    assert int(span_id, 16) == request_span.context.span_id
+
+    click = by_name["aidolon.click"]
+    assert click.status.status_code == trace.StatusCode.ERROR
+    assert click.attributes["aidolon.error_code"] == "NOT_FOUND"
+    assert by_name["POST click_element"].attributes["error.type"] == "404"
+
+
+def test_every_request_of_a_session_has_an_action_parent(spans):
+    """Test that details, pipelines and downloads are traced below the session and downloads get no traceparent"""
+    requests = []
+    with BrowserSession(client=_client(requests)) as session:
+        session.get_details()
+        session.pipeline().navigate("https://example.com").run()
+        session.save_screenshot(io.BytesIO())
+
+    finished = spans.get_finished_spans()
+    by_name = {span.name: span for span in finished}
+    by_id = {span.context.span_id: span for span in finished}
+    session_span = by_name["aidolon.session"]
+    assert by_name["aidolon.navigate_browser"].parent.span_id == by_name["aidolon.pipeline"].context.span_id
+    for span in finished:
+        if span.kind == trace.SpanKind.CLIENT:
+            assert by_id[span.parent.span_id].kind == trace.SpanKind.INTERNAL
+            assert span.context.trace_id == session_span.context.trace_id
+    download = requests[-2]
+    assert download.url.host == "artifacts.example.com"
+    assert "traceparent" not in download.headers
+
+
+def test_session_span_ends_when_create_fails(spans):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = AuthenticatedClient(base_url="http://testserver", token="test-token", tracing=True,
+                                 httpx_args={"transport": httpx.MockTransport(handler)})
+    with pytest.raises(httpx.ConnectError):
+        BrowserSession(client=client)
+    by_name = {span.name: span for span in spans.get_finished_spans()}
+    assert by_name["aidolon.create"].parent.span_id == by_name["aidolon.session"].context.span_id
+    assert by_name["aidolon.create"].status.status_code == trace.StatusCode.ERROR
+
+
+def test_disabled_by_default(spans):
+    requests = []
+    with BrowserSession(client=_client(requests, tracing=False)) as session:
+        session.navigate("https://example.com")
+    assert spans.get_finished_spans() == ()
+    assert all("traceparent" not in request.headers for request in requests)